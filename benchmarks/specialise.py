@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""Benchmark of OpenMP pointwise kernel specialisation.
+
+Times the Euler flux kernel on random hexahedral element data with and
+without the sizes and leading dimensions of its arguments baked into the
+generated source, and checks that both variants produce the same flux.
+"""
+
+from argparse import ArgumentParser
+from time import perf_counter
+
+import numpy as np
+
+from pyfr.backends import get_backend
+from pyfr.inifile import Inifile
+
+
+def run_tflux(specialise, prec, nupts, neles, nruns):
+    cfg = Inifile()
+    cfg.set('backend', 'precision', prec)
+    cfg.set('backend-openmp', 'specialise-kernels', str(specialise))
+
+    backend = get_backend('openmp', cfg)
+    backend.pointwise.register('pyfr.solvers.euler.kernels.tflux')
+
+    # Random, but physically sensible, element data
+    rng = np.random.default_rng(42)
+    u = rng.uniform(1, 2, size=(nupts, 5, neles))
+    u[:, 4] += 5
+    smats = rng.uniform(-1, 1, size=(3, nupts, 3, neles))
+
+    u = backend.matrix(u.shape, u, tags={'align'})
+    smats = backend.const_matrix(smats, tags={'align'})
+    f = backend.matrix((3, nupts, 5, neles), tags={'align'})
+    backend.commit()
+
+    tplargs = dict(ndims=3, nvars=5, c={'gamma': 1.4})
+    kern = backend.kernel('tflux', tplargs=tplargs, dims=[nupts, neles],
+                          u=u, smats=smats, f=f)
+    queue = backend.queue()
+
+    # Warm up, which also waits for the kernel to finish compiling
+    queue.enqueue_and_run([kern])
+
+    tstart = perf_counter()
+    for i in range(nruns):
+        queue.enqueue_and_run([kern])
+
+    return (perf_counter() - tstart) / nruns, f.get()
+
+
+def main():
+    ap = ArgumentParser(description='Benchmark kernel specialisation')
+    ap.add_argument('--order', type=int, default=4, help='polynomial order')
+    ap.add_argument('--neles', type=int, default=20000,
+                    help='number of elements')
+    ap.add_argument('--nruns', type=int, default=50, help='number of runs')
+    ap.add_argument('--prec', choices=['single', 'double'], default='double',
+                    help='precision')
+    args = ap.parse_args()
+
+    nupts = (args.order + 1)**3
+    nbytes = (5 + 9 + 15)*nupts*args.neles*(8 if args.prec == 'double' else 4)
+
+    res = {}
+    for spec in [False, True]:
+        dt, res[spec] = run_tflux(spec, args.prec, nupts, args.neles,
+                                  args.nruns)
+
+        print(f'specialise = {spec!s:5}: {1e3*dt:.3f} ms '
+              f'({nbytes / dt / 1e9:.1f} GB/s)')
+
+    print(f'max abs diff = {np.max(np.abs(res[False] - res[True])):.3g}')
+
+
+if __name__ == '__main__':
+    main()
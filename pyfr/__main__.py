@@ -59,6 +59,10 @@ def main():
     ap_partition.add_argument('-t', dest='order', type=int, default=3,
                               help='target polynomial order; aids in '
                               'load-balancing mixed meshes')
+    ap_partition.add_argument('-e', dest='elewts', action='append',
+                              default=[], metavar='etype:weight',
+                              help='element weighting; overrides that '
+                              'implied by the target polynomial order')
     ap_partition.set_defaults(process=process_partition)
 
     # Export command
@@ -95,6 +99,17 @@ def main():
                             help='new config file')
     ap_restart.set_defaults(process=process_restart)
 
+    # Warmup command
+    ap_warmup = sp.add_parser('warmup', help='warmup --help')
+    ap_warmup.add_argument('mesh', help='mesh file')
+    ap_warmup.add_argument('cfg', type=FileType('r'), help='config file')
+    ap_warmup.add_argument('--backend', '-b', choices=['openmp'],
+                           required=True, help='backend to use')
+    ap_warmup.add_argument('-j', '--jobs', type=int,
+                           help='number of kernels to compile concurrently; '
+                           'defaults to the number of CPUs')
+    ap_warmup.set_defaults(process=process_warmup)
+
     # Options common to run and restart
     backends = sorted(cls.name for cls in subclasses(BaseBackend))
     for p in [ap_run, ap_restart]:
@@ -102,6 +117,9 @@ def main():
                        help='backend to use')
         p.add_argument('--progress', '-p', action='store_true',
                        help='show a progress bar')
+        p.add_argument('--dry-run-memory', action='store_true',
+                       help='print the projected memory usage of each rank '
+                       'and exit')
 
     # Parse the arguments
     args = ap.parse_args()
@@ -142,14 +160,24 @@ def process_partition(args):
     # Partitioner-specific options
     opts = dict(s.split(':', 1) for s in args.popts)
 
+    # Element weights; any not specified are implied by the order
+    if args.elewts:
+        elewtsmap = BasePartitioner.elewtsmap
+        elewts = dict(elewtsmap[min(args.order, max(elewtsmap))])
+        elewts.update((t, int(w)) for t, w in
+                      (s.split(':') for s in args.elewts))
+    else:
+        elewts = None
+
     # Create the partitioner
     if args.partitioner:
-        part = get_partitioner(args.partitioner, pwts, order=args.order,
-                               opts=opts)
+        part = get_partitioner(args.partitioner, pwts, elewts=elewts,
+                               order=args.order, opts=opts)
     else:
         for name in sorted(cls.name for cls in subclasses(BasePartitioner)):
             try:
-                part = get_partitioner(name, pwts, order=args.order)
+                part = get_partitioner(name, pwts, elewts=elewts,
+                                       order=args.order)
                 break
             except OSError:
                 pass
@@ -195,6 +223,66 @@ def process_export(args):
     writer.write_out()
 
 
+def _print_memory_usage(backend):
+    from mpi4py import MPI
+
+    comm = MPI.COMM_WORLD
+    cats = backend.memcategories
+
+    # Gather the usage of each rank
+    usage = comm.gather([backend.memusage[c] for c in cats], root=0)
+    aliased = comm.gather(sum(backend.memaliased.values()), root=0)
+
+    if comm.rank == 0:
+        mib = lambda n: f'{n / 2**20:.1f}'
+
+        print('rank', *cats, 'total', 'aliased', sep=',')
+        for i, (u, a) in enumerate(zip(usage, aliased)):
+            print(i, *map(mib, u), mib(sum(u)), mib(a), sep=',')
+
+
+def _print_hugepage_usage(backend):
+    from mpi4py import MPI
+
+    comm = MPI.COMM_WORLD
+
+    # Gather the number of bytes eligible for and backed by huge pages
+    usage = comm.gather(backend.hugepage_usage(), root=0)
+
+    if comm.rank == 0:
+        mib = lambda n: f'{n / 2**20:.1f}'
+
+        for i, (req, huge) in enumerate(usage):
+            print(f'Rank {i}: {mib(huge)} MiB of {mib(req)} MiB backed by '
+                  'huge pages')
+
+
+def _print_mpi_progress(backend):
+    from mpi4py import MPI
+
+    comm = MPI.COMM_WORLD
+
+    # Gather the exchange statistics of the progress threads
+    stats = comm.gather(backend.mpi_progress.stats(), root=0)
+
+    if comm.rank == 0:
+        for i, (n, nbg, txchg, twait) in enumerate(stats):
+            olap = 100*(1 - twait / txchg) if txchg else 0
+
+            print(f'Rank {i}: {nbg} of {n} MPI exchanges completed in the '
+                  f'background; {olap:.1f}% of {txchg:.3f} s overlapped')
+
+
+def _strip_plugins(cfg):
+    cfg = Inifile(cfg.tostr())
+
+    for s in cfg.sections():
+        if s.startswith('soln-plugin-'):
+            cfg.remove_section(s)
+
+    return cfg
+
+
 def _process_common(args, mesh, soln, cfg):
     # Prefork to allow us to exec processes after MPI is initialised
     if hasattr(os, 'fork'):
@@ -205,14 +293,22 @@ def _process_common(args, mesh, soln, cfg):
     # Import but do not initialise MPI
     from mpi4py import MPI
 
-    # Manually initialise MPI
-    MPI.Init()
+    # Manually initialise MPI; progress threads require full thread support
+    if cfg.getbool(f'backend-{args.backend}', 'mpi-progress-thread', False):
+        MPI.Init_thread(MPI.THREAD_MULTIPLE)
+    else:
+        MPI.Init()
 
     # Ensure MPI is suitably cleaned up
     register_finalize_handler()
 
+    # If we are only estimating memory usage then disable all plugins
+    if args.dry_run_memory:
+        cfg = _strip_plugins(cfg)
+
     # Create a backend
     backend = get_backend(args.backend, cfg)
+    backend.dryrun = args.dry_run_memory
 
     # Get the mapping from physical ranks to MPI ranks
     rallocs = get_rank_allocation(mesh, cfg)
@@ -220,6 +316,16 @@ def _process_common(args, mesh, soln, cfg):
     # Construct the solver
     solver = get_solver(backend, rallocs, mesh, soln, cfg)
 
+    # Report the memory usage of each rank and exit
+    if args.dry_run_memory:
+        _print_memory_usage(backend)
+        MPI.Finalize()
+        return
+
+    # Report how much memory has ended up backed by huge pages
+    if getattr(backend, 'hugepages', 'none') != 'none':
+        _print_hugepage_usage(backend)
+
     # If we are running interactively then create a progress bar
     if args.progress and MPI.COMM_WORLD.rank == 0:
         pb = ProgressBar(solver.tstart, solver.tcurr, solver.tend)
@@ -231,6 +337,10 @@ def _process_common(args, mesh, soln, cfg):
     # Execute!
     solver.run()
 
+    # Report how much of the MPI exchange time was overlapped
+    if getattr(backend, 'mpi_progress', None):
+        _print_mpi_progress(backend)
+
     # Finalise MPI
     MPI.Finalize()
 
@@ -258,5 +368,66 @@ def process_restart(args):
     _process_common(args, mesh, soln, cfg)
 
 
+def process_warmup(args):
+    # Prefork to allow us to exec the compiler after MPI is initialised
+    if hasattr(os, 'fork'):
+        from pytools.prefork import enable_prefork
+
+        enable_prefork()
+
+    from mpi4py import MPI
+
+    # Manually initialise MPI
+    MPI.Init()
+
+    # Ensure MPI is suitably cleaned up, aborting all ranks on an error
+    register_finalize_handler()
+
+    mesh, cfg = NativeReader(args.mesh), Inifile.load(args.cfg)
+
+    # Plugins do not contribute any kernels
+    cfg = _strip_plugins(cfg)
+
+    # As no data is exchanged there is no need for a progress thread
+    cfg.set(f'backend-{args.backend}', 'mpi-progress-thread', 'false')
+
+    # Create a backend which records, rather than compiles, kernels
+    backend = get_backend(args.backend, cfg)
+    backend.dryrun = True
+    backend.ksrcs = []
+
+    # Get the mapping from physical ranks to MPI ranks
+    rallocs = get_rank_allocation(mesh, cfg)
+
+    # Construct the solver along with any kernels it generates on demand
+    solver = get_solver(backend, rallocs, mesh, None, cfg)
+    solver.pregen_kernels()
+
+    # Along with the kernels used to first touch allocations and to size
+    # the OpenMP team when running with a progress thread
+    backend.par_set
+    backend.omp_threads
+
+    # Gather the unique sources from each rank
+    comm = MPI.COMM_WORLD
+    srcs = comm.gather(set(backend.ksrcs), root=0)
+
+    if comm.rank == 0:
+        from pyfr.backends.openmp.compiler import SourceModule
+
+        srcs = set().union(*srcs)
+
+        # Compile the kernels into the cache, njobs at a time
+        njobs = args.jobs or os.cpu_count()
+        cfg.set('backend-openmp', 'compiler-jobs', str(njobs))
+        smods = [SourceModule(src, cfg) for src in srcs]
+
+        # Wait for the outstanding compilations to finish
+        for smod in smods:
+            smod.mod
+
+        print(f'Compiled {len(srcs)} kernels')
+
+
 if __name__ == '__main__':
     main()
@@ -7,6 +7,8 @@ from pyfr.backends.base.kernels import (BaseKernelProvider,
                                         MPIKernel, MPIMetaKernel,
                                         NotSuitableError, NullComputeKernel,
                                         NullMPIKernel)
+from pyfr.backends.base.plan import ExecutionPlan
+from pyfr.backends.base.profile import KernelProfiler, WaitTimer
 from pyfr.backends.base.types import (ConstMatrix, Matrix, MatrixBank,
                                       MatrixBase, MatrixSlice, Queue, View,
                                       XchgMatrix, XchgView)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import os
+import platform
+import sqlite3
+
+
+def cpu_name():
+    # Prefer the model name as reported by the kernel
+    try:
+        with open('/proc/cpuinfo') as f:
+            for l in f:
+                if l.startswith('model name'):
+                    return l.split(':', 1)[1].strip()
+    except OSError:
+        pass
+
+    return platform.processor() or platform.machine()
+
+
+class KernelTuningDB(object):
+    def __init__(self, path):
+        # Ensure the parent directory exists
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        # As several ranks may share the database allow for some waiting
+        self._conn = sqlite3.connect(path, timeout=60)
+
+        with self._conn:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS tunings ('
+                '  kernel TEXT, opdigest TEXT, shape TEXT, dtype TEXT,'
+                '  device TEXT, provider TEXT NOT NULL,'
+                '  PRIMARY KEY (kernel, opdigest, shape, dtype, device)'
+                ')'
+            )
+
+    def _key(self, kernel, opdigest, shape, dtype, device):
+        return (kernel, opdigest, 'x'.join(str(s) for s in shape), dtype,
+                device)
+
+    def get(self, *key):
+        row = self._conn.execute(
+            'SELECT provider FROM tunings WHERE kernel = ? AND opdigest = ? '
+            'AND shape = ? AND dtype = ? AND device = ?', self._key(*key)
+        ).fetchone()
+
+        return row[0] if row else None
+
+    def set(self, *key, provider):
+        with self._conn:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO tunings VALUES (?, ?, ?, ?, ?, ?)',
+                self._key(*key) + (provider,)
+            )
@@ -1,16 +1,22 @@
 # -*- coding: utf-8 -*-
 
 from collections import defaultdict
+from contextlib import contextmanager
 from functools import wraps
-from itertools import count
+from itertools import chain, count
 import math
+import os
+from time import perf_counter
 from weakref import WeakKeyDictionary, WeakValueDictionary
 
 import numpy as np
 
-from pyfr.backends.base.kernels import NotSuitableError
+from pyfr.backends.base.kernels import NotSuitableError, NullComputeKernel
+from pyfr.backends.base.plan import ExecutionPlan, bind_plan_steps
+from pyfr.backends.base.types import (ConstMatrix, Matrix, MatrixSlice,
+                                      XchgMatrix)
 from pyfr.template import DottedTemplateLookup
-from pyfr.util import lazyprop
+from pyfr.util import digest, lazyprop
 
 
 def recordmat(fn):
@@ -27,17 +33,57 @@ def recordmat(fn):
 class BaseBackend(object):
     name = None
 
+    # Number of timed runs when autotuning a kernel
+    _tune_nruns = 5
+
+    # Categories for the purposes of memory accounting
+    memcategories = ['soln', 'scratch', 'operators', 'views', 'mpi']
+
+    # Reduced precisions which exchanged data can be sent in
+    wire_precs = set()
+
+    # If packed views are copied as runs of points contiguous in memory
+    pack_runs = False
+
+    # Shared memory for exchanging data with ranks on our node, if any
+    mpi_shm = None
+
     def __init__(self, cfg):
         self.cfg = cfg
 
         # Numeric data type
         prec = cfg.get('backend', 'precision', 'double')
-        if prec not in {'single', 'double'}:
-            raise ValueError('Backend precision must be either single or '
-                             'double')
+        if prec not in {'single', 'double', 'mixed'}:
+            raise ValueError('Backend precision must be either single, '
+                             'double, or mixed')
+
+        # Convert to NumPy data types for storage and accumulation
+        if prec == 'mixed':
+            self.fpdtype, self.accdtype = np.float32, np.float64
+        else:
+            self.fpdtype = self.accdtype = np.dtype(prec).type
+
+        # Execution plan mode
+        self.planmode = cfg.get('backend', 'exec-plan', 'none')
+        if self.planmode not in {'none', 'replay', 'compiled'}:
+            raise ValueError('Backend execution plan must be either none, '
+                             'replay, or compiled')
+
+        # Kernel profiler (if any)
+        self.profiler = None
 
-        # Convert to a NumPy data type
-        self.fpdtype = np.dtype(prec).type
+        # Timer for waits on MPI requests (if any)
+        self.wait_timer = None
+
+        # If to time the suitable providers of a GEMM and use the fastest
+        self.gemm_autotune = cfg.getbool('backend', 'gemm-autotune', False)
+
+        # If to run chains of element-local kernels tile by tile
+        self.element_tiling = False
+
+        # Names and estimated memory traffic of kernels for profiling
+        self.kernel_names = WeakKeyDictionary()
+        self.kernel_nbytes = WeakKeyDictionary()
 
         # Allocated matrices
         self.mats = WeakValueDictionary()
@@ -51,11 +97,21 @@ class BaseBackend(object):
         # Mapping from backend objects to memory extents
         self._obj_extents = WeakKeyDictionary()
 
+        # Bytes allocated and aliased in each memory category
+        self.memusage = defaultdict(int)
+        self.memaliased = defaultdict(int)
+
+        # If to count, rather than perform, allocations
+        self.dryrun = False
+
+        # Kernel arguments recorded whilst tracing
+        self._trace = None
+
     @lazyprop
     def lookup(self):
         pkg = f'pyfr.backends.{self.name}.kernels'
         dfltargs = dict(alignb=self.alignb, fpdtype=self.fpdtype,
-                        soasz=self.soasz, math=math)
+                        accdtype=self.accdtype, soasz=self.soasz, math=math)
 
         return DottedTemplateLookup(pkg, dfltargs)
 
@@ -63,7 +119,7 @@ class BaseBackend(object):
         # If no extent has been specified then autocommit
         if extent is None:
             # Perform the allocation
-            data = self._malloc_impl(obj.nbytes)
+            data = self._malloc(obj, obj.nbytes)
 
             # Fire the callback
             obj.onalloc(data, 0)
@@ -87,21 +143,36 @@ class BaseBackend(object):
         if obj.nbytes > aobj.nbytes:
             raise ValueError('Object too large to alias')
 
+        # Account for the storage which we are saving
+        self.memaliased[self._memcategory(obj, aobj)] += obj.nbytes
+
+        # In a dry run only operators are initialised
+        if self.dryrun:
+            self._dryrun_initval(obj)
+
         try:
             obj.onalloc(self._obj_extents[aobj], aobj.offset)
         except KeyError:
             self._pend_aliases[aobj].append(obj)
 
     def commit(self):
-        for reqs in self._pend_extents.values():
+        for extent, reqs in self._pend_extents.items():
             # Determine the required allocation size
             sz = sum(obj.nbytes - (obj.nbytes % -self.alignb) for obj in reqs)
 
             # Perform the allocation
-            data = self._malloc_impl(sz)
+            data = self._malloc(None, sz)
 
             offset = 0
             for obj in reqs:
+                # Account for the memory used by the object
+                objsz = obj.nbytes - (obj.nbytes % -self.alignb)
+                self.memusage[self._memcategory(obj, extent)] += objsz
+
+                # In a dry run only operators are initialised
+                if self.dryrun:
+                    self._dryrun_initval(obj)
+
                 for aobj in [obj] + self._pend_aliases[obj]:
                     # Fire the objects allocation callback
                     aobj.onalloc(data, offset)
@@ -110,16 +181,51 @@ class BaseBackend(object):
                     self._obj_extents[aobj] = data
 
                 # Increment the offset
-                offset += obj.nbytes - (obj.nbytes % -self.alignb)
+                offset += objsz
 
         # Mark the extents as committed and clear
         self._comm_extents.update(self._pend_extents)
         self._pend_aliases.clear()
         self._pend_extents.clear()
 
+    def _malloc(self, obj, nbytes):
+        # Account for the memory used by the object
+        if obj is not None:
+            self.memusage[self._memcategory(obj, None)] += nbytes
+
+        # For dry runs use a counting allocator
+        if self.dryrun:
+            if obj is not None:
+                self._dryrun_initval(obj)
+
+            return self._malloc_dry(nbytes)
+        else:
+            return self._malloc_impl(nbytes)
+
+    def _dryrun_initval(self, obj):
+        # Operators are small, and kernels may be specialised on their
+        # values, so retain these; everything else is left uninitialised
+        if not isinstance(obj, ConstMatrix) or len(obj.ioshape) != 2:
+            obj._initval = None
+
+    def _malloc_dry(self, nbytes):
+        raise RuntimeError(f'Backend {self.name} does not support dry runs')
+
     def _malloc_impl(self, nbytes):
         pass
 
+    def _memcategory(self, obj, extent):
+        # Here extent is either the name of an extent or an aliased object
+        if isinstance(obj, XchgMatrix):
+            return 'mpi'
+        elif isinstance(obj, ConstMatrix):
+            return 'operators'
+        elif isinstance(obj, Matrix):
+            return 'soln' if extent is None else 'scratch'
+        # View mappings and strides
+        else:
+            return 'views'
+
     @recordmat
     def const_matrix(self, initval, extent=None, tags=set()):
         return self.const_matrix_cls(self, initval, extent, tags)
@@ -146,28 +252,160 @@ class BaseBackend(object):
         return self.xchg_matrix((view.nvrow, view.nvcol*view.n), tags=tags)
 
     def view(self, matmap, rmap, cmap, rstridemap=None, vshape=tuple(),
-             tags=set()):
+             tags=set(), packed=False):
         return self.view_cls(self, matmap, rmap, cmap, rstridemap, vshape,
-                             tags)
+                             tags, packed)
 
     def xchg_view(self, matmap, rmap, cmap, rstridemap=None, vshape=tuple(),
                   tags=set()):
         return self.xchg_view_cls(self, matmap, rmap, cmap, rstridemap,
                                   vshape, tags)
 
+    @contextmanager
+    def trace(self):
+        self._trace = kargs = []
+
+        try:
+            yield kargs
+        finally:
+            self._trace = None
+
     def kernel(self, name, *args, **kwargs):
-        for prov in self._providers:
+        # When tracing simply record the arguments of the kernel
+        if self._trace is not None:
+            self._trace.extend(chain(args, kwargs.values()))
+            return NullComputeKernel()
+
+        # See if the provider should be selected empirically
+        if name == 'mul' and self.gemm_autotune and not self.dryrun:
+            kern = self._tuned_mul_kernel(*args, **kwargs)
+        else:
+            kern = next(self._suitable_kernels(name, args, kwargs), None)
+
+        if kern is None:
+            raise KeyError(f'Kernel "{name}" has no providers')
+
+        # Record the name and memory traffic of the kernel
+        self.kernel_names[kern] = ('backend', name, '')
+        self.kernel_nbytes[kern] = self._kernel_nbytes(args, kwargs)
+
+        return kern
+
+    def _suitable_kernels(self, name, args, kwargs, provs=None):
+        for prov in self._providers if provs is None else provs:
             kern = getattr(prov, name, None)
             if kern:
                 try:
-                    return kern(*args, **kwargs)
+                    yield kern(*args, **kwargs)
                 except NotSuitableError:
                     pass
-        else:
-            raise KeyError(f'Kernel "{name}" has no providers')
+
+    @lazyprop
+    def _tunedb(self):
+        from appdirs import user_cache_dir
+
+        from pyfr.backends.base.autotune import KernelTuningDB
+
+        dpath = os.path.join(user_cache_dir('pyfr', 'pyfr'), 'gemm-tune.db')
+        path = self.cfg.getpath('backend', 'gemm-autotune-db', dpath)
+
+        return KernelTuningDB(path)
+
+    def _tuned_mul_kernel(self, a, b, out, alpha=1.0, beta=0.0):
+        from pyfr.backends.base.autotune import cpu_name
+
+        args, kwargs = (a, b, out), dict(alpha=alpha, beta=beta)
+
+        # Timing requires the operands to have been allocated
+        if (any(hasattr(m, '_initval') for m in args) or
+            isinstance(out, MatrixSlice)):
+            return next(self._suitable_kernels('mul', args, kwargs), None)
+
+        # Key the decision on the operator, shape, type and device
+        key = ('mul', digest(a.get(), alpha, beta),
+               (a.nrow, b.ncol, a.ncol), np.dtype(a.dtype).name,
+               f'{self.name}: {cpu_name()}')
+
+        # See if a decision has previously been made
+        pname = self._tunedb.get(*key)
+        provs = [p for p in self._providers if type(p).__name__ == pname]
+
+        kern = next(self._suitable_kernels('mul', args, kwargs, provs), None)
+        if kern:
+            return kern
+
+        # As timing will clobber the output matrix save its contents
+        outval, queue = out.get(), self.queue()
+
+        # Otherwise time each of the suitable providers
+        best = (math.inf, None, None)
+        for prov in self._providers:
+            for kern in self._suitable_kernels('mul', args, kwargs, [prov]):
+                # Discard the first run to exclude any warm-up costs
+                queue.enqueue_and_run([kern])
+
+                dt = math.inf
+                for i in range(self._tune_nruns):
+                    tstart = perf_counter()
+                    queue.enqueue_and_run([kern])
+                    dt = min(dt, perf_counter() - tstart)
+
+                best = min(best, (dt, prov, kern), key=lambda t: t[0])
+
+        # Restore the output matrix
+        out.set(outval)
+
+        # Record the decision
+        dt, prov, kern = best
+        if prov is not None:
+            self._tunedb.set(*key, provider=type(prov).__name__)
+
+        return kern
+
+    def _kernel_nbytes(self, args, kwargs):
+        nbytes = 0
+
+        # Sum the sizes of all matrix and view arguments
+        for arg in chain(args, kwargs.values()):
+            if isinstance(arg, (self.view_cls, self.xchg_view_cls)):
+                view = getattr(arg, 'view', arg)
+                isize = np.dtype(view.refdtype).itemsize
+
+                nbytes += view.n*view.nvrow*view.nvcol*isize
+                nbytes += view.mapping.nbytes
+            elif hasattr(arg, 'itemsize') and hasattr(arg, 'ncol'):
+                nbytes += arg.nrow*arg.ncol*arg.itemsize
+
+        return nbytes
 
     def queue(self):
         return self.queue_cls(self)
 
     def runall(self, sequence):
-        self.queue_cls.runall(sequence)
+        if self._trace is None:
+            self.queue_cls.runall(sequence)
+
+    def plan(self, queues, fn, **kwargs):
+        # If plans are disabled then simply call the function
+        if self.planmode == 'none':
+            fn(**kwargs)
+            return None
+
+        # Otherwise, record the items executed by our queues
+        rsteps = []
+        for q in queues:
+            q._recorder = rsteps
+
+        try:
+            fn(**kwargs)
+        finally:
+            for q in queues:
+                q._recorder = None
+
+        if self.planmode == 'compiled':
+            return self._compiled_plan(rsteps, kwargs)
+        else:
+            return ExecutionPlan(bind_plan_steps(rsteps, kwargs))
+
+    def _compiled_plan(self, rsteps, kwargs):
+        return ExecutionPlan(bind_plan_steps(rsteps, kwargs))
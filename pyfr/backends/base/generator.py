@@ -45,15 +45,21 @@ class Arg(object):
         # Validation
         if self.isbroadcast and self.intent != 'in':
             raise ValueError('Broadcast arguments must be of intent in')
-        if self.isscalar and self.dtype != 'fpdtype_t':
-            raise ValueError('Scalar arguments must be of type fpdtype_t')
+        if self.isscalar and self.dtype not in {'fpdtype_t', 'accdtype_t'}:
+            raise ValueError('Scalar arguments must be of type fpdtype_t or '
+                             'accdtype_t')
 
 
 class BaseKernelGenerator(object):
-    def __init__(self, name, ndim, args, body, fpdtype):
+    def __init__(self, name, ndim, args, body, fpdtype, accdtype,
+                 consts={}):
         self.name = name
         self.ndim = ndim
         self.fpdtype = fpdtype
+        self.accdtype = accdtype
+
+        # Values of integer arguments which may be baked into the kernel
+        self.consts = consts
 
         # Parse and sort our argument list
         sargs = sorted((k, Arg(k, v, body)) for k, v in args.items())
@@ -88,9 +94,11 @@ class BaseKernelGenerator(object):
         argn += self._dims
         argt += [[np.int32]]*self.ndim
 
-        # Scalar args (always of type fpdtype)
-        argn += [sa.name for sa in self.scalargs]
-        argt += [[self.fpdtype]]*len(self.scalargs)
+        # Scalar args (of either the storage or accumulation type)
+        for sa in self.scalargs:
+            argn.append(sa.name)
+            argt.append([self.accdtype if sa.dtype == 'accdtype_t'
+                         else self.fpdtype])
 
         # Vector args
         for va in self.vectargs:
@@ -4,6 +4,8 @@ import itertools as it
 import re
 import types
 
+import numpy as np
+
 from pyfr.util import memoize, proxylist
 
 
@@ -56,8 +58,11 @@ class BaseKernelProvider(object):
 class BasePointwiseKernelProvider(BaseKernelProvider):
     kernel_generator_cls = None
 
+    # If to specialise kernels on their sizes and leading dimensions
+    specialise = False
+
     @memoize
-    def _render_kernel(self, name, mod, extrns, tplargs):
+    def _render_kernel(self, name, mod, extrns, tplargs, consts={}):
         # Copy the provided argument list
         tplargs = dict(tplargs)
 
@@ -70,9 +75,15 @@ class BasePointwiseKernelProvider(BaseKernelProvider):
         # External kernel arguments dictionary
         tplargs['_extrns'] = extrns
 
+        # Integer arguments to specialise the kernel on
+        tplargs['_kernel_consts'] = {name: consts}
+
         # Backchannel for obtaining kernel argument types
         tplargs['_kernel_argspecs'] = argspecs = {}
 
+        # Backchannel for obtaining raw kernel definitions
+        tplargs['_kernel_defs'] = kdefs = {}
+
         # Render the template to yield the source code
         tpl = self.backend.lookup.get_template(mod)
         src = tpl.render(**tplargs)
@@ -85,11 +96,26 @@ class BasePointwiseKernelProvider(BaseKernelProvider):
         # Extract the metadata for the kernel
         ndim, argn, argt = argspecs[name]
 
-        return src, ndim, argn, argt
+        return src, ndim, argn, argt, kdefs[name]
 
     def _build_kernel(self, name, src, args):
         pass
 
+    def _kernel_consts(self, argn, argt, arglst):
+        consts, i = {}, 0
+
+        for aname, atypes in zip(argn, argt):
+            # Iteration dimensions
+            if aname in {'_nx', '_ny'}:
+                consts[aname] = arglst[i]
+            # Leading dimensions of matrices
+            elif atypes == [np.intp, np.int32]:
+                consts[f'ld{aname}'] = arglst[i + 1]
+
+            i += len(atypes)
+
+        return consts
+
     def _build_arglst(self, dims, argn, argt, argdict):
         # Possible matrix types
         mattypes = (
@@ -110,7 +136,8 @@ class BasePointwiseKernelProvider(BaseKernelProvider):
                 ka = argdict[aname]
             except KeyError:
                 # Allow scalar arguments to be resolved at runtime
-                if len(atypes) == 1 and atypes[0] == self.backend.fpdtype:
+                if len(atypes) == 1 and atypes[0] in {self.backend.fpdtype,
+                                                      self.backend.accdtype}:
                     ka = aname
                 else:
                     raise
@@ -136,6 +163,106 @@ class BasePointwiseKernelProvider(BaseKernelProvider):
     def _instantiate_kernel(self, dims, fun, arglst):
         pass
 
+    def _split_argspec(self, spec):
+        m = re.match(r'(in|inout|out)\s+', spec)
+        return (m[1], spec[m.end():]) if m else ('in', spec)
+
+    def fused(self, dims, *kerns):
+        """Fuses a chain of registered kernels into a single kernel.
+
+        Each kernel is specified as a (name, tplargs, kwargs) tuple with
+        kwargs holding the arguments which would otherwise be passed to
+        the kernel method, including any extrns.  All of the kernels
+        must share the iteration space given by dims.  For every point
+        the bodies are then run in order, with arguments which are bound
+        to the same object being shared between them.  The kernels must
+        therefore only communicate through the point being iterated over.
+        """
+        fargs, fbody, fkwargs = {}, [], {}
+        objargs = {}
+
+        for i, (name, tplargs, kwargs) in enumerate(kerns):
+            kwargs = dict(kwargs)
+            extrns = kwargs.pop('extrns', {})
+
+            # Obtain the raw definition of the kernel
+            mod = getattr(self, name)._mod
+            *_, (ndim, kargs, body) = self._render_kernel(name, mod, extrns,
+                                                          tplargs)
+
+            if ndim != len(dims):
+                raise ValueError(f'Kernel "{name}" has a different iteration '
+                                 'space')
+
+            renames = {}
+            for aname, spec in kargs.items():
+                ka = kwargs.get(aname)
+
+                # Runtime arguments are shared by name
+                if ka is None:
+                    fan = aname
+                # Objects bound to several kernels are shared
+                elif id(ka) in objargs:
+                    fan = objargs[id(ka)]
+                else:
+                    fan = objargs[id(ka)] = f'{aname}_{i}'
+                    fkwargs[fan] = ka
+
+                # Reconcile the specification with any previous uses
+                if fan in fargs:
+                    pint, pbase = self._split_argspec(fargs[fan])
+                    cint, cbase = self._split_argspec(spec)
+
+                    if pbase != cbase:
+                        raise ValueError('Incompatible specifications for '
+                                         f'argument "{aname}" of "{name}"')
+
+                    # The points of a view may be visited by several
+                    # iterations and so can not be safely written to
+                    if 'view' in cbase.split() and 'out' in pint + cint:
+                        raise ValueError('Fused kernels can not share views '
+                                         'which are written to')
+
+                    if pint != cint:
+                        fargs[fan] = f'inout {cbase}'
+                else:
+                    fargs[fan] = spec
+
+                renames[aname] = fan
+
+            # Rename the arguments in the body
+            if renames:
+                aptn = r'\b({})\b'.format('|'.join(renames))
+                body = re.sub(aptn, lambda m: renames[m[1]], body)
+
+            # Scope the body to avoid clashes between local variables
+            fbody.append(f'{{\n{body}\n}}')
+
+        # Generate the fused kernel
+        fname = '_'.join(k[0] for k in kerns)
+        kern = self.kernel_generator_cls(
+            fname, len(dims), fargs, '\n'.join(fbody), self.backend.fpdtype,
+            self.backend.accdtype
+        )
+        ndim, argn, argt = kern.argspec()
+
+        # Process the argument list
+        argb = self._build_arglst(dims, argn, argt, fkwargs)
+
+        # See if the kernel should be specialised on its arguments
+        if self.specialise:
+            kern.consts = self._kernel_consts(argn, argt, argb)
+
+        # Render the complete source
+        tpl = self.backend.lookup.get_template('fused')
+        src = re.sub(r'\n\n+', r'\n\n', tpl.render(kernel=kern.render()))
+
+        # Compile the kernel
+        fun = self._build_kernel(fname, src, list(it.chain(*argt)))
+
+        # Return a ComputeKernel subclass instance
+        return self._instantiate_kernel(dims, fun, argb)
+
     def register(self, mod):
         # Derive the name of the kernel from the module
         name = mod[mod.rfind('.') + 1:]
@@ -153,15 +280,21 @@ class BasePointwiseKernelProvider(BaseKernelProvider):
         # Generate the kernel providing method
         def kernel_meth(self, tplargs, dims, extrns={}, **kwargs):
             # Render the source of kernel
-            src, ndim, argn, argt = self._render_kernel(name, mod, extrns,
-                                                        tplargs)
-
-            # Compile the kernel
-            fun = self._build_kernel(name, src, list(it.chain(*argt)))
+            src, ndim, argn, argt, kdef = self._render_kernel(name, mod,
+                                                              extrns, tplargs)
 
             # Process the argument list
             argb = self._build_arglst(dims, argn, argt, kwargs)
 
+            # If requested, re-render the kernel for these arguments
+            if self.specialise:
+                consts = self._kernel_consts(argn, argt, argb)
+                src, *_ = self._render_kernel(name, mod, extrns, tplargs,
+                                              consts)
+
+            # Compile the kernel
+            fun = self._build_kernel(name, src, list(it.chain(*argt)))
+
             # Return a ComputeKernel subclass instance
             return self._instantiate_kernel(dims, fun, argb)
 
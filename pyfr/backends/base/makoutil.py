@@ -136,15 +136,23 @@ def kernel(context, name, ndim, **kwargs):
     # Capture the kernel body
     body = capture(context, context['caller'].body)
 
-    # Get the generator class and floating point data type
-    kerngen, fpdtype = context['_kernel_generator'], context['fpdtype']
+    # Get the generator class and floating point data types
+    kerngen = context['_kernel_generator']
+    fpdtype, accdtype = context['fpdtype'], context['accdtype']
+
+    # Values of any arguments the kernel is to be specialised on
+    consts = context['_kernel_consts'].get(name, {})
 
     # Instantiate
-    kern = kerngen(name, int(ndim), kwargs, body, fpdtype)
+    kern = kerngen(name, int(ndim), kwargs, body, fpdtype, accdtype,
+                   consts)
 
     # Save the argument/type list for later use
     context['_kernel_argspecs'][name] = kern.argspec()
 
+    # Along with the raw definition of the kernel for use in fusion
+    context['_kernel_defs'][name] = (int(ndim), kwargs, body)
+
     # Render and return the complete kernel
     return kern.render()
 
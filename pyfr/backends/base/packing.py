@@ -3,37 +3,123 @@
 from pyfr.backends.base.kernels import BaseKernelProvider, MPIKernel
 
 
+def _free_types(types):
+    from mpi4py import MPI
+
+    # Types can no longer be freed once MPI has been finalised
+    if not MPI.Is_finalized():
+        for t in types:
+            t.Free()
+
+
 class BasePackingKernels(BaseKernelProvider):
-    def _sendrecv(self, mv, mpipreqfn, pid, tag):
+    def _xchgmat(self, mv):
         # If we are an exchange view then extract the exchange matrix
         if isinstance(mv, self.backend.xchg_view_cls):
-            xchgmat = mv.xchgmat
+            return mv.xchgmat
+        else:
+            return mv
+
+    def _xchgtype(self, mvs):
+        from mpi4py import MPI
+
+        bufs = [self._xchgmat(mv).hdata for mv in mvs]
+        lens = [memoryview(b).nbytes for b in bufs]
+        displs = [MPI.Get_address(b) for b in bufs]
+
+        # Describe the buffers, relative to MPI_BOTTOM, with a single type
+        return MPI.BYTE.Create_hindexed(lens, displs).Commit(), bufs
+
+    def _sendrecv(self, mvs, mpipreqfn, pid, tag):
+        from mpi4py import MPI
+
+        # A single matrix can be sent directly
+        if len(mvs) == 1:
+            bufs, types = [self._xchgmat(mvs[0]).hdata], []
+            buf = bufs[0]
+        # Whereas several are aggregated into a single message
         else:
-            xchgmat = mv
+            dtype, bufs = self._xchgtype(mvs)
+            buf, types = [MPI.BOTTOM, 1, dtype], [dtype]
 
-        # Create a persistent MPI request to send/recv the matrix
-        preq = mpipreqfn(xchgmat.hdata, pid, tag)
+        # Create a persistent MPI request to send/recv the matrices
+        preq = mpipreqfn(buf, pid, tag)
 
         class SendRecvPackKernel(MPIKernel):
+            # Keep the underlying buffers alive
+            xbufs = bufs
+
             def run(self, queue):
                 # Start the request and append us to the list of requests
                 preq.Start()
                 queue.mpi_reqs.append(preq)
 
+            def __del__(self):
+                _free_types(types)
+
         return SendRecvPackKernel()
 
     def pack(self, mv):
         pass
 
     def send_pack(self, mv, pid, tag):
+        return self.send_packs([mv], pid, tag)
+
+    def recv_pack(self, mv, pid, tag):
+        return self.recv_packs([mv], pid, tag)
+
+    def send_packs(self, mvs, pid, tag):
         from mpi4py import MPI
 
-        return self._sendrecv(mv, MPI.COMM_WORLD.Send_init, pid, tag)
+        return self._sendrecv(mvs, MPI.COMM_WORLD.Send_init, pid, tag)
 
-    def recv_pack(self, mv, pid, tag):
+    def recv_packs(self, mvs, pid, tag):
+        from mpi4py import MPI
+
+        return self._sendrecv(mvs, MPI.COMM_WORLD.Recv_init, pid, tag)
+
+    def sendrecv_packs(self, comm, smvs, rmvs):
         from mpi4py import MPI
 
-        return self._sendrecv(mv, MPI.COMM_WORLD.Recv_init, pid, tag)
+        # Describe the matrices for each neighbour relative to MPI_BOTTOM
+        def bufspec(nmvs):
+            types, bufs = [], []
+            for mvs in nmvs:
+                dtype, dbufs = self._xchgtype(mvs)
+                types.append(dtype)
+                bufs.extend(dbufs)
+
+            n = len(types)
+
+            return [MPI.BOTTOM, [1]*n, [0]*n, types], bufs
+
+        (sbuf, sbufs), (rbuf, rbufs) = bufspec(smvs), bufspec(rmvs)
+
+        # Exchange with all of our neighbours in a single collective; this
+        # is persistent if the MPI library and mpi4py both support it
+        try:
+            preq = comm.Neighbor_alltoallw_init(sbuf, rbuf)
+
+            def start():
+                preq.Start()
+                return preq
+        except (AttributeError, NotImplementedError):
+            def start():
+                return comm.Ineighbor_alltoallw(sbuf, rbuf)
+
+        types = sbuf[3] + rbuf[3]
+
+        class NeighbourSendRecvPackKernel(MPIKernel):
+            # Keep the underlying buffers alive
+            bufs = sbufs + rbufs
+
+            def run(self, queue):
+                queue.mpi_reqs.append(start())
+
+            def __del__(self):
+                _free_types(types)
+
+        return NeighbourSendRecvPackKernel()
 
     def unpack(self, mv):
         pass
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+from functools import partial
+
+
+class ExecutionPlan(object):
+    def __init__(self, steps):
+        # Steps are pairs of prebound callables and runtime argument names
+        self._steps = tuple(steps)
+
+    def __len__(self):
+        return len(self._steps)
+
+    def __call__(self, **kwargs):
+        for fn, kwn in self._steps:
+            if kwn:
+                fn(**{k: kwargs[k] for k in kwn})
+            else:
+                fn()
+
+
+def bind_plan_steps(rsteps, kwargs):
+    steps = []
+
+    for rs in rsteps:
+        if rs[0] == 'run':
+            q, item, args, ikwargs = rs[1:]
+
+            # Keyword arguments must be supplied by the caller of the plan
+            if any(k not in kwargs or kwargs[k] is not v
+                   for k, v in ikwargs.items()):
+                raise ValueError('Plan kernel arguments must be passed to '
+                                 'the plan itself')
+
+            steps.append((partial(item.run, q, *args), tuple(ikwargs)))
+        else:
+            q, ktype = rs[1:]
+
+            steps.append((partial(q._replay_wait, ktype), ()))
+
+    return steps
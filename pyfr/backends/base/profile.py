@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+
+from collections import defaultdict
+from time import perf_counter
+
+import numpy as np
+
+from pyfr.backends.base.kernels import ComputeMetaKernel
+
+
+class KernelProfiler(object):
+    # Percentiles of the kernel run times to report
+    percentiles = [50, 90, 99]
+
+    def __init__(self, backend, sync=False):
+        self.backend = backend
+
+        # If to wait for each compute kernel to finish before timing it
+        self.sync = sync
+
+        self.reset()
+
+    def reset(self):
+        # Run times for each kernel object
+        self._ktimes = defaultdict(list)
+
+        # Wait times for each kernel type
+        self._wtimes = defaultdict(list)
+
+    def run(self, queue, item, args, kwargs):
+        tstart = perf_counter()
+
+        item.run(queue, *args, **kwargs)
+        queue._last_ktype = item.ktype
+
+        # For asynchronous backends wait for compute kernels to finish
+        if self.sync and item.ktype == 'compute':
+            queue._wait()
+
+        self._ktimes[item].append(perf_counter() - tstart)
+
+    def wait(self, queue):
+        ktype = queue._last_ktype
+
+        tstart = perf_counter()
+        queue._timed_wait()
+
+        if ktype is not None:
+            self._wtimes[ktype].append(perf_counter() - tstart)
+
+    def _kernel_nbytes(self, kern):
+        # Meta kernels move the data of each of their constituent kernels
+        if isinstance(kern, ComputeMetaKernel):
+            return sum(self._kernel_nbytes(k) for k in kern._kernels)
+        else:
+            return self.backend.kernel_nbytes.get(kern, 0)
+
+    def stats(self):
+        names = self.backend.kernel_names
+
+        # Aggregate the samples of all kernels which share the same name
+        samples, kbytes = defaultdict(list), defaultdict(int)
+        for kern, dts in self._ktimes.items():
+            key = names.get(kern, ('backend', type(kern).__name__, ''))
+
+            samples[key].extend(dts)
+            kbytes[key] += len(dts)*self._kernel_nbytes(kern)
+
+        # Waits are reported under the pseudo-provider of queue
+        for ktype, dts in self._wtimes.items():
+            samples['queue', f'wait-{ktype}', ''].extend(dts)
+
+        # Summarise
+        stats = []
+        for key, dts in sorted(samples.items()):
+            pcts = np.percentile(dts, self.percentiles).tolist()
+
+            stats.append((*key, len(dts), sum(dts), *pcts, max(dts),
+                          kbytes[key]))
+
+        return stats
+
+
+class WaitTimer(object):
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        # Number of waits on MPI requests and the total time spent waiting
+        self.nwaits = 0
+        self.twait = 0.0
+
+    def wait(self, queue):
+        tstart = perf_counter()
+        queue._wait()
+
+        self.nwaits += 1
+        self.twait += perf_counter() - tstart
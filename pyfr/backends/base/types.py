@@ -55,6 +55,7 @@ class MatrixBase(object):
             self._initval = None
 
         # Alias or allocate ourself
+        self.aliases = aliases
         if aliases:
             if extent is not None:
                 raise ValueError('Aliased matrices can not have an extent')
@@ -192,7 +193,17 @@ class ConstMatrix(MatrixBase):
 
 
 class XchgMatrix(Matrix):
-    pass
+    @property
+    def wprec(self):
+        # Reduced precision, if any, in which we are sent over the wire
+        wprec = next((t[5:] for t in self.tags if t.startswith('wire-')),
+                     None)
+
+        # Single precision data need not be converted to single precision
+        if wprec == 'single' and self.dtype == np.float32:
+            return None
+        else:
+            return wprec
 
 
 class MatrixBank(Sequence):
@@ -236,11 +247,16 @@ class MatrixBank(Sequence):
 
 
 class View(object):
-    def __init__(self, backend, matmap, rmap, cmap, rstridemap, vshape, tags):
+    # Minimum mean length of the contiguous runs for them to be retained
+    _min_runlen = 2
+
+    def __init__(self, backend, matmap, rmap, cmap, rstridemap, vshape, tags,
+                 packed=False):
         self.n = len(matmap)
         self.nvrow = vshape[-2] if len(vshape) == 2 else 1
         self.nvcol = vshape[-1] if len(vshape) >= 1 else 1
         self.rstrides = None
+        self.runs = None
 
         # Get the different matrices which we map onto
         self._mats = [backend.mats[i] for i in np.unique(matmap)]
@@ -285,17 +301,39 @@ class View(object):
         )
 
         # Row strides
+        rstrides = None
         if self.nvrow > 1:
             rstrides = (rstridemap*leaddim)[None,:]
             self.rstrides = backend.base_matrix_cls(
                 backend, np.int32, (1, self.n), rstrides, None, None, tags
             )
 
+        # See if the view is to be packed as runs of contiguous points
+        if packed and backend.pack_runs:
+            self._find_runs(backend, mapping, rstrides, tags)
+
+    def _find_runs(self, backend, mapping, rstrides, tags):
+        # Break the points into runs which are contiguous in memory
+        brk = np.diff(mapping[0]) != 1
+        if self.nvrow > 1:
+            brk |= np.diff(rstrides[0]) != 0
+
+        runs = np.flatnonzero(np.concatenate([[True], brk, [True]]))
+        self.nruns = len(runs) - 1
+
+        # If the runs are sufficiently long then retain their extents
+        if self.n >= self._min_runlen*self.nruns:
+            self.runs = backend.base_matrix_cls(
+                backend, np.int32, (1, self.nruns + 1), runs[None,:], None,
+                None, tags
+            )
+
 
 class XchgView(object):
     def __init__(self, backend, matmap, rmap, cmap, rstridemap, vshape, tags):
-        # Create a normal view
-        self.view = backend.view(matmap, rmap, cmap, rstridemap, vshape, tags)
+        # Create a normal view which will be packed
+        self.view = backend.view(matmap, rmap, cmap, rstridemap, vshape, tags,
+                                 packed=True)
 
         # Dimensions
         self.n = n = self.view.n
@@ -319,6 +357,9 @@ class Queue(object):
         # Active MPI requests
         self.mpi_reqs = []
 
+        # Execution plan recorder (if any)
+        self._recorder = None
+
     def enqueue(self, items, *args, **kwargs):
         self._items.extend((item, args, kwargs) for item in items)
 
@@ -333,18 +374,25 @@ class Queue(object):
     def run(self):
         while self._items:
             self._exec_next()
-        self._wait()
+        self._sync()
 
     def _exec_item(self, item, args, kwargs):
-        item.run(self, *args, **kwargs)
-        self._last_ktype = item.ktype
+        if self.backend.profiler is None:
+            item.run(self, *args, **kwargs)
+            self._last_ktype = item.ktype
+        else:
+            self.backend.profiler.run(self, item, args, kwargs)
+
+        # If we are recording an execution plan then log the item
+        if self._recorder is not None:
+            self._recorder.append(('run', self, item, args, kwargs))
 
     def _exec_next(self):
         item, args, kwargs = self._items.popleft()
 
         # If we are at a sequence point then wait for current items
         if self._at_sequence_point(item):
-            self._wait()
+            self._sync()
 
         # Execute the item
         self._exec_item(item, args, kwargs)
@@ -356,5 +404,26 @@ class Queue(object):
     def _at_sequence_point(self, item):
         pass
 
+    def _sync(self):
+        # If we are recording an execution plan then log the wait
+        if self._recorder is not None and self._last_ktype is not None:
+            self._recorder.append(('wait', self, self._last_ktype))
+
+        if self.backend.profiler is None:
+            self._timed_wait()
+        else:
+            self.backend.profiler.wait(self)
+
+    def _replay_wait(self, ktype):
+        self._last_ktype = ktype
+        self._timed_wait()
+
+    def _timed_wait(self):
+        # Time any waits on MPI requests
+        if self._last_ktype == 'mpi' and self.backend.wait_timer is not None:
+            self.backend.wait_timer.wait(self)
+        else:
+            self._wait()
+
     def _wait(self):
         pass
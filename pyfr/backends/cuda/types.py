@@ -123,4 +123,4 @@ class CUDAQueue(base.Queue):
 
         # Wait for all tasks to complete
         for q in queues:
-            q._wait()
+            q._sync()
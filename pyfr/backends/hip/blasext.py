@@ -61,11 +61,12 @@ class HIPBlasExtKernels(HIPKernelProvider):
         # Determine the grid size
         grid = get_grid_for_block(block, ncolb, ncola)
 
-        # Empty result buffer on the device
-        err_dev = hip.mem_alloc(ncola*grid[0]*x.itemsize)
-
         # Empty result buffer on the host
-        err_host = hip.pagelocked_empty((ncola, grid[0]), dtype)
+        err_host = hip.pagelocked_empty((ncola, grid[0]),
+                                        self.backend.accdtype)
+
+        # Empty result buffer on the device
+        err_dev = hip.mem_alloc(err_host.nbytes)
 
         # Get the kernel template
         src = self.backend.lookup.get_template('errest').render(
@@ -5,7 +5,7 @@
 #define SQ(x) (x)*(x)
 
 __global__ void
-errest(int nrow, int ncolb, int ldim, fpdtype_t *__restrict__ err,
+errest(int nrow, int ncolb, int ldim, accdtype_t *__restrict__ err,
        fpdtype_t *__restrict__ x, fpdtype_t *__restrict__ y,
        fpdtype_t *__restrict__ z, fpdtype_t atol, fpdtype_t rtol)
 
@@ -14,8 +14,8 @@ errest(int nrow, int ncolb, int ldim, fpdtype_t *__restrict__ err,
     int i = hipBlockIdx_x*hipBlockDim_x + tid;
     int lastblksize = ncolb % ${sharesz};
 
-    __shared__ fpdtype_t sdata[${sharesz}];
-    fpdtype_t r, acc = 0;
+    __shared__ accdtype_t sdata[${sharesz}];
+    accdtype_t r, acc = 0;
 
     if (i < ncolb)
     {
@@ -123,4 +123,4 @@ class HIPQueue(base.Queue):
 
         # Wait for all tasks to complete
         for q in queues:
-            q._wait()
+            q._sync()
@@ -41,7 +41,7 @@ class OpenCLBackend(BaseBackend):
             raise ValueError('No suitable OpenCL device found')
 
         # Determine if the device supports double precision arithmetic
-        if self.fpdtype == np.float64 and not device.double_fp_config:
+        if self.accdtype == np.float64 and not device.double_fp_config:
             raise ValueError('Device does not support double precision')
 
         # Create a OpenCL context on this device
@@ -55,7 +55,7 @@ class OpenCLBlasExtKernels(OpenCLKernelProvider):
         gs = (ncolb - ncolb % -ls[0], ncola)
 
         # Empty result buffer on host with (nvars, ngroups)
-        err_host = np.empty((ncola, gs[0] // ls[0]), dtype)
+        err_host = np.empty((ncola, gs[0] // ls[0]), self.backend.accdtype)
 
         # Device memory allocation
         err_dev = cl.Buffer(self.backend.ctx, cl.mem_flags.READ_WRITE,
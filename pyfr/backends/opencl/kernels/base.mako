@@ -12,5 +12,6 @@
 
 // Typedefs
 typedef ${pyfr.npdtype_to_ctype(fpdtype)} fpdtype_t;
+typedef ${pyfr.npdtype_to_ctype(accdtype)} accdtype_t;
 
 ${next.body()}
@@ -5,7 +5,7 @@
 #define SQ(x) (x)*(x)
 
 __kernel void
-errest(int nrow, int ncolb, int ldim, __global fpdtype_t* restrict err,
+errest(int nrow, int ncolb, int ldim, __global accdtype_t* restrict err,
        ${', '.join(f'__global const fpdtype_t* restrict {i}' for i in 'xyz')},
        fpdtype_t atol, fpdtype_t rtol)
 
@@ -15,8 +15,8 @@ errest(int nrow, int ncolb, int ldim, __global fpdtype_t* restrict err,
     int ncola = get_num_groups(1), k = get_group_id(1);
     int lastblksize = ncolb % ${sharesz};
 
-    __local fpdtype_t sdata[${sharesz}];
-    fpdtype_t r, acc = 0;
+    __local accdtype_t sdata[${sharesz}];
+    accdtype_t r, acc = 0;
 
     if (i < ncolb)
     {
@@ -122,4 +122,4 @@ class OpenCLQueue(base.Queue):
 
         # Wait for all tasks to complete
         for q in queues:
-            q._wait()
+            q._sync()
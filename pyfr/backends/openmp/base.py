@@ -1,12 +1,20 @@
 # -*- coding: utf-8 -*-
 
+import mmap
+
 import numpy as np
 
-from pyfr.backends.base import BaseBackend
+from pyfr.backends.base import BaseBackend, ExecutionPlan
+from pyfr.util import lazyprop
 
 
 class OpenMPBackend(BaseBackend):
     name = 'openmp'
+    wire_precs = {'single', 'bfloat16'}
+    pack_runs = True
+
+    # Size of a huge page
+    hugepagesz = 2*1024**2
 
     def __init__(self, cfg):
         super().__init__(cfg)
@@ -17,11 +25,24 @@ class OpenMPBackend(BaseBackend):
         if self.alignb < 32 or (self.alignb & (self.alignb - 1)):
             raise ValueError('Alignment must be a power of 2 and >= 32')
 
+        # Huge page backing for large allocations
+        self.hugepages = cfg.get('backend-openmp', 'huge-pages', 'none')
+        if self.hugepages not in {'none', 'madvise', 'hugetlbfs'}:
+            raise ValueError('Invalid huge page type')
+
+        # Address ranges of our huge page mappings
+        self._hpmaps = []
+
+        # Element-local kernel chains can be run tile by tile
+        self.element_tiling = cfg.getbool('backend-openmp', 'element-tiling',
+                                          False)
+
         # Compute the SoA size
         self.soasz = self.alignb // np.dtype(self.fpdtype).itemsize
 
         from pyfr.backends.openmp import (blasext, cblas, gimmik, packing,
-                                          provider, types, xsmm)
+                                          provider, sumfact, tiling, types,
+                                          xsmm)
 
         # Register our data types
         self.base_matrix_cls = types.OpenMPMatrixBase
@@ -37,12 +58,13 @@ class OpenMPBackend(BaseBackend):
         # Instantiate mandatory kernel provider classes
         kprovcls = [provider.OpenMPPointwiseKernelProvider,
                     blasext.OpenMPBlasExtKernels,
-                    packing.OpenMPPackingKernels]
+                    packing.OpenMPPackingKernels,
+                    tiling.OpenMPTilingKernels]
         self._providers = [k(self) for k in kprovcls]
 
         # Instantiate optional kernel provider classes
-        for k in [xsmm.OpenMPXSMMKernels, gimmik.OpenMPGiMMiKKernels,
-                  cblas.OpenMPCBLASKernels]:
+        for k in [sumfact.OpenMPSumFactKernels, xsmm.OpenMPXSMMKernels,
+                  gimmik.OpenMPGiMMiKKernels, cblas.OpenMPCBLASKernels]:
             try:
                 self._providers.append(k(self))
             except (KeyboardInterrupt, SystemExit):
@@ -53,8 +75,113 @@ class OpenMPBackend(BaseBackend):
         # Pointwise kernels
         self.pointwise = self._providers[0]
 
+        # Kernel sources to be recorded, rather than compiled
+        self.ksrcs = None
+
+        # Dedicated thread to progress MPI requests during compute kernels
+        if cfg.getbool('backend-openmp', 'mpi-progress-thread', False):
+            from pyfr.backends.openmp.progress import MPIProgressThread
+
+            self.mpi_progress = MPIProgressThread()
+            self.mpi_progress.start()
+
+            # Size the OpenMP team so as to leave a thread free for it
+            self.omp_threads(max(self.omp_threads(0) - 1, 1))
+        else:
+            self.mpi_progress = None
+
+        # Shared memory window for exchanging data with ranks on our node
+        if cfg.getbool('backend-openmp', 'mpi-shared-memory', False):
+            from pyfr.backends.openmp.shm import MPISharedMemory
+
+            self.mpi_shm = MPISharedMemory()
+
+    def _compiled_plan(self, rsteps, kwargs):
+        from pyfr.backends.openmp.plan import compile_plan_steps
+
+        return ExecutionPlan(compile_plan_steps(self, rsteps, kwargs))
+
+    @lazyprop
+    def par_set(self):
+        src = self.lookup.get_template('par-set').render()
+
+        return self.pointwise._build_kernel('par_set', src,
+                                            [np.intp, np.intp, np.intp])
+
+    @lazyprop
+    def omp_threads(self):
+        src = self.lookup.get_template('omp-threads').render()
+
+        return self.pointwise._build_kernel('omp_threads', src, [np.int32],
+                                            np.int32)
+
     def _malloc_impl(self, nbytes):
-        data = np.zeros(nbytes + self.alignb, dtype=np.uint8)
+        # See if the allocation is large enough to use huge pages
+        if self.hugepages != 'none' and nbytes >= self.hugepagesz:
+            return self._malloc_huge(nbytes)
+
+        # Map, but do not touch, some zeroed memory
+        buf = mmap.mmap(-1, nbytes + self.alignb,
+                        flags=mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS)
+
+        data = np.frombuffer(buf, dtype=np.uint8)
         offset = -data.ctypes.data % self.alignb
 
         return data[offset:nbytes + offset]
+
+    def _malloc_huge(self, nbytes):
+        hpsz = self.hugepagesz
+        flags = mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS
+
+        # Explicit huge pages from the pool reserved for hugetlbfs
+        if self.hugepages == 'hugetlbfs':
+            # Value of the flag on Linux if mmap does not export it
+            flags |= getattr(mmap, 'MAP_HUGETLB', 0x40000)
+
+            try:
+                buf = mmap.mmap(-1, nbytes - nbytes % -hpsz, flags=flags)
+            except OSError as e:
+                raise RuntimeError('Unable to allocate huge pages; ensure '
+                                   'enough have been reserved') from e
+
+            data = np.frombuffer(buf, dtype=np.uint8)[:nbytes]
+        # Transparent huge pages; over allocate so we can align to a page
+        else:
+            buf = mmap.mmap(-1, nbytes + hpsz, flags=flags)
+            buf.madvise(mmap.MADV_HUGEPAGE)
+
+            data = np.frombuffer(buf, dtype=np.uint8)
+            offset = -data.ctypes.data % hpsz
+
+            data = data[offset:nbytes + offset]
+
+        self._hpmaps.append((data.ctypes.data, data.ctypes.data + nbytes))
+
+        return data
+
+    def hugepage_usage(self):
+        hpmaps, nbytes = self._hpmaps, 0
+
+        # Sum the huge pages of each mapping which overlaps one of ours
+        with open('/proc/self/smaps') as f:
+            for l in f:
+                key, val = l.split(maxsplit=1)
+
+                # Start of a new mapping
+                if not key.endswith(':'):
+                    start, end = (int(a, 16) for a in key.split('-'))
+                    ours = any(s < end and start < e for s, e in hpmaps)
+                elif ours and key in {'AnonHugePages:', 'Private_Hugetlb:',
+                                      'Shared_Hugetlb:'}:
+                    nbytes += 1024*int(val.split()[0])
+
+        return sum(e - s for s, e in hpmaps), nbytes
+
+    def _malloc_dry(self, nbytes):
+        # Reserve, but do not commit, some page-aligned address space
+        flags = mmap.MAP_PRIVATE | mmap.MAP_ANONYMOUS
+        flags |= getattr(mmap, 'MAP_NORESERVE', 0)
+
+        buf = mmap.mmap(-1, max(nbytes, 1), flags=flags)
+
+        return np.frombuffer(buf, dtype=np.uint8)[:nbytes]
@@ -21,8 +21,10 @@ class OpenMPBlasExtKernels(OpenMPKernelProvider):
         )
 
         # Build the kernel
-        kern = self._build_kernel('axnpby', src,
-                                  [np.int32]*3 + [np.intp]*nv + [dtype]*nv)
+        kern = self._build_kernel(
+            'axnpby', src,
+            [np.int32]*3 + [np.intp]*nv + [self.backend.accdtype]*nv
+        )
 
         class AxnpbyKernel(ComputeKernel):
             def run(self, queue, *consts):
@@ -45,6 +47,8 @@ class OpenMPBlasExtKernels(OpenMPKernelProvider):
                                   [np.intp, np.intp, np.int32])
 
         class CopyKernel(ComputeKernel):
+            cfun, cargs = kern, [dst, src, dst.nbytes]
+
             def run(self, queue):
                 kern(dst, src, dst.nbytes)
 
@@ -62,7 +66,7 @@ class OpenMPBlasExtKernels(OpenMPKernelProvider):
                                                                 ncola=ncola)
 
         # Array for the error estimate
-        error = np.zeros(ncola, dtype=dtype)
+        error = np.zeros(ncola, dtype=self.backend.accdtype)
 
         # Build
         rkern = self._build_kernel(
@@ -79,3 +83,35 @@ class OpenMPBlasExtKernels(OpenMPKernelProvider):
                       x, y, z, atol, rtol)
 
         return ErrestKernel()
+
+    def adderrest(self, x, y, z, w, *, norm):
+        if any(x.traits != m.traits for m in (y, z, w)):
+            raise ValueError('Incompatible matrix types')
+
+        nrow, ncol, ldim, dtype = x.traits
+        ncola, ncolb = x.ioshape[1:]
+
+        # Render the fused update and reduction kernel template
+        src = self.backend.lookup.get_template('adderrest').render(
+            norm=norm, ncola=ncola
+        )
+
+        # Array for the error estimate
+        error = np.zeros(ncola, dtype=self.backend.accdtype)
+
+        # Build
+        rkern = self._build_kernel(
+            'adderrest', src,
+            [np.int32]*3 + [np.intp]*5 + [self.backend.accdtype]*2 + [dtype]*2
+        )
+
+        class AddErrestKernel(ComputeKernel):
+            @property
+            def retval(self):
+                return error
+
+            def run(self, queue, cx, cy, atol, rtol):
+                rkern(nrow, ncolb, ldim, error.ctypes.data,
+                      x, y, z, w, cx, cy, atol, rtol)
+
+        return AddErrestKernel()
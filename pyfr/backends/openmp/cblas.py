@@ -96,11 +96,20 @@ class OpenMPCBLASKernels(OpenMPKernelProvider):
             cblas_gemm_ptr = cast(cblas_gemm, c_void_p).value
 
             class MulKernel(ComputeKernel):
+                cfun = par_gemm
+                cargs = [cblas_gemm_ptr, m, n, k, alpha, a, a.leaddim,
+                         b, b.leaddim, beta, out, out.leaddim]
+
                 def run(self, queue):
                     par_gemm(cblas_gemm_ptr, m, n, k, alpha, a, a.leaddim,
                              b, b.leaddim, beta, out, out.leaddim)
         else:
             class MulKernel(ComputeKernel):
+                cfun = cblas_gemm
+                cargs = [CBlasOrder.ROW_MAJOR, CBlasTranspose.NO_TRANS,
+                         CBlasTranspose.NO_TRANS, m, n, k, alpha, a,
+                         a.leaddim, b, b.leaddim, beta, out, out.leaddim]
+
                 def run(self, queue):
                     cblas_gemm(CBlasOrder.ROW_MAJOR, CBlasTranspose.NO_TRANS,
                                CBlasTranspose.NO_TRANS, m, n, k,
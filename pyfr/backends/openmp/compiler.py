@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import atexit
 from ctypes import CDLL
 import itertools as it
 import os
@@ -9,16 +10,46 @@ import tempfile
 import uuid
 
 from appdirs import user_cache_dir
-from pytools.prefork import call_capture_output
+from pytools.prefork import call_async, call_capture_output, wait
 
 from pyfr.ctypesutil import platform_libname
 from pyfr.nputil import npdtype_to_ctypestype
 from pyfr.util import digest, lazyprop, mv, rm
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+
+class SourceModuleFunction(object):
+    def __init__(self, smod, name, restype, argtypes):
+        self._smod = smod
+        self._fargs = (name, restype, argtypes)
+
+    @lazyprop
+    def fn(self):
+        # Wait for the module to finish compiling
+        return self._smod._function(*self._fargs)
+
+    @property
+    def argtypes(self):
+        return self.fn.argtypes
+
+    @property
+    def _as_parameter_(self):
+        return self.fn
+
+    def __call__(self, *args):
+        return self.fn(*args)
+
 
 class SourceModule(object):
     _dir_seq = it.count()
 
+    # Modules whose compilation is in progress
+    _inflight = []
+
     def __init__(self, src, cfg):
         # Find GCC (or a compatible alternative)
         self.cc = cfg.getpath('backend-openmp', 'cc', 'cc')
@@ -26,6 +57,11 @@ class SourceModule(object):
         # User specified compiler flags
         self.cflags = shlex.split(cfg.get('backend-openmp', 'cflags', ''))
 
+        # Maximum number of concurrent compiler invocations
+        self.njobs = cfg.getint('backend-openmp', 'compiler-jobs', 4)
+        if self.njobs < 1:
+            raise ValueError('Number of compiler jobs must be at least 1')
+
         # Get the processor string
         proc = platform.processor()
 
@@ -38,35 +74,28 @@ class SourceModule(object):
         # Compute a digest of the current processor, compiler, and source
         self.digest = digest(proc, version, cmd, src)
 
-        # Attempt to load the library from the cache
-        self.mod = self._cache_loadlib()
-
-        # Otherwise, we need to compile the kernel
-        if not self.mod:
-            # Create a scratch directory
-            tmpidx = next(self._dir_seq)
-            tmpdir = tempfile.mkdtemp(prefix='pyfr-{0}-'.format(tmpidx))
+        self._aid = self._lockf = self._tmpdir = None
 
-            try:
-                # Compile and link the source into a shared library
-                cname, lname = 'tmp.c', platform_libname('tmp')
-
-                # Write the source code out
-                with open(os.path.join(tmpdir, cname), 'w') as f:
-                    f.write(src)
-
-                # Invoke the compiler
-                call_capture_output(self.cc_cmd(cname, lname), cwd=tmpdir)
+        # Attempt to load the library from the cache
+        mod = self._cache_loadlib()
+        if mod:
+            self.mod = mod
+        # Otherwise, start compiling it unless another process already is
+        else:
+            self._src = src
 
-                # Determine the fully qualified library name
-                lpath = os.path.join(tmpdir, lname)
+            # Limit the number of compilers running at once
+            while len(self._inflight) >= self.njobs:
+                self._inflight[0].mod
 
-                # Add it to the cache and load
-                self.mod = self._cache_set_and_loadlib(lpath)
-            finally:
-                # Unless we're debugging delete the scratch directory
-                if 'PYFR_DEBUG_OMP_KEEP_LIBS' not in os.environ:
-                    rm(tmpdir)
+            if self._cache_lock(block=False):
+                # The library may have entered the cache whilst locking
+                mod = self._cache_loadlib()
+                if mod:
+                    self.mod = mod
+                    self._cleanup()
+                else:
+                    self._compile_async()
 
     def cc_cmd(self, srcname, libname):
         cmd = [
@@ -89,6 +118,102 @@ class SourceModule(object):
         return os.environ.get('PYFR_OMP_CACHE_DIR',
                               user_cache_dir('pyfr', 'pyfr'))
 
+    @lazyprop
+    def mod(self):
+        try:
+            # If another process has been compiling the library then
+            # wait for it to finish before checking the cache again
+            if self._aid is None:
+                self._cache_lock(block=True)
+
+                mod = self._cache_loadlib()
+                if mod:
+                    return mod
+
+                self._compile_async()
+
+            return self._compile_wait()
+        finally:
+            self._cleanup()
+
+    def _compile_async(self):
+        # Create a scratch directory
+        tmpidx = next(self._dir_seq)
+        self._tmpdir = tempfile.mkdtemp(prefix='pyfr-{0}-'.format(tmpidx))
+
+        # Write the source code out
+        with open(os.path.join(self._tmpdir, 'tmp.c'), 'w') as f:
+            f.write(self._src)
+
+        # Invoke the compiler, capturing its output in a log file
+        cmd = self.cc_cmd('tmp.c', platform_libname('tmp'))
+        cmd = ['sh', '-c', '"$@" > tmp.log 2>&1', 'sh', *cmd]
+
+        self._aid = call_async(cmd, cwd=self._tmpdir)
+        self._inflight.append(self)
+
+    def _compile_wait(self):
+        self._inflight.remove(self)
+
+        aid, self._aid = self._aid, None
+        if wait(aid) != 0:
+            with open(os.path.join(self._tmpdir, 'tmp.log')) as f:
+                log = f.read()
+
+            raise RuntimeError(f'Compilation failed:\n{log}')
+
+        # Determine the fully qualified library name
+        lpath = os.path.join(self._tmpdir, platform_libname('tmp'))
+
+        # Add it to the cache and load
+        return self._cache_set_and_loadlib(lpath)
+
+    def _cleanup(self):
+        # Release the cache lock
+        if self._lockf:
+            self._cache_unlock()
+
+        # Unless we're debugging delete the scratch directory
+        if self._tmpdir and 'PYFR_DEBUG_OMP_KEEP_LIBS' not in os.environ:
+            rm(self._tmpdir)
+
+        self._src = self._tmpdir = None
+
+    def _cache_lock(self, block):
+        # If caching or locking is unavailable then there is nothing to do
+        if 'PYFR_DEBUG_OMP_DISABLE_CACHE' in os.environ or not fcntl:
+            return True
+
+        # Lock file for the library
+        lkpath = os.path.join(self.cachedir, self.digest + '.lock')
+
+        try:
+            os.makedirs(self.cachedir, exist_ok=True)
+            self._lockf = open(lkpath, 'a')
+        except OSError:
+            return True
+
+        try:
+            op = fcntl.LOCK_EX if block else fcntl.LOCK_EX | fcntl.LOCK_NB
+            fcntl.flock(self._lockf, op)
+        except OSError:
+            self._lockf.close()
+            self._lockf = None
+            return False
+        else:
+            return True
+
+    def _cache_unlock(self):
+        # Anyone who has yet to take the lock will find the library, or
+        # if compilation failed, try again themselves
+        try:
+            os.remove(self._lockf.name)
+        except OSError:
+            pass
+
+        self._lockf.close()
+        self._lockf = None
+
     def _cache_loadlib(self):
         # If caching is disabled then return
         if 'PYFR_DEBUG_OMP_DISABLE_CACHE' in os.environ:
@@ -130,9 +255,26 @@ class SourceModule(object):
                 return CDLL(clpath)
 
     def function(self, name, restype, argtypes):
+        # If we are still being compiled then defer getting the function
+        if 'mod' not in self.__dict__:
+            return SourceModuleFunction(self, name, restype, argtypes)
+        else:
+            return self._function(name, restype, argtypes)
+
+    def _function(self, name, restype, argtypes):
         # Get the function
         fn = getattr(self.mod, name)
         fn.restype = npdtype_to_ctypestype(restype)
         fn.argtypes = [npdtype_to_ctypestype(a) for a in argtypes]
 
         return fn
+
+
+@atexit.register
+def _wait_inflight():
+    # Let any outstanding compilations finish and enter the cache
+    for smod in list(SourceModule._inflight):
+        try:
+            smod.mod
+        except RuntimeError:
+            pass
@@ -4,6 +4,9 @@ from pyfr.backends.base.generator import BaseKernelGenerator
 
 
 class OpenMPKernelGenerator(BaseKernelGenerator):
+    # If 2D kernels should have a variant for element tiling
+    tile = False
+
     def render(self):
         if self.ndim == 1:
             inner = '''
@@ -23,9 +26,9 @@ class OpenMPKernelGenerator(BaseKernelGenerator):
                         {body}
                     }}'''.format(body=self.body)
         else:
-            inner = '''
+            loop = '''
                     int rb, re, cb, ce;
-                    loop_sched_2d(_ny, _nx, align, &rb, &re, &cb, &ce);
+                    {sched}
                     int nci = ((ce - cb) / SOA_SZ)*SOA_SZ;
                     for (int _y = rb; _y < re; _y++)
                     {{
@@ -42,10 +45,19 @@ class OpenMPKernelGenerator(BaseKernelGenerator):
                         {{
                             {body}
                         }}
-                    }}'''.format(body=self.body)
+                    }}'''
+            inner = loop.format(
+                sched='loop_sched_2d(_ny, _nx, align, &rb, &re, &cb, &ce);',
+                body=self.body
+            )
 
-        return '''{spec}
+        # Constant values for any arguments we are specialised on
+        defs = ''.join(f'#define {k} {v}\n' for k, v in self.consts.items())
+        undefs = ''.join(f'#undef {k}\n' for k in self.consts)
+
+        src = '''{spec}
                {{
+                   {defs}
                    #define X_IDX (_xi + _xj)
                    #define X_IDX_AOSOA(v, nv)\
                        ((_xi/SOA_SZ*(nv) + (v))*SOA_SZ + _xj)
@@ -56,12 +68,43 @@ class OpenMPKernelGenerator(BaseKernelGenerator):
                    }}
                    #undef X_IDX
                    #undef X_IDX_AOSOA
-               }}'''.format(spec=self._render_spec(), inner=inner)
+                   {undefs}
+               }}'''.format(spec=self._render_spec(), inner=inner, defs=defs,
+                            undefs=undefs)
+
+        # When tiling elements 2D kernels also get a variant for processing
+        # the columns in [_cb, _ce) from inside of an existing parallel region
+        if self.ndim == 2 and self.tile:
+            src += '''
 
-    def _render_spec(self):
+               {spec}
+               {{
+                   {defs}
+                   #define X_IDX (_xi + _xj)
+                   #define X_IDX_AOSOA(v, nv)\
+                       ((_xi/SOA_SZ*(nv) + (v))*SOA_SZ + _xj)
+                   {inner}
+                   #undef X_IDX
+                   #undef X_IDX_AOSOA
+                   {undefs}
+               }}'''.format(
+                   spec=self._render_spec(tile=True), defs=defs, undefs=undefs,
+                   inner=loop.format(
+                       sched='rb = 0, re = _ny, cb = _cb, ce = _ce;',
+                       body=self.body
+                   )
+               )
+
+        return src
+
+    def _render_spec(self, tile=False):
         # We first need the argument list; starting with the dimensions
         kargs = ['int ' + d for d in self._dims]
 
+        # Tiled variants are also passed the range of columns to process
+        if tile:
+            kargs = ['int _cb', 'int _ce'] + kargs
+
         # Now add any scalar arguments
         kargs.extend('{0.dtype} {0.name}'.format(sa) for sa in self.scalargs)
 
@@ -87,4 +130,10 @@ class OpenMPKernelGenerator(BaseKernelGenerator):
                 if self.needs_ldim(va):
                     kargs.append('int ld{0.name}'.format(va))
 
-        return 'void {0}({1})'.format(self.name, ', '.join(kargs))
+        name = f'{self.name}_tile' if tile else self.name
+
+        return 'void {0}({1})'.format(name, ', '.join(kargs))
+
+
+class OpenMPTiledKernelGenerator(OpenMPKernelGenerator):
+    tile = True
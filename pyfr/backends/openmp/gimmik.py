@@ -30,10 +30,35 @@ class OpenMPGiMMiKKernels(OpenMPKernelProvider):
         # Generate the GiMMiK kernel
         src = generate_mm(a.get(), dtype=a.dtype, platform='c-omp',
                           alpha=alpha, beta=beta)
-        gimmik_mm = self._build_kernel('gimmik_mm', src,
-                                       [np.int32] + [np.intp, np.int32]*2)
+
+        # When tiling elements also generate a serial variant
+        if self.backend.element_tiling:
+            cols = self._tile_cols(b, out)
+        else:
+            cols = None
+
+        if cols:
+            sersrc = generate_mm(a.get(), dtype=a.dtype, platform='c',
+                                 alpha=alpha, beta=beta,
+                                 funcn='gimmik_mm_serial')
+
+            tpl = self.backend.lookup.get_template('gimmik')
+            src = tpl.render(parsrc=src, sersrc=sersrc)
+
+        argt = [np.int32] + [np.intp, np.int32]*2
+        gimmik_mm = self._build_kernel('gimmik_mm', src, argt)
+
+        if cols:
+            gimmik_mm_tile = self._build_kernel('gimmik_mm_tile', src,
+                                                [np.int32]*2 + argt)
 
         class MulKernel(ComputeKernel):
+            cfun = gimmik_mm
+            cargs = [b.ncol, b, b.leaddim, out, out.leaddim]
+
+            if cols:
+                tfun, targtypes, tcols = gimmik_mm_tile, argt, cols
+
             def run(self, queue):
                 gimmik_mm(b.ncol, b, b.leaddim, out, out.leaddim)
 
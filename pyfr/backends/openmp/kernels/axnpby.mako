@@ -5,7 +5,7 @@
 void
 axnpby(int nrow, int ncolb, int ldim,
        ${', '.join(f'fpdtype_t *__restrict__ x{i}' for i in range(nv))},
-       ${', '.join(f'fpdtype_t a{i}' for i in range(nv))})
+       ${', '.join(f'accdtype_t a{i}' for i in range(nv))})
 {
 % if sorted(subdims) == list(range(ncola)):
     #pragma omp parallel
@@ -13,6 +13,7 @@
 
 // Typedefs
 typedef ${pyfr.npdtype_to_ctype(fpdtype)} fpdtype_t;
+typedef ${pyfr.npdtype_to_ctype(accdtype)} accdtype_t;
 
 // OpenMP static loop scheduling functions
 <%include file='loop-sched'/>
@@ -3,14 +3,14 @@
 <%namespace module='pyfr.backends.base.makoutil' name='pyfr'/>
 
 void
-errest(int nrow, int ncolb, int ldim, fpdtype_t *__restrict__ error,
+errest(int nrow, int ncolb, int ldim, accdtype_t *__restrict__ error,
        fpdtype_t *__restrict__ x, fpdtype_t *__restrict__ y,
        fpdtype_t *__restrict__ z, fpdtype_t atol, fpdtype_t rtol)
 {
     #define X_IDX_AOSOA(v, nv) ((ci/SOA_SZ*(nv) + (v))*SOA_SZ + cj)
 
     // Initalise the reduction variables
-    fpdtype_t ${','.join('err{0} = 0.0'.format(i) for i in range(ncola))};
+    accdtype_t ${','.join('err{0} = 0.0'.format(i) for i in range(ncola))};
 
 % if norm == 'uniform':
     #pragma omp parallel reduction(max : ${','.join('err{0}'.format(i) for i in range(ncola))})
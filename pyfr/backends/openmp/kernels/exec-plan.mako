@@ -0,0 +1,16 @@
+# -*- coding: utf-8 -*-
+<%inherit file='base'/>
+
+// Kernel prototypes
+% for i, argt in enumerate(kargts):
+typedef void (*exec_plan_k${i}_t)(${', '.join(argt)});
+% endfor
+
+void
+exec_plan(void *const *fn, const int *ia, void *const *pa,
+          const double *da, const float *fa)
+{
+% for i, args in enumerate(kargs):
+    ((exec_plan_k${i}_t) fn[${i}])(${', '.join(args)});
+% endfor
+}
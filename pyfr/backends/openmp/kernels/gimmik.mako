@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+<%inherit file='base'/>
+
+${parsrc}
+
+${sersrc}
+
+void
+gimmik_mm_tile(int cb, int ce, int n,
+               const fpdtype_t *restrict b, int ldb,
+               fpdtype_t *restrict c, int ldc)
+{
+    gimmik_mm_serial(ce - cb, b + cb, ldb, c + cb, ldc);
+}
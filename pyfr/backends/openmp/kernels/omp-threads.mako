@@ -0,0 +1,14 @@
+# -*- coding: utf-8 -*-
+<%inherit file='base'/>
+
+#include <omp.h>
+
+int
+omp_threads(int n)
+{
+    // Update the size of the team, if requested, and return it
+    if (n > 0)
+        omp_set_num_threads(n);
+
+    return omp_get_max_threads();
+}
@@ -1,24 +1,106 @@
 # -*- coding: utf-8 -*-
 <%inherit file='base'/>
 
+#include <stdint.h>
+#include <string.h>
+
+% if wprec == 'bfloat16':
+// Exchanged data is sent as the upper half of a float
+typedef uint16_t wire_t;
+
+static inline wire_t
+to_wire(fpdtype_t x)
+{
+    float f = x;
+    uint32_t u;
+    memcpy(&u, &f, sizeof(u));
+
+    // Round to nearest, ties to even
+    return (u + 0x7fff + ((u >> 16) & 1)) >> 16;
+}
+
+static inline fpdtype_t
+from_wire(wire_t w)
+{
+    uint32_t u = (uint32_t) w << 16;
+    float f;
+    memcpy(&f, &u, sizeof(f));
+
+    return f;
+}
+% elif wprec == 'single':
+// Exchanged data is sent in single precision
+typedef float wire_t;
+
+#define to_wire(x) ((wire_t) (x))
+#define from_wire(x) ((fpdtype_t) (x))
+% else:
+typedef fpdtype_t wire_t;
+
+#define to_wire(x) (x)
+#define from_wire(x) (x)
+% endif
+
 void
 pack_view(int n, int nrv, int ncv,
           const fpdtype_t *__restrict__ v,
           const int *__restrict__ vix,
           const int *__restrict__ vrstri,
-          fpdtype_t *__restrict__  pmat)
+          wire_t *__restrict__  pmat)
 {
     if (ncv == 1)
         for (int i = 0; i < n; i++)
-            pmat[i] = v[vix[i]];
+            pmat[i] = to_wire(v[vix[i]]);
     else if (nrv == 1)
         for (int i = 0; i < n; i++)
             for (int c = 0; c < ncv; c++)
-                pmat[c*n + i] = v[vix[i] + SOA_SZ*c];
+                pmat[c*n + i] = to_wire(v[vix[i] + SOA_SZ*c]);
     else
         for (int i = 0; i < n; i++)
             for (int r = 0; r < nrv; r++)
                 for (int c = 0; c < ncv; c++)
-                    pmat[(r*ncv + c)*n + i] = v[vix[i] + vrstri[i]*r +
-                                                SOA_SZ*c];
+                    pmat[(r*ncv + c)*n + i] = to_wire(v[vix[i] + vrstri[i]*r +
+                                                        SOA_SZ*c]);
+}
+
+void
+pack_view_runs(int n, int nrv, int ncv, int nrun,
+               const fpdtype_t *__restrict__ v,
+               const int *__restrict__ vix,
+               const int *__restrict__ vrstri,
+               const int *__restrict__ runs,
+               wire_t *__restrict__  pmat)
+{
+    for (int k = 0; k < nrun; k++)
+    {
+        // Points in a run are contiguous and share a row stride
+        int ib = runs[k], ie = runs[k + 1];
+        int rstri = (nrv > 1) ? vrstri[ib] : 0;
+
+        for (int r = 0; r < nrv; r++)
+        {
+            for (int c = 0; c < ncv; c++)
+            {
+                const fpdtype_t *vr = v + vix[ib] + rstri*r + SOA_SZ*c - ib;
+                wire_t *pr = pmat + (r*ncv + c)*n;
+
+                #pragma omp simd
+                for (int i = ib; i < ie; i++)
+                    pr[i] = to_wire(vr[i]);
+            }
+        }
+    }
+}
+
+void
+unpack_wire(int nrow, int ncol, int ldim,
+            const wire_t *__restrict__ pmat,
+            fpdtype_t *__restrict__ m)
+{
+    for (int r = 0; r < nrow; r++)
+    {
+        #pragma omp simd
+        for (int c = 0; c < ncol; c++)
+            m[r*ldim + c] = from_wire(pmat[r*ncol + c]);
+    }
 }
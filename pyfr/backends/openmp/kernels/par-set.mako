@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+<%inherit file='base'/>
+<%namespace module='pyfr.backends.base.makoutil' name='pyfr'/>
+
+#include <stddef.h>
+#include <string.h>
+
+void
+par_set(ptrdiff_t n, char *dst, const char *src)
+{
+    // Partition in units of the alignment requirement
+    int nblk = (n + PYFR_ALIGN_BYTES - 1) / PYFR_ALIGN_BYTES;
+
+    #pragma omp parallel
+    {
+        int bb, be;
+        loop_sched_1d(nblk, 1, &bb, &be);
+
+        ptrdiff_t b = (ptrdiff_t) bb*PYFR_ALIGN_BYTES;
+        ptrdiff_t e = min((ptrdiff_t) be*PYFR_ALIGN_BYTES, n);
+
+        // Copy from the source or, if there is none, zero
+        if (b < e && src)
+            memcpy(dst + b, src + b, e - b);
+        else if (b < e)
+            memset(dst + b, 0, e - b);
+    }
+}
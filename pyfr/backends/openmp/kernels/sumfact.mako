@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+<%inherit file='base'/>
+
+// Number of columns processed at once by each thread
+#define TILE_SZ ${tilesz}
+
+// One dimensional operators
+% for gi, stages in enumerate(groups):
+% for si, st in enumerate(stages):
+static const fpdtype_t op${gi}_${si}[${st['nr']}][${st['nq']}] = {
+% for row in st['op']:
+    {${', '.join(repr(float(v)) for v in row)}},
+% endfor
+};
+% endfor
+% endfor
+
+static inline void
+sumfact_tile(int w, const fpdtype_t *restrict b, int ldb,
+             fpdtype_t *restrict c, int ldc)
+{
+% for gi, stages in enumerate(groups):
+% for si, st in enumerate(stages):
+<%
+    if si == 0:
+        src = f'b + ({st["boff"]} + (o*{st["nq"]} + l)*{st["ni"]} + i)*ldb'
+    else:
+        src = f't{gi}_{si - 1}[(o*{st["nq"]} + l)*{st["ni"]} + i]'
+%>
+    // Contract group ${gi} along axis ${st['axis']}
+    fpdtype_t t${gi}_${si}[${st['no']*st['nr']*st['ni']}][TILE_SZ];
+
+    for (int o = 0; o < ${st['no']}; o++)
+        for (int j = 0; j < ${st['nr']}; j++)
+            for (int i = 0; i < ${st['ni']}; i++)
+            {
+                fpdtype_t *y = t${gi}_${si}[(o*${st['nr']} + j)*${st['ni']} + i];
+
+                #pragma omp simd
+                for (int x = 0; x < w; x++)
+                    y[x] = 0;
+
+                for (int l = 0; l < ${st['nq']}; l++)
+                {
+                    const fpdtype_t m = op${gi}_${si}[j][l];
+                    const fpdtype_t *xp = ${src};
+
+                    #pragma omp simd
+                    for (int x = 0; x < w; x++)
+                        y[x] += m*xp[x];
+                }
+            }
+% endfor
+% endfor
+
+    // Assemble the outputs
+% for r, terms in enumerate(rows):
+<%
+    rhs = [f'{s!r}*{ref}[x]' for s, ref in terms]
+    if beta != 0:
+        rhs.append(f'{beta!r}*c[{r}*ldc + x]')
+%>
+    #pragma omp simd
+    for (int x = 0; x < w; x++)
+        c[${r}*ldc + x] = ${' + '.join(rhs) or '0'};
+% endfor
+}
+
+void
+sumfact_mm_tile(int cb, int ce, int n, const fpdtype_t *b, int ldb,
+                fpdtype_t *c, int ldc)
+{
+    // Full tiles
+    int cc;
+    for (cc = cb; cc + TILE_SZ <= ce; cc += TILE_SZ)
+        sumfact_tile(TILE_SZ, b + cc, ldb, c + cc, ldc);
+
+    // Remainder
+    if (cc < ce)
+        sumfact_tile(ce - cc, b + cc, ldb, c + cc, ldc);
+}
+
+void
+sumfact_mm(int n, const fpdtype_t *b, int ldb, fpdtype_t *c, int ldc)
+{
+    #pragma omp parallel
+    {
+        int cb, ce;
+        loop_sched_1d(n, TILE_SZ, &cb, &ce);
+
+        sumfact_mm_tile(cb, ce, n, b, ldb, c, ldc);
+    }
+}
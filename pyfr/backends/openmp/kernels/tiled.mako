@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+<%inherit file='base'/>
+
+// Kernel prototypes
+% for i, argt in enumerate(kargts):
+typedef void (*tiled_k${i}_t)(int, int, ${', '.join(argt)});
+% endfor
+
+void
+tiled(int nblk, int tblk, void *const *fn, const int *ia, void *const *pa,
+      const double *da, const float *fa)
+{
+    #pragma omp parallel
+    {
+        int bb, be;
+        loop_sched_1d(nblk, 1, &bb, &be);
+
+        // Run each kernel in turn over our tiles of SoA blocks
+        for (int tb = bb; tb < be; tb += tblk)
+        {
+            int te = min(tb + tblk, be);
+
+% for i, (args, (n, w)) in enumerate(zip(kargs, tcols)):
+            ((tiled_k${i}_t) fn[${i}])(min(tb*${w}, ${n}), min(te*${w}, ${n}),
+                                       ${', '.join(args)});
+% endfor
+        }
+    }
+}
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 
-from pyfr.backends.base import ComputeKernel, NullComputeKernel
+from pyfr.backends.base import ComputeKernel, MPIKernel, NullComputeKernel
 from pyfr.backends.base.packing import BasePackingKernels
 from pyfr.backends.openmp.provider import OpenMPKernelProvider
 
@@ -11,18 +11,65 @@ class OpenMPPackingKernels(OpenMPKernelProvider, BasePackingKernels):
         m, v = mv.xchgmat, mv.view
 
         # Render the kernel template
-        src = self.backend.lookup.get_template('pack').render()
+        tpl = self.backend.lookup.get_template('pack')
+        src = tpl.render(wprec=m.wprec)
 
-        # Build
-        kern = self._build_kernel('pack_view', src, 'iiiPPPP')
+        # Pack into any wire or shared memory buffer
+        pmat = m if m.hdata is m.data else m.hdata.ctypes.data
+
+        # If the view consists of contiguous runs then copy these in turn
+        if v.runs is not None:
+            kern = self._build_kernel('pack_view_runs', src, 'iiiiPPPPP')
+            kargs = [v.n, v.nvrow, v.nvcol, v.nruns, v.basedata, v.mapping,
+                     v.rstrides or 0, v.runs, pmat]
+        # Otherwise, gather each point individually
+        else:
+            kern = self._build_kernel('pack_view', src, 'iiiPPPP')
+            kargs = [v.n, v.nvrow, v.nvcol, v.basedata, v.mapping,
+                     v.rstrides or 0, pmat]
 
         class PackXchgViewKernel(ComputeKernel):
+            cfun, cargs = kern, kargs
+
             def run(self, queue):
-                kern(v.n, v.nvrow, v.nvcol, v.basedata, v.mapping,
-                     v.rstrides or 0, m)
+                kern(*kargs)
 
         return PackXchgViewKernel()
 
     def unpack(self, mv):
-        # No-op
-        return NullComputeKernel()
+        m = self._xchgmat(mv)
+
+        # No-op unless the data was sent in a reduced precision
+        if not m.wprec:
+            return NullComputeKernel()
+
+        # Render the kernel template
+        tpl = self.backend.lookup.get_template('pack')
+        src = tpl.render(wprec=m.wprec)
+
+        # Widen the data from the wire buffer into the matrix
+        kern = self._build_kernel('unpack_wire', src, 'iiiPP')
+        kargs = [m.nrow, m.ncol, m.leaddim, m.hdata.ctypes.data, m]
+
+        class UnpackXchgMatrixKernel(ComputeKernel):
+            cfun, cargs = kern, kargs
+
+            def run(self, queue):
+                kern(*kargs)
+
+        return UnpackXchgMatrixKernel()
+
+    def _shm_xchg(self, chan):
+        class ShmXchgKernel(MPIKernel):
+            def run(self, queue):
+                # Start the exchange and have the queue complete it
+                chan.start()
+                queue.shm_reqs.append(chan)
+
+        return ShmXchgKernel()
+
+    def shm_send_packs(self, chan):
+        return self._shm_xchg(chan)
+
+    def shm_recv_packs(self, chan):
+        return self._shm_xchg(chan)
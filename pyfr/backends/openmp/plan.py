@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+from ctypes import (cast, c_double, c_float, c_int32, c_int64, c_uint64,
+                    c_void_p)
+
+import numpy as np
+
+from pyfr.backends.base import ComputeMetaKernel, NullComputeKernel
+from pyfr.backends.base.plan import bind_plan_steps
+from pyfr.util import lazyprop
+
+
+# Mapping from ctypes argument types to C types and argument arrays
+_ctype_map = {
+    c_int32: ('int', 'ia'), c_int64: ('void *', 'pa'),
+    c_uint64: ('void *', 'pa'), c_void_p: ('void *', 'pa'),
+    c_double: ('double', 'da'), c_float: ('float', 'fa')
+}
+
+_ctype_dtypes = {'ia': np.int32, 'pa': np.uintp, 'da': np.float64,
+                 'fa': np.float32}
+
+
+def _flatten(kern):
+    if isinstance(kern, ComputeMetaKernel):
+        return [k for mk in kern._kernels for k in _flatten(mk)]
+    elif isinstance(kern, NullComputeKernel):
+        return []
+    else:
+        return [kern]
+
+
+class OpenMPCompiledKernels(object):
+    def __init__(self, backend, kerns):
+        argts, args = self._marshal_args([(k.cfun, k.cfun.argtypes, k.cargs)
+                                          for k in kerns])
+
+        # Render and build the driver function
+        src = backend.lookup.get_template('exec-plan').render(
+            kargts=argts, kargs=args
+        )
+        self._fun = backend.pointwise._build_kernel('exec_plan', src,
+                                                    [np.intp]*5)
+
+    @lazyprop
+    def _fargs(self):
+        # Resolving the function pointers waits for them to be compiled
+        fptrs = [cast(fun, c_void_p).value for fun in self._kfuns]
+        self._fptrs = np.array(fptrs, dtype=np.uintp)
+
+        return [*self._dargs, self._fptrs.ctypes.data] + [
+            self._vals[k].ctypes.data for k in ['ia', 'pa', 'da', 'fa']
+        ]
+
+    def _marshal_args(self, kfuns, dargs=()):
+        argts, args = [], []
+        vals = {k: [] for k in _ctype_dtypes}
+
+        # Arguments which must be refreshed before each invocation
+        dynargs, rtargs = [], []
+
+        for fun, argtypes, fargs in kfuns:
+            kargt, kargs = [], []
+
+            for at, ka in zip(argtypes, fargs):
+                ctype, aname = _ctype_map[at]
+                aidx = len(vals[aname])
+
+                # Runtime arguments, such as the current time
+                if isinstance(ka, str):
+                    rtargs.append((aname, aidx, ka))
+                    vals[aname].append(0)
+                # Banked arguments whose address changes between calls
+                elif 'bank' in getattr(ka, 'tags', ()):
+                    dynargs.append((aname, aidx, ka))
+                    vals[aname].append(0)
+                # Fixed arguments
+                else:
+                    vals[aname].append(getattr(ka, '_as_parameter_', ka))
+
+                kargt.append(ctype)
+                kargs.append(f'{aname}[{aidx}]')
+
+            argts.append(kargt)
+            args.append(kargs)
+
+        # Kernel functions and any leading arguments of the driver
+        self._kfuns = [fun for fun, argtypes, fargs in kfuns]
+        self._dargs = dargs
+
+        # Allocate the argument arrays
+        self._vals = {k: np.array(v or [0], dtype=_ctype_dtypes[k])
+                      for k, v in vals.items()}
+
+        # Resolve the dynamic arguments to array/index pairs
+        self._dynargs = [(self._vals[n], i, ka) for n, i, ka in dynargs]
+        self._rtargs = [(self._vals[n], i, ka) for n, i, ka in rtargs]
+
+        # Names of the runtime arguments we require
+        self.argnames = tuple(sorted({ka for n, i, ka in rtargs}))
+
+        return argts, args
+
+    def __call__(self, **kwargs):
+        for arr, i, ka in self._dynargs:
+            arr[i] = ka._as_parameter_
+
+        for arr, i, ka in self._rtargs:
+            arr[i] = kwargs[ka]
+
+        self._fun(*self._fargs)
+
+
+def compile_plan_steps(backend, rsteps, kwargs):
+    steps, ckerns, crsteps = [], [], []
+
+    def flush():
+        # Compile runs of two or more kernels into a single function
+        if len(ckerns) > 1:
+            ck = OpenMPCompiledKernels(backend, ckerns)
+
+            if any(n not in kwargs for n in ck.argnames):
+                raise ValueError('Plan kernel arguments must be passed to '
+                                 'the plan itself')
+
+            steps.append((ck, ck.argnames))
+        else:
+            steps.extend(bind_plan_steps(crsteps, kwargs))
+
+        ckerns.clear()
+        crsteps.clear()
+
+    for rs in rsteps:
+        # On the OpenMP backend compute kernels are synchronous
+        if rs[0] == 'wait' and rs[2] == 'compute':
+            continue
+        elif rs[0] == 'run' and rs[2].ktype == 'compute':
+            kerns = _flatten(rs[2])
+
+            if all(hasattr(k, 'cfun') for k in kerns):
+                ckerns.extend(kerns)
+                crsteps.append(rs)
+                continue
+
+        flush()
+        steps.extend(bind_plan_steps([rs], kwargs))
+
+    flush()
+
+    return steps
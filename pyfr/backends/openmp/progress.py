@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from threading import Condition, Thread
+import time
+
+
+class _ProgressRequests(list):
+    def __init__(self, progress):
+        super().__init__()
+        self._progress = progress
+
+    def append(self, req):
+        super().append(req)
+
+        # Hand the (started) request over to the progress thread
+        self._progress.add(req)
+
+
+class MPIProgressThread(Thread):
+    # Interval between polls of the outstanding requests
+    poll_dt = 2e-5
+
+    def __init__(self):
+        from mpi4py import MPI
+
+        super().__init__(daemon=True)
+
+        # The thread calls MPI concurrently with the main thread
+        if MPI.Query_thread() < MPI.THREAD_MULTIPLE:
+            raise RuntimeError('MPI progress thread requires '
+                               'MPI_THREAD_MULTIPLE')
+
+        self._cv = Condition()
+
+        # Requests being progressed and if they are being polled
+        self._reqs = []
+        self._polling = False
+
+        # Start time of the current exchange
+        self._tstart = None
+
+        # Exchanges, those which completed in the background, and the
+        # total time spent exchanging and waiting for exchanges
+        self.nxchgs = self.nbgxchgs = 0
+        self.txchg = self.twait = 0.0
+
+    def requests(self):
+        return _ProgressRequests(self)
+
+    def add(self, req):
+        with self._cv:
+            if self._tstart is None:
+                self._tstart = time.perf_counter()
+
+            self._reqs.append(req)
+            self._cv.notify_all()
+
+    def waitall(self, reqs):
+        from mpi4py import MPI
+
+        # Reclaim the requests, waiting for any ongoing poll to finish
+        with self._cv:
+            pending = bool(self._reqs)
+
+            self._reqs = []
+            self._cv.wait_for(lambda: not self._polling)
+
+        twait = time.perf_counter()
+        MPI.Request.Waitall(reqs)
+        tend = time.perf_counter()
+
+        # Update the statistics
+        if self._tstart is not None:
+            self.nxchgs += 1
+            self.nbgxchgs += not pending
+            self.txchg += tend - self._tstart
+            self.twait += tend - twait
+
+            self._tstart = None
+
+    def stats(self):
+        return self.nxchgs, self.nbgxchgs, self.txchg, self.twait
+
+    def run(self):
+        from mpi4py import MPI
+
+        while True:
+            with self._cv:
+                self._polling = False
+                self._cv.notify_all()
+
+                # Wait for there to be requests to progress
+                self._cv.wait_for(lambda: self._reqs)
+
+                self._polling = True
+                reqs = list(self._reqs)
+
+            # Poll the requests, sleeping so as not to hog the GIL
+            while not MPI.Request.Testall(reqs):
+                time.sleep(self.poll_dt)
+
+                # Stop if the requests have been reclaimed
+                if not self._reqs:
+                    break
+            else:
+                with self._cv:
+                    # Requests are only ever appended until reclaimed
+                    del self._reqs[:len(reqs)]
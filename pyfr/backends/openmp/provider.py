@@ -1,25 +1,92 @@
 # -*- coding: utf-8 -*-
 
+import numpy as np
+
 from pyfr.backends.base import (BaseKernelProvider,
                                 BasePointwiseKernelProvider, ComputeKernel)
 from pyfr.backends.openmp.compiler import SourceModule
-from pyfr.backends.openmp.generator import OpenMPKernelGenerator
+from pyfr.backends.openmp.generator import (OpenMPKernelGenerator,
+                                            OpenMPTiledKernelGenerator)
 from pyfr.util import memoize
 
 
+class RecordedFunction(object):
+    # Stands in for a function whose source was recorded, not compiled
+    def __init__(self, name):
+        self.name = name
+
+    def __call__(self, *args):
+        raise RuntimeError(f'Function {self.name} has not been compiled')
+
+
 class OpenMPKernelProvider(BaseKernelProvider):
+    @memoize
+    def _build_module(self, src):
+        return SourceModule(src, self.backend.cfg)
+
     @memoize
     def _build_kernel(self, name, src, argtypes, restype=None):
-        mod = SourceModule(src, self.backend.cfg)
-        return mod.function(name, restype, argtypes)
+        # If we are only recording sources then do not compile anything
+        if self.backend.ksrcs is not None:
+            self.backend.ksrcs.append(src)
+            return RecordedFunction(name)
+
+        return self._build_module(src).function(name, restype, argtypes)
+
+    def _tile_cols(self, *mats):
+        cols = set()
+
+        for m in mats:
+            p = getattr(m, 'parent', m)
+
+            # Only AoSoA matrices spanning all columns can be tiled
+            if len(p.ioshape) < 3 or m.ncol != p.ncol:
+                return None
+
+            # Number of columns and columns per SoA block of elements
+            cols.add((m.ncol, p.ioshape[-2]*self.backend.soasz))
+
+        # Ensure the matrices are blocked consistently
+        return cols.pop() if len(cols) == 1 else None
 
 
 class OpenMPPointwiseKernelProvider(OpenMPKernelProvider,
                                     BasePointwiseKernelProvider):
     kernel_generator_cls = OpenMPKernelGenerator
 
+    def __init__(self, backend):
+        super().__init__(backend)
+
+        self.specialise = backend.cfg.getbool('backend-openmp',
+                                              'specialise-kernels', False)
+
+        # Only generate the variants of kernels used when tiling elements
+        # if element tiling is enabled
+        if backend.element_tiling:
+            self.kernel_generator_cls = OpenMPTiledKernelGenerator
+
+    def _build_kernel(self, name, src, argtypes, restype=None):
+        fun = super()._build_kernel(name, src, argtypes, restype)
+
+        # When tiling elements two dimensional kernels also have a variant
+        # which runs over a range of columns inside of a parallel region
+        if f'{name}_tile(' in src:
+            fun.tfun = super()._build_kernel(f'{name}_tile', src,
+                                             [np.int32]*2 + argtypes)
+            fun.targtypes = argtypes
+
+        return fun
+
     def _instantiate_kernel(self, dims, fun, arglst):
         class PointwiseKernel(ComputeKernel):
+            # Function and arguments for use by compiled execution plans
+            cfun, cargs = fun, arglst
+
+            # Column range variant and its extents for element tiling
+            if hasattr(fun, 'tfun'):
+                tfun, targtypes = fun.tfun, fun.targtypes
+                tcols = (dims[-1], self.backend.soasz)
+
             if any(isinstance(arg, str) for arg in arglst):
                 def run(self, queue, **kwargs):
                     fun(*[kwargs.get(ka, ka) for ka in arglst])
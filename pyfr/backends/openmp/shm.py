@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+import numpy as np
+
+
+def _spin(win, cond):
+    # Spin until the condition holds, yielding in case we are oversubscribed
+    while not cond():
+        os.sched_yield()
+        win.Sync()
+
+
+class _SendChannel(object):
+    send = True
+
+    def __init__(self, win, flags):
+        self.win = win
+        self.flags = flags
+        self.seq = 0
+
+    def start(self):
+        self.seq += 1
+
+        # Ensure our packed data is visible before marking it as ready
+        self.win.Sync()
+        self.flags[0] = self.seq
+
+    def wait(self):
+        # Wait for the receiver to have consumed the data
+        _spin(self.win, lambda: self.flags[1] >= self.seq)
+
+
+class _RecvChannel(object):
+    send = False
+
+    def __init__(self, win, flags, srcs, dsts):
+        self.win = win
+        self.flags = flags
+        self.srcs = srcs
+        self.dsts = dsts
+        self.seq = 0
+
+    def start(self):
+        self.seq += 1
+
+    def wait(self):
+        # Wait for the sender to mark its data as ready
+        _spin(self.win, lambda: self.flags[0] >= self.seq)
+
+        # Read the data directly out of the sender's buffers
+        for s, d in zip(self.srcs, self.dsts):
+            np.copyto(d, s)
+
+        # Let the sender know it is free to pack its next exchange
+        self.win.Sync()
+        self.flags[1] = self.seq
+
+
+class _SharedWindow(object):
+    # Alignment of the flags and buffers in each segment
+    align = 64
+
+    def __init__(self, shm, smvs):
+        from mpi4py import MPI
+
+        comm = shm.comm
+
+        # Lay out the flags and send buffers of each channel in our segment
+        layout, nbytes = {}, 0
+        for key, mvs in smvs.items():
+            layout[key] = nbytes
+            nbytes += self.align + sum(self._padded(self._xchgmat(mv))
+                                       for mv in mvs)
+
+        # Allocate the window and open a passive target epoch on it
+        self.win = win = MPI.Win.Allocate_shared(nbytes, 1, comm=comm)
+        win.Lock_all(MPI.MODE_NOCHECK)
+
+        self._shm = shm
+        self._layouts = comm.allgather(layout)
+        self._segs = {}
+
+        # Have our exchange matrices pack directly into the window
+        self._flags = {}
+        for key, mvs in smvs.items():
+            mats = [self._xchgmat(mv) for mv in mvs]
+            flags, bufs = self._channel(comm.rank, layout[key], mats)
+
+            for m, buf in zip(mats, bufs):
+                m.hdata = buf
+
+            flags[:] = 0
+            self._flags[key] = flags
+
+        # Ensure all flags are cleared before any are used
+        win.Sync()
+        comm.Barrier()
+
+    @staticmethod
+    def _xchgmat(mv):
+        return getattr(mv, 'xchgmat', mv)
+
+    def _padded(self, m):
+        return m.hdata.nbytes - m.hdata.nbytes % -self.align
+
+    def _segment(self, nrank):
+        try:
+            return self._segs[nrank]
+        except KeyError:
+            buf, dispunit = self.win.Shared_query(nrank)
+            seg = self._segs[nrank] = np.frombuffer(buf, dtype=np.uint8)
+
+            return seg
+
+    def _channel(self, nrank, off, mats):
+        seg = self._segment(nrank)
+
+        # Flags marking the data as ready and as having been consumed
+        flags = seg[off:off + 16].view(np.int64)
+
+        # Followed by the buffers themselves
+        bufs = []
+        off += self.align
+        for m in mats:
+            hdata = m.hdata
+            buf = seg[off:off + hdata.nbytes].view(hdata.dtype)
+            bufs.append(buf.reshape(hdata.shape))
+
+            off += self._padded(m)
+
+        return flags, bufs
+
+    def sender(self, rank, key):
+        return _SendChannel(self.win, self._flags[rank, key])
+
+    def receiver(self, rank, key, mvs):
+        mats = [self._xchgmat(mv) for mv in mvs]
+
+        # Our receive matrices mirror the send buffers of the sender
+        nrank = self._shm.nrankmap[rank]
+        off = self._layouts[nrank][self._shm.rank, key]
+        flags, srcs = self._channel(nrank, off, mats)
+
+        return _RecvChannel(self.win, flags, srcs, [m.hdata for m in mats])
+
+
+class MPISharedMemory(object):
+    def __init__(self):
+        from mpi4py import MPI
+
+        # Communicator spanning the ranks on our node
+        comm = MPI.COMM_WORLD
+        self.comm = comm.Split_type(MPI.COMM_TYPE_SHARED)
+        self.rank = comm.rank
+
+        # Map from MPI ranks to their rank within the node
+        self.nrankmap = {r: i for i, r in
+                         enumerate(self.comm.allgather(comm.rank))}
+
+    def is_local(self, rank):
+        return rank in self.nrankmap
+
+    def window(self, smvs):
+        return _SharedWindow(self, smvs)
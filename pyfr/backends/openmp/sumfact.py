@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pyfr.backends.base import ComputeKernel, NotSuitableError
+from pyfr.backends.openmp.provider import OpenMPKernelProvider
+from pyfr.shapes import BaseShape, TensorProdShape
+from pyfr.util import subclass_where
+
+
+class _TermGroup(object):
+    def __init__(self, blk, axes):
+        self.blk = blk
+        self.axes = axes
+
+        # Distinct one dimensional operators along each active axis
+        self.ops = {k: [] for k in axes}
+
+    def op_index(self, k, v, tol):
+        ops = self.ops[k]
+
+        for i, u in enumerate(ops):
+            if np.allclose(u, v, rtol=0, atol=tol):
+                return i
+        else:
+            ops.append(v)
+            return len(ops) - 1
+
+
+def _outer(vs):
+    t = vs[0]
+    for v in vs[1:]:
+        t = np.multiply.outer(t, v)
+
+    return t
+
+
+def _factorise_term(x, tol):
+    # Pivot about the largest entry in the tensor
+    pidx = np.unravel_index(np.argmax(np.abs(x)), x.shape)
+    piv = x[pidx]
+
+    # Extract the one dimensional factors, normalised at the pivot
+    facs = []
+    for k in range(x.ndim):
+        sidx = pidx[:k] + (slice(None),) + pidx[k + 1:]
+        facs.append(x[sidx] / piv)
+
+    # Ensure the tensor is indeed of rank one
+    rx = piv*_outer(facs)
+    if np.max(np.abs(rx - x)) > tol:
+        raise NotSuitableError('Operator is not a tensor product')
+
+    return piv, pidx, facs
+
+
+def _npts(q, ndims):
+    # Number of solution points, their vectors, and flux points
+    return {q**ndims, ndims*q**ndims, 2*ndims*q**(ndims - 1)}
+
+
+def _col_layouts(n, ndims):
+    # Columns spanning one or ndims tensors of solution points
+    for nblk in [1, ndims]:
+        q = round((n / nblk)**(1 / ndims))
+        if nblk*q**ndims == n:
+            yield q, [(i*q**ndims, (q,)*ndims) for i in range(nblk)]
+
+    # Columns spanning a tensor of flux points on each face
+    nfaces, fdims = 2*ndims, ndims - 1
+    q = round((n / nfaces)**(1 / fdims))
+    if nfaces*q**fdims == n:
+        yield q, [(i*q**fdims, (q,)*fdims) for i in range(nfaces)]
+
+
+def _stage_axes(grp):
+    # Contract along the axes which reduce the tensor most first
+    return sorted(grp.axes, key=lambda k: len(grp.ops[k]))
+
+
+def _decompose_layout(mat, blocks, tol):
+    m, n = mat.shape
+    amax = np.max(np.abs(mat))
+
+    groups, rterms = {}, []
+
+    for r in range(m):
+        terms = []
+
+        for blk, (boff, bshape) in enumerate(blocks):
+            x = mat[r, boff:boff + np.prod(bshape)].reshape(bshape)
+
+            # Skip empty blocks
+            if np.max(np.abs(x)) <= tol*amax:
+                continue
+
+            piv, pidx, facs = _factorise_term(x, tol*amax)
+
+            # Axes along which the factor is not simply a selection
+            axes = tuple(k for k, f in enumerate(facs)
+                         if np.any(np.abs(np.delete(f, pidx[k])) > tol))
+
+            try:
+                grp = groups[blk, axes]
+            except KeyError:
+                grp = groups[blk, axes] = _TermGroup(blk, axes)
+
+            # Index of the term in the contracted tensor of the group
+            tidx = tuple(grp.op_index(k, facs[k], tol) if k in axes
+                         else pidx[k] for k in range(len(bshape)))
+
+            terms.append((piv, grp, tidx))
+
+        rterms.append(terms)
+
+    return list(groups.values()), rterms
+
+
+def _decomposition_cost(blocks, groups, rterms):
+    # Multiplications needed for the contractions of each group
+    cost = 0
+    for grp in groups:
+        dims = list(blocks[grp.blk][1])
+
+        for k in _stage_axes(grp):
+            cost += np.prod(dims)*len(grp.ops[k])
+            dims[k] = len(grp.ops[k])
+
+    # Plus those needed to assemble the outputs
+    return cost + sum(len(terms) for terms in rterms)
+
+
+def tensor_decompose(mat, ndims, tol):
+    m, n = mat.shape
+    layouts = list(_col_layouts(n, ndims))
+
+    # Where possible only consider layouts which also account for the rows
+    if any(m in _npts(q, ndims) for q, blocks in layouts):
+        layouts = [(q, blocks) for q, blocks in layouts
+                   if m in _npts(q, ndims)]
+
+    best = None
+
+    # Try each way in which the columns can form tensors of points
+    for q, blocks in layouts:
+        try:
+            groups, rterms = _decompose_layout(mat, blocks, tol)
+        except NotSuitableError:
+            continue
+
+        # Retain the decomposition which is cheapest to apply
+        cost = _decomposition_cost(blocks, groups, rterms)
+        if best is None or cost < best[0]:
+            best = (cost, q, blocks, groups, rterms)
+
+    if best is None:
+        raise NotSuitableError('Operator is not a sum of tensor products')
+
+    return best[1:]
+
+
+class OpenMPSumFactKernels(OpenMPKernelProvider):
+    def __init__(self, backend):
+        super().__init__(backend)
+
+        self.min_order = backend.cfg.getint('backend-openmp',
+                                            'sumfact-min-order', 4)
+        self.tilesz = 2*backend.soasz
+
+    def _tensor_shape(self, a):
+        # See if the operator is tagged with a tensor product shape
+        for t in a.tags:
+            try:
+                shape = subclass_where(BaseShape, name=t)
+            except KeyError:
+                continue
+
+            if issubclass(shape, TensorProdShape):
+                return shape
+
+        raise NotSuitableError('Operator is not for a tensor product shape')
+
+    def mul(self, a, b, out, alpha=1.0, beta=0.0):
+        # Ensure the matrices are compatible
+        if a.nrow != out.nrow or a.ncol != b.nrow or b.ncol != out.ncol:
+            raise ValueError('Incompatible matrices for out = a*b')
+
+        # Check that A is constant
+        if 'const' not in a.tags:
+            raise NotSuitableError('Sum factorisation requires a constant a '
+                                   'matrix')
+
+        # Decompose the operator into one dimensional contractions
+        ndims = self._tensor_shape(a).ndims
+        tol = 1e3*np.finfo(a.dtype).eps
+        q, blocks, groups, rterms = tensor_decompose(a.get(), ndims, tol)
+
+        # At low orders the operators are better applied directly
+        if q - 1 < self.min_order:
+            raise NotSuitableError('Order too low for sum factorisation')
+
+        # Plan the contractions for each group of terms
+        gstages, grefs = [], {}
+        for gi, grp in enumerate(groups):
+            boff, bshape = blocks[grp.blk]
+            dims, stages = list(bshape), []
+
+            for k in _stage_axes(grp):
+                op = np.array(grp.ops[k])
+
+                stages.append({
+                    'axis': k, 'op': op, 'boff': boff,
+                    'no': int(np.prod(dims[:k])), 'nq': dims[k],
+                    'nr': len(op), 'ni': int(np.prod(dims[k + 1:]))
+                })
+                dims[k] = len(op)
+
+            gstages.append(stages)
+            grefs[grp] = (gi, len(stages), dims, boff)
+
+        # Express each output row in terms of the contracted tensors
+        rows = []
+        for terms in rterms:
+            rrow = []
+            for piv, grp, tidx in terms:
+                gi, ns, dims, boff = grefs[grp]
+                idx = np.ravel_multi_index(tidx, dims)
+
+                if ns:
+                    ref = f't{gi}_{ns - 1}[{idx}]'
+                else:
+                    ref = f'(b + {boff + idx}*ldb)'
+
+                rrow.append((float(alpha*piv), ref))
+
+            rows.append(rrow)
+
+        # Render the kernel template
+        src = self.backend.lookup.get_template('sumfact').render(
+            groups=gstages, rows=rows, beta=float(beta), tilesz=self.tilesz
+        )
+
+        # Build
+        argt = [np.int32] + [np.intp, np.int32]*2
+        sumfact_mm = self._build_kernel('sumfact_mm', src, argt)
+
+        # Column extents for element tiling
+        if self.backend.element_tiling:
+            cols = self._tile_cols(b, out)
+        else:
+            cols = None
+
+        if cols:
+            sumfact_mm_tile = self._build_kernel('sumfact_mm_tile', src,
+                                                 [np.int32]*2 + argt)
+
+        class MulKernel(ComputeKernel):
+            cfun = sumfact_mm
+            cargs = [b.ncol, b, b.leaddim, out, out.leaddim]
+
+            if cols:
+                tfun, targtypes, tcols = sumfact_mm_tile, argt, cols
+
+            def run(self, queue):
+                sumfact_mm(b.ncol, b, b.leaddim, out, out.leaddim)
+
+        return MulKernel()
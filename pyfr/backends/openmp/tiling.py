@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pyfr.backends.base import ComputeKernel, ComputeMetaKernel
+from pyfr.backends.openmp.plan import OpenMPCompiledKernels, _flatten
+from pyfr.backends.openmp.provider import OpenMPKernelProvider
+from pyfr.nputil import npdtype_to_ctypestype
+
+
+class OpenMPTiledKernels(OpenMPCompiledKernels):
+    def __init__(self, backend, kerns, nblk, tblk):
+        argts, args = self._marshal_args([
+            (k.tfun, [npdtype_to_ctypestype(t) for t in k.targtypes], k.cargs)
+            for k in kerns
+        ], [nblk, tblk])
+
+        # Render and build the driver function
+        src = backend.lookup.get_template('tiled').render(
+            kargts=argts, kargs=args, tcols=[k.tcols for k in kerns]
+        )
+        self._fun = backend.pointwise._build_kernel(
+            'tiled', src, [np.int32]*2 + [np.intp]*5
+        )
+
+
+class OpenMPTilingKernels(OpenMPKernelProvider):
+    def __init__(self, backend):
+        super().__init__(backend)
+
+        # Target size, in KiB, of the data touched by each tile
+        self.tilesz = backend.cfg.getint('backend-openmp', 'element-tile-sz',
+                                         512)
+
+    def tiled(self, kerns):
+        kerns = [k for kern in kerns for k in _flatten(kern)]
+
+        # Without a column range variant of every kernel run them in turn
+        if not all(hasattr(k, 'tfun') for k in kerns):
+            return ComputeMetaKernel(kerns)
+
+        # Ensure the kernels span the same number of SoA blocks
+        nblks = {-(-n // w) for n, w in (k.tcols for k in kerns)}
+        if len(nblks) != 1:
+            raise ValueError('Tiled kernels must span the same elements')
+
+        nblk = nblks.pop()
+
+        # Estimate the number of bytes touched per SoA block
+        seen, bsz = set(), 0
+        for k in kerns:
+            for ka in k.cargs:
+                if hasattr(ka, 'ncol') and id(ka) not in seen:
+                    seen.add(id(ka))
+
+                    cols = self._tile_cols(ka)
+                    if cols:
+                        bsz += ka.nrow*cols[1]*ka.itemsize
+
+        # Hence, the number of blocks in each tile
+        tblk = max(1, 1024*self.tilesz // max(bsz, 1))
+
+        ck = OpenMPTiledKernels(self.backend, kerns, nblk, tblk)
+
+        class TiledKernel(ComputeKernel):
+            def run(self, queue, **kwargs):
+                ck(**kwargs)
+
+        return TiledKernel()
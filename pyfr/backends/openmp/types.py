@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+import numpy as np
+
 import pyfr.backends.base as base
 from pyfr.util import lazyprop
 
@@ -20,6 +22,10 @@ class OpenMPMatrixBase(base.MatrixBase):
         # Process any initial value
         if self._initval is not None:
             self._set(self._initval)
+        # Otherwise, so long as our pages are not shared with another
+        # matrix, have them first touched by the threads which use them
+        elif not self.aliases and not self.backend.dryrun:
+            self.backend.par_set(self.nbytes, self, 0)
 
         # Remove
         del self._initval
@@ -28,7 +34,19 @@ class OpenMPMatrixBase(base.MatrixBase):
         return self._unpack(self.data[:, :self.ncol])
 
     def _set(self, ary):
-        self.data[:, :self.ncol] = self._pack(ary)
+        # In a dry run there is no need to respect first touch
+        if self.backend.dryrun:
+            self.data[:, :self.ncol] = self._pack(ary)
+        # Without any padding the threads can copy the data directly
+        elif self.leaddim == self.ncol:
+            buf = self._pack(ary)
+
+            self.backend.par_set(self.nbytes, self, buf.ctypes.data)
+        # Otherwise have the threads zero our pages before filling them in
+        else:
+            self.backend.par_set(self.nbytes, self, 0)
+
+            self.data[:, :self.ncol] = self._pack(ary)
 
 
 class OpenMPMatrix(OpenMPMatrixBase, base.Matrix):
@@ -66,7 +84,15 @@ class OpenMPConstMatrix(OpenMPMatrixBase, base.ConstMatrix):
 
 
 class OpenMPXchgMatrix(OpenMPMatrix, base.XchgMatrix):
-    pass
+    @lazyprop
+    def hdata(self):
+        # Reduced precision data is sent from a separate buffer
+        if self.wprec:
+            dtype = {'single': np.float32, 'bfloat16': np.uint16}[self.wprec]
+
+            return np.empty((self.nrow, self.ncol), dtype=dtype)
+        else:
+            return self.data
 
 
 class OpenMPXchgView(base.XchgView):
@@ -78,6 +104,16 @@ class OpenMPView(base.View):
 
 
 class OpenMPQueue(base.Queue):
+    def __init__(self, backend):
+        super().__init__(backend)
+
+        # Have any MPI requests progressed in the background
+        if backend.mpi_progress:
+            self.mpi_reqs = backend.mpi_progress.requests()
+
+        # Active shared memory exchanges
+        self.shm_reqs = []
+
     def _exec_nonblock(self):
         while self._items:
             kern = self._items[0][0]
@@ -92,8 +128,19 @@ class OpenMPQueue(base.Queue):
         if self._last_ktype == 'mpi':
             from mpi4py import MPI
 
-            MPI.Prequest.Waitall(self.mpi_reqs)
-            self.mpi_reqs = []
+            if self.backend.mpi_progress:
+                self.backend.mpi_progress.waitall(self.mpi_reqs)
+            else:
+                MPI.Prequest.Waitall(self.mpi_reqs)
+
+            self.mpi_reqs.clear()
+
+            # Complete our receives before waiting on our sends, as our
+            # neighbours may themselves be waiting to receive from us
+            for chan in sorted(self.shm_reqs, key=lambda c: c.send):
+                chan.wait()
+
+            self.shm_reqs.clear()
 
         self._last_ktype = None
 
@@ -118,4 +165,4 @@ class OpenMPQueue(base.Queue):
 
         # Wait for all tasks to complete
         for q in queues:
-            q._wait()
+            q._sync()
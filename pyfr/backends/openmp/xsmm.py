@@ -167,6 +167,9 @@ class OpenMPXSMMKernels(OpenMPKernelProvider):
         par_xsmm = self._build_kernel('par_xsmm', src, argt)
 
         class MulKernel(ComputeKernel):
+            cfun = par_xsmm
+            cargs = [exec_ptr, blockk_ptr, cleank_ptr, n, nblock, b, out]
+
             def run(iself, queue):
                 par_xsmm(exec_ptr, blockk_ptr, cleank_ptr, n, nblock, b, out)
 
@@ -124,6 +124,9 @@ class Inifile(object):
     def sections(self):
         return self._cp.sections()
 
+    def remove_section(self, section):
+        self._cp.remove_section(section)
+
     def rename_section(self, sfrom, sto):
         items = self._cp.items(sfrom)
 
@@ -149,8 +149,12 @@ class BaseCommon(object):
 
         # Generate an kernel for each element type
         kerns = proxylist([])
-        for tr in transregs:
-            kerns.append(self.backend.kernel(name, *tr[:nargs], **kwargs))
+        for etype, tr in zip(self.system.ele_types, transregs):
+            kern = self.backend.kernel(name, *tr[:nargs], **kwargs)
+            kerns.append(kern)
+
+            # Name the kernel for the purposes of profiling
+            self.backend.kernel_names[kern] = ('intg', name, etype)
 
         return kerns
 
@@ -168,6 +172,23 @@ class BaseCommon(object):
         # Sum to get the global number over all partitions
         return comm.allreduce(ndofs, op=get_mpi('sum'))
 
+    def pregen_kernels(self):
+        subdims = getattr(self, '_subdims', None)
+
+        # Generate axnpby kernels for all possible numbers of registers
+        for n in range(1, self.nregs + 1):
+            self._get_axnpby_kerns(n)
+
+            if subdims:
+                self._get_axnpby_kerns(n, subdims=subdims)
+
+        # Along with any error estimation kernels
+        if hasattr(self, '_get_errest_kerns'):
+            self._get_errest_kerns()
+
+        if hasattr(self, '_get_adderrest_kerns'):
+            self._get_adderrest_kerns()
+
     @memoize
     def _get_axnpby_kerns(self, n, subdims=None):
         return self._get_kernels('axnpby', nargs=n, subdims=subdims)
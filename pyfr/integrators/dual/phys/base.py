@@ -47,6 +47,9 @@ class BaseDualIntegrator(BaseIntegrator):
 
         return self._curr_soln
 
+    def pregen_kernels(self):
+        self.pseudointegrator.pregen_kernels()
+
     def call_plugin_dt(self, dt):
         rem = math.fmod(dt, self._dt)
         tol = 5.0*self.dtmin
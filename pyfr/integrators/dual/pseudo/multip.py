@@ -92,7 +92,12 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
                 def ntotiters(iself):
                     return self.npmgcycles
 
-                def convmon(iself, *args, **kwargs):
+                def convmon(iself, i, minniters, errbank=None):
+                    # Within a cycle only estimate the local error
+                    if errbank is not None:
+                        iself.localerrest(errbank)
+
+                def _resid_discard(iself):
                     pass
 
                 def finalise_pseudo_advance(iself, *args, **kwargs):
@@ -124,8 +129,9 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
         # Get the highest p system from plugins
         self.system = self.pintgs[self._order].system
 
-        # Get the convergence monitoring method
+        # Get the convergence monitoring methods
         self.mg_convmon = cc.convmon
+        self.mg_resid_discard = cc._resid_discard
 
         # Initialise the restriction and prolongation matrices
         self._init_proj_mats()
@@ -179,6 +185,19 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
                 self.projmats[l, l + 1].append(cmat(b1.proj_to(b2)))
                 self.projmats[l + 1, l].append(cmat(b2.proj_to(b1)))
 
+    def pregen_kernels(self):
+        for pintg in self.pintgs.values():
+            pintg.pregen_kernels()
+
+        # Generate the projection kernels between consecutive levels
+        for l1, l2 in zip(self.cycle, self.cycle[1:]):
+            if l1 != l2:
+                self.mgproject(l1, l2)
+
+                if (l2 < l1 and
+                    self.pintgs[self._order]._pseudo_controller_needs_lerrest):
+                    self.dtauproject(l1, l2)
+
     @memoize
     def mgproject(self, l1, l2):
         inbanks = self.pintgs[l1].system.eles_scal_upts_inb
@@ -312,6 +331,9 @@ class DualMultiPIntegrator(BaseDualPseudoIntegrator):
             if self.mg_convmon(self.pintg, i, self._minniters):
                 break
 
+        # The next pseudo-advance must not see a stale residual
+        self.mg_resid_discard(self.pintg)
+
         # Update the dual-time stepping banks
         self.finalise_mg_advance(self.pintg._idxcurr)
 
@@ -14,11 +14,20 @@ class BaseDualPseudoController(BaseDualPseudoIntegrator):
         # Stats on the most recent step
         self.pseudostepinfo = []
 
+        # If to lag the convergence check by an iteration so as to
+        # overlap the reduction of the residual with the next iteration
+        sect = 'solver-time-integrator'
+        self._async_reduce = self.cfg.getbool(sect, 'async-reductions',
+                                              False)
+
+        # Residual reduction in progress, if any
+        self._resid_pending = None
+
     @memoize
     def _get_errest_kerns(self):
         return self._get_kernels('errest', nargs=3, norm=self._pseudo_norm)
 
-    def _resid(self, dtau, x):
+    def _resid_start(self, dtau, x):
         comm, rank, root = get_comm_rank_root()
 
         # Get an errest kern to compute the square of the maximum residual
@@ -28,23 +37,58 @@ class BaseDualPseudoController(BaseDualPseudoIntegrator):
         self._prepare_reg_banks(x, x, x)
         self._queue.enqueue_and_run(errest, dtau, 0.0)
 
-        # L2 norm
+        # Reduce locally (element types)
         if self._pseudo_norm == 'l2':
-            # Reduce locally (element types) and globally (MPI ranks)
             res = np.array([sum(ev) for ev in zip(*errest.retval)])
-            comm.Allreduce(get_mpi('in_place'), res, op=get_mpi('sum'))
+            op = get_mpi('sum')
+        else:
+            res = np.array([max(ev) for ev in zip(*errest.retval)])
+            op = get_mpi('max')
+
+        # Reduce globally (MPI ranks), possibly in the background
+        if self._async_reduce:
+            req = comm.Iallreduce(get_mpi('in_place'), res, op=op)
+        else:
+            comm.Allreduce(get_mpi('in_place'), res, op=op)
+            req = None
+
+        return req, res
 
-            # Normalise and return
+    def _resid_finish(self, req, res):
+        # Wait for any background reduction to complete
+        if req:
+            req.Wait()
+
+        # L2 norm
+        if self._pseudo_norm == 'l2':
             return np.sqrt(res / self._gndofs)
         # L^∞ norm
         else:
-            # Reduce locally (element types) and globally (MPI ranks)
-            res = np.array([max(ev) for ev in zip(*errest.retval)])
-            comm.Allreduce(get_mpi('in_place'), res, op=get_mpi('max'))
-
-            # Normalise and return
             return np.sqrt(res)
 
+    def _resid_conv(self, i, dtau, x):
+        # Start reducing the residual of this iteration
+        pending = self._resid_start(dtau, x)
+
+        # When lagging, check the residual of the previous iteration
+        if self._async_reduce:
+            pending, self._resid_pending = self._resid_pending, pending
+
+            if pending is None:
+                self._update_pseudostepinfo(i + 1, None)
+                return False
+
+        resid = tuple(self._resid_finish(*pending))
+
+        self._update_pseudostepinfo(i + 1, resid)
+        return all(r <= t for r, t in zip(resid, self._pseudo_residtol))
+
+    def _resid_discard(self):
+        # Complete and discard any outstanding (lagged) reduction
+        if self._resid_pending:
+            self._resid_finish(*self._resid_pending)
+            self._resid_pending = None
+
     def _update_pseudostepinfo(self, niters, resid):
         self.pseudostepinfo.append((self.ntotiters, niters, resid))
 
@@ -61,11 +105,8 @@ class DualNonePseudoController(BaseDualPseudoController):
             # Subtract the current solution from the previous solution
             self._add(-1.0, self._idxprev, 1.0, self._idxcurr)
 
-            # Compute the normalised residual
-            resid = tuple(self._resid(self._dtau, self._idxprev))
-
-            self._update_pseudostepinfo(i + 1, resid)
-            return all(r <= t for r, t in zip(resid, self._pseudo_residtol))
+            # Compute the normalised residual and check for convergence
+            return self._resid_conv(i, self._dtau, self._idxprev)
         else:
             self._update_pseudostepinfo(i + 1, None)
             return False
@@ -81,6 +122,9 @@ class DualNonePseudoController(BaseDualPseudoController):
             if self.convmon(i, self.minniters):
                 break
 
+        # The next pseudo-advance must not see a stale residual
+        self._resid_discard()
+
         # Update
         self.finalise_pseudo_advance(self._idxcurr)
 
@@ -123,8 +167,13 @@ class DualPIPseudoController(BaseDualPseudoController):
             'pyfr.integrators.dual.pseudo.kernels.localerrest'
         )
 
-        for ele, shape, dtaumat in zip(self.system.ele_map.values(),
-                                       self.system.ele_shapes, self.dtau_upts):
+        # Template arguments for the local dtau kernel
+        dtautplargs = dict(ndims=self.system.ndims, nvars=self.system.nvars)
+
+        for ele, shape, dtaumat, errreg, dtaureg in zip(
+            self.system.ele_map.values(), self.system.ele_shapes,
+            self.dtau_upts, self._regs[0], self._regs[1]
+        ):
             # Allocate storage for previous error
             err_prev = self.backend.matrix(shape, np.ones(shape),
                                            tags={'align'})
@@ -138,30 +187,53 @@ class DualPIPseudoController(BaseDualPseudoController):
                 )
             )
 
+            # When monitoring convergence the updated pseudo time-steps
+            # are immediately used to scale a register; so fuse the two
+            self.pintgkernels['localerrest_localdtau'].append(
+                self.backend.pointwise.fused(
+                    [ele.nupts, ele.neles],
+                    ('localerrest', tplargs,
+                     dict(err=errreg, errprev=err_prev, dtau_upts=dtaumat)),
+                    ('localdtau', dtautplargs,
+                     dict(negdivconf=dtaureg, dtau_upts=dtaumat))
+                )
+            )
+
         self.backend.commit()
 
     @property
     def _pseudo_controller_needs_lerrest(self):
         return True
 
-    def localerrest(self, errbank):
-        self.system.eles_scal_upts_inb.active = errbank
-        self._queue.enqueue_and_run(self.pintgkernels['localerrest'])
+    def localerrest(self, errbank, dtaubank=None):
+        # Estimate the error and update the local pseudo time-steps
+        if dtaubank is None:
+            self.system.eles_scal_upts_inb.active = errbank
+            self._queue.enqueue_and_run(self.pintgkernels['localerrest'])
+        # Along with dividing a bank by these time-steps
+        else:
+            self._prepare_reg_banks(errbank, dtaubank)
+            self._queue.enqueue_and_run(
+                self.pintgkernels['localerrest_localdtau'], inv=1
+            )
 
-    def convmon(self, i, minniters):
+    def convmon(self, i, minniters, errbank=None):
         if i >= minniters - 1:
             # Subtract the current solution from the previous solution
             self._add(-1.0, self._idxprev, 1.0, self._idxcurr)
 
-            # Divide by 1/dtau
-            self.localdtau(self._idxprev, inv=1)
+            # Divide by 1/dtau, updating dtau beforehand if required
+            if errbank is not None:
+                self.localerrest(errbank, self._idxprev)
+            else:
+                self.localdtau(self._idxprev, inv=1)
 
-            # Reduction
-            resid = tuple(self._resid(1.0, self._idxprev))
-
-            self._update_pseudostepinfo(i + 1, resid)
-            return all(r <= t for r, t in zip(resid, self._pseudo_residtol))
+            # Reduction and convergence check
+            return self._resid_conv(i, 1.0, self._idxprev)
         else:
+            if errbank is not None:
+                self.localerrest(errbank)
+
             self._update_pseudostepinfo(i + 1, None)
             return False
 
@@ -171,10 +243,13 @@ class DualPIPseudoController(BaseDualPseudoController):
         for i in range(self.maxniters):
             # Take the step
             self._idxcurr, self._idxprev, self._idxerr = self.step(self.tcurr)
-            self.localerrest(self._idxerr)
 
-            if self.convmon(i, self.minniters):
+            # Estimate the local error and check for convergence
+            if self.convmon(i, self.minniters, self._idxerr):
                 break
 
+        # The next pseudo-advance must not see a stale residual
+        self._resid_discard()
+
         # Update
         self.finalise_pseudo_advance(self._idxcurr)
@@ -100,6 +100,13 @@ class StdPIController(BaseStdController):
         # Estimate of previous error
         self._errprev = 1.0
 
+        # Error estimate computed by the stepper, if any
+        self._errest_pending = None
+
+        # If to overlap the reduction of the error with the next step
+        self._async_reduce = self.cfg.getbool(sect, 'async-reductions',
+                                              False)
+
         # Step size adjustment factors
         self._saffac = self.cfg.getfloat(sect, 'safety-fact', 0.8)
         self._maxfac = self.cfg.getfloat(sect, 'max-fact', 2.5)
@@ -113,34 +120,64 @@ class StdPIController(BaseStdController):
     def _get_errest_kerns(self):
         return self._get_kernels('errest', nargs=3, norm=self._norm)
 
-    def _errest(self, x, y, z):
+    @memoize
+    def _get_adderrest_kerns(self):
+        try:
+            return self._get_kernels('adderrest', nargs=4, norm=self._norm)
+        except KeyError:
+            return None
+
+    def _adderrest(self, x, y, z, w, cx, cy):
+        adderrest = self._get_adderrest_kerns()
+
+        # Update x and y and estimate the squared error in a single pass
+        self._prepare_reg_banks(x, y, z, w)
+        self._queue.enqueue_and_run(adderrest, cx, cy, self._atol,
+                                    self._rtol)
+
+        # Mark the estimate as being available to _errest_start
+        self._errest_pending = adderrest
+
+    def _errest_start(self, x, y, z):
         comm, rank, root = get_comm_rank_root()
 
-        errest = self._get_errest_kerns()
+        # See if the error was estimated alongside the final stage
+        errest, self._errest_pending = self._errest_pending, None
 
-        # Obtain an estimate for the squared error
-        self._prepare_reg_banks(x, y, z)
-        self._queue.enqueue_and_run(errest, self._atol, self._rtol)
+        # If not then obtain an estimate for the squared error
+        if errest is None:
+            errest = self._get_errest_kerns()
 
-        # L2 norm
+            self._prepare_reg_banks(x, y, z)
+            self._queue.enqueue_and_run(errest, self._atol, self._rtol)
+
+        # Reduce locally (element types + field variables)
         if self._norm == 'l2':
-            # Reduce locally (element types + field variables)
             err = np.array([sum(v for e in errest.retval for v in e)])
+            op = get_mpi('sum')
+        else:
+            err = np.array([max(v for e in errest.retval for v in e)])
+            op = get_mpi('max')
+
+        # Reduce globally (MPI ranks), possibly in the background
+        if self._async_reduce:
+            req = comm.Iallreduce(get_mpi('in_place'), err, op=op)
+        else:
+            comm.Allreduce(get_mpi('in_place'), err, op=op)
+            req = None
 
-            # Reduce globally (MPI ranks)
-            comm.Allreduce(get_mpi('in_place'), err, op=get_mpi('sum'))
+        return req, err
 
-            # Normalise
+    def _errest_finish(self, req, err):
+        # Wait for any background reduction to complete
+        if req:
+            req.Wait()
+
+        # L2 norm
+        if self._norm == 'l2':
             err = math.sqrt(float(err) / self._gndofs)
         # L^∞ norm
         else:
-            # Reduce locally (element types + field variables)
-            err = np.array([max(v for e in errest.retval for v in e)])
-
-            # Reduce globally (MPI ranks)
-            comm.Allreduce(get_mpi('in_place'), err, op=get_mpi('max'))
-
-            # Normalise
             err = math.sqrt(float(err))
 
         return err if not math.isnan(err) else 100
@@ -165,8 +202,21 @@ class StdPIController(BaseStdController):
             # Take the step
             idxcurr, idxprev, idxerr = self.step(self.tcurr, dt)
 
-            # Estimate the error
-            err = self._errest(idxerr, idxcurr, idxprev)
+            # Start estimating the error
+            errreq = self._errest_start(idxerr, idxcurr, idxprev)
+
+            # Whilst this is in progress, and so long as the solution
+            # will not be filtered, speculatively evaluate the first
+            # stage of the next step; if the step is rejected then the
+            # stepper will simply discard this evaluation
+            fnsteps = self._fnsteps
+            if self._async_reduce and (not fnsteps or
+                                       (self.nacptsteps + 1) % fnsteps):
+                self._stepper_rhs0(self.tcurr + dt, idxcurr, idxprev,
+                                   idxerr)
+
+            # Finish estimating the error
+            err = self._errest_finish(*errreq)
 
             # Determine time step adjustment factor
             fac = err**-expa * self._errprev**expb
@@ -164,6 +164,9 @@ class StdRKVdH2RStepper(BaseStdStepper):
 
         self._nstages = len(self.c)
 
+        # Pre-evaluated first stage of the next step, if any
+        self._rhs0 = None
+
     @property
     def _stepper_has_errest(self):
         return self._controller_needs_errest and len(self.bhat)
@@ -182,28 +185,46 @@ class StdRKVdH2RStepper(BaseStdStepper):
 
         r1 = self._idxcurr
 
+        # See if the first stage has already been evaluated
+        rhs0, self._rhs0 = self._rhs0, None
+        if rhs0 and rhs0[:2] != (t, r1):
+            rhs0 = None
+
         if errest:
-            r2, rold, rerr = set(self._regidx) - {r1}
+            # A pre-evaluated first stage fixes the register of r2
+            if rhs0:
+                r2 = rhs0[2]
+                rold, rerr = set(self._regidx) - {r1, r2}
+            else:
+                r2, rold, rerr = set(self._regidx) - {r1}
 
             # Save the current solution
             add(0.0, rold, 1.0, r1)
         else:
             r2, = set(self._regidx) - {r1}
 
+        # See if the final stage can be fused with the error estimate
+        fuse = errest and self._nstages > 1 and self._get_adderrest_kerns()
+
         # Evaluate the stages in the scheme
         for i in range(self._nstages):
             # Compute -∇·f
-            rhs(t + self.c[i]*dt, r2 if i > 0 else r1, r2)
+            if i > 0 or not rhs0:
+                rhs(t + self.c[i]*dt, r2 if i > 0 else r1, r2)
 
+            # Final stage; update rerr and r1 while estimating the error
+            if fuse and i == self._nstages - 1:
+                self._adderrest(rerr, r1, rold, r2, self.e[i]*dt,
+                                self.b[i]*dt)
             # Accumulate the error term in rerr
-            if errest:
+            elif errest:
                 add(1.0 if i > 0 else 0.0, rerr, self.e[i]*dt, r2)
 
             # Sum (special-casing the final stage)
             if i < self._nstages - 1:
                 add(1.0, r1, self.a[i]*dt, r2)
                 add((self.b[i] - self.a[i])*dt, r2, 1.0, r1)
-            else:
+            elif not fuse:
                 add(1.0, r1, self.b[i]*dt, r2)
 
             # Swap
@@ -212,6 +233,13 @@ class StdRKVdH2RStepper(BaseStdStepper):
         # Return
         return (r2, rold, rerr) if errest else r2
 
+    def _stepper_rhs0(self, t, r1, *rused):
+        # Evaluate the first stage of a step from r1 into a free register
+        r2, = set(self._regidx) - {r1, *rused}
+        self.system.rhs(t, r1, r2)
+
+        self._rhs0 = (t, r1, r2)
+
 
 class StdRK34Stepper(StdRKVdH2RStepper):
     stepper_name = 'rk34'
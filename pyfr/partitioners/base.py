@@ -203,7 +203,7 @@ class BasePartitioner(object):
             m = re.match(r'con_p(\d+)p\d+', k)
             if m:
                 p = m.group(1)
-                for etype, eidx in v[['f0', 'f1']].tolist():
+                for etype, eidx in v[['f0', 'f1']].astype('U4,i4').tolist():
                     int_offs[etype, p] = max(int_offs[etype, p], eidx + 1)
 
         # Tag the offset of linear elements
@@ -216,6 +216,9 @@ class BasePartitioner(object):
                 mesh[k, 'lin_off'] = midx
                 mesh[k, 'int_off'] = int_offs[m.groups()]
 
+                # Tag the weight of the elements when partitioning
+                mesh[k, 'elewt'] = self.elewts[m.group(1)]
+
     def _partition_spts(self, mesh, vetimap, vparts):
         # Get the shape point arrays from the mesh
         spt_p0 = {}
@@ -11,9 +11,10 @@ from pyfr.mpiutil import get_comm_rank_root
 from pyfr.writers.native import NativeWriter
 
 
-def init_csv(cfg, cfgsect, header, *, filekey='file', headerkey='header'):
-    # Determine the file path
-    fname = cfg.get(cfgsect, filekey)
+def init_csv(cfg, cfgsect, header, *, filekey='file', headerkey='header',
+             fname=None):
+    # Determine the file path, if it has not been given
+    fname = fname or cfg.get(cfgsect, filekey)
 
     # Append the '.csv' extension
     if not fname.endswith('.csv'):
@@ -129,6 +129,7 @@ class FluidForcePlugin(BasePlugin):
 
             # Extract the relevant elements from the solution
             uupts = solns[etype][..., self._eidxs[etype, fidx]]
+            uupts = uupts.astype(intg.backend.accdtype, copy=False)
 
             # Interpolate to the face
             ufpts = m0 @ uupts.reshape(nupts, -1)
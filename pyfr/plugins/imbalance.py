@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+from time import perf_counter
+
+import numpy as np
+
+from pyfr.backends.base import WaitTimer
+from pyfr.mpiutil import get_comm_rank_root
+from pyfr.plugins.base import BasePlugin, init_csv
+
+
+class ImbalancePlugin(BasePlugin):
+    name = 'imbalance'
+    systems = ['*']
+    formulations = ['dual', 'std']
+
+    def __init__(self, intg, cfgsect, suffix):
+        super().__init__(intg, cfgsect, suffix)
+
+        comm, rank, root = get_comm_rank_root()
+
+        # Output frequency
+        self.nsteps = self.cfg.getint(cfgsect, 'nsteps')
+
+        # Number of the slowest ranks to report
+        self.nslowest = self.cfg.getint(cfgsect, 'nslowest', 3)
+
+        # Element counts of each rank along with the weights, if recorded,
+        # that the elements were given when the mesh was partitioned
+        einfo, mesh = {}, intg.system.mesh
+        for etype, shape in zip(intg.system.ele_types,
+                                intg.system.ele_shapes):
+            k = f'spt_{etype}_p{intg.rallocs.prank}', 'elewt'
+            einfo[etype] = (shape[2], mesh[k] if k in mesh else None)
+
+        # Gather these onto the root
+        einfo = comm.gather(einfo, root=root)
+
+        if rank == root:
+            self.etypes = sorted({t for ei in einfo for t in ei})
+            self.neles = np.array([[ei[t][0] if t in ei else 0
+                                    for t in self.etypes] for ei in einfo])
+
+            # Current weights of the elements
+            elewts = {t: w for ei in einfo for t, (n, w) in ei.items()}
+            if None in elewts.values():
+                self.elewts = None
+            else:
+                self.elewts = np.array([elewts[t] for t in self.etypes])
+
+            # Compute times of each rank accumulated over all intervals
+            self.tcomp = np.zeros(comm.size)
+
+            header = ['n', 't', 'imbalance', 'rank', 'compute', 'wait']
+            self.outf = init_csv(self.cfg, cfgsect,
+                                 ','.join(header + self.etypes))
+
+            # File to write the corrected element weights to (if any)
+            self.wtsfname = self.cfg.get(cfgsect, 'weights-file', None)
+        else:
+            self.outf = None
+
+        # Install a timer on the backend to measure our waits
+        self.timer = intg.backend.wait_timer = WaitTimer()
+
+        # Timing starts after the first step so as to exclude any setup
+        self.tstart = None
+
+    def __call__(self, intg):
+        # If this is the first step then start timing
+        if self.tstart is None:
+            self.timer.reset()
+            self.tstart = perf_counter()
+        # Otherwise, see if an output is due this step
+        elif intg.nacptsteps % self.nsteps == 0:
+            comm, rank, root = get_comm_rank_root()
+
+            # Split the wall time since our last output into that spent
+            # waiting on MPI requests and that spent doing everything else
+            twall = perf_counter() - self.tstart
+            twait = self.timer.twait
+
+            times = comm.gather((twall - twait, twait), root=root)
+            if rank == root:
+                self._report(intg, np.array(times))
+
+            # Reset for the next interval
+            self.timer.reset()
+            self.tstart = perf_counter()
+
+    def _report(self, intg, times):
+        tcomp, twait = times.T
+
+        # Ratio of the maximum to the mean compute time
+        imbalance = tcomp.max() / tcomp.mean()
+
+        # Output the slowest ranks along with their element counts
+        for r in np.argsort(-tcomp, kind='stable')[:self.nslowest]:
+            print(intg.nacptsteps, intg.tcurr, imbalance, r, tcomp[r],
+                  twait[r], *self.neles[r], sep=',', file=self.outf)
+
+        # Flush to disk
+        self.outf.flush()
+
+        # Accumulate the compute times
+        self.tcomp += tcomp
+
+        # Write out corrected weights for the partitioner
+        if self.wtsfname:
+            elewts = self._fit_weights(self.tcomp)
+
+            if elewts is not None:
+                wtargs = [f'-e {t}:{w}' for t, w in zip(self.etypes, elewts)]
+
+                with open(self.wtsfname, 'w') as f:
+                    print(*wtargs, file=f)
+
+    def _fit_weights(self, tcomp):
+        neles, elewts = self.neles, self.elewts
+
+        # We require the weights which the mesh was partitioned with and
+        # ranks whose mix of elements allows the types to be distinguished;
+        # with no more ranks than types the fit would also be exact, and so
+        # completely at the mercy of any noise in the timings
+        if (elewts is None or len(neles) <= len(elewts) or
+            np.linalg.matrix_rank(neles) < len(elewts)):
+            return None
+
+        # Find the weights which best predict the compute time of each rank
+        wts = np.maximum(0, np.linalg.lstsq(neles, tcomp, rcond=None)[0])
+
+        # Rescale to be consistent with the current weights
+        ntot = neles.sum(axis=0)
+        wts *= (ntot @ elewts) / (ntot @ wts)
+
+        # The partitioners expect positive integer weights
+        return np.maximum(1, np.rint(wts)).astype(int)
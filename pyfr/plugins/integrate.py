@@ -136,6 +136,9 @@ class IntegratePlugin(BasePlugin):
             # Subset and transpose the solution
             soln = soln[..., eset].swapaxes(0, 1)
 
+            # Evaluate the expressions in the accumulation precision
+            soln = soln.astype(intg.backend.accdtype, copy=False)
+
             # Convert from conservative to primitive variables
             psolns = self.elementscls.con_to_pri(soln, self.cfg)
 
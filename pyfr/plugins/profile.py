@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import h5py
+import numpy as np
+
+from pyfr.backends.base import KernelProfiler
+from pyfr.mpiutil import get_comm_rank_root
+from pyfr.plugins.base import BasePlugin, init_csv
+
+
+class ProfilePlugin(BasePlugin):
+    name = 'profile'
+    systems = ['*']
+    formulations = ['dual', 'std']
+
+    fields = ['provider', 'kernel', 'etype', 'ncalls', 'total', 'p50', 'p90',
+              'p99', 'max', 'nbytes']
+
+    def __init__(self, intg, cfgsect, suffix):
+        super().__init__(intg, cfgsect, suffix)
+
+        comm, rank, root = get_comm_rank_root()
+
+        # Each instance resets the profiler after writing out its samples
+        if intg.backend.profiler is not None:
+            raise RuntimeError('Only one profile plugin may be active')
+
+        # Output frequency
+        self.nsteps = self.cfg.getint(cfgsect, 'nsteps')
+
+        # Each rank writes its own file
+        fname = self.cfg.get(cfgsect, 'file')
+        if comm.size > 1 and '{rank}' not in fname:
+            raise ValueError('Profile file name must contain {rank}')
+
+        fname = fname.format(rank=rank)
+
+        # HDF5 output
+        if fname.endswith(('.h5', '.hdf5')):
+            self.fname, self.outf = fname, None
+        # CSV output
+        else:
+            header = ','.join(['n', 't'] + self.fields)
+            self.outf = init_csv(self.cfg, cfgsect, header, fname=fname)
+
+        # Install a profiler on the backend
+        sync = self.cfg.getbool(cfgsect, 'synchronise', False)
+        self.profiler = intg.backend.profiler = KernelProfiler(intg.backend,
+                                                               sync)
+
+    def __call__(self, intg):
+        # If an output is due this step
+        if intg.nacptsteps % self.nsteps == 0 and intg.nacptsteps:
+            stats = self.profiler.stats()
+
+            if self.outf:
+                for s in stats:
+                    print(intg.nacptsteps, intg.tcurr, *s, sep=',',
+                          file=self.outf)
+
+                # Flush to disk
+                self.outf.flush()
+            elif stats:
+                self._write_hdf5(intg, stats)
+
+            # Reset the profiler for the next interval
+            self.profiler.reset()
+
+    def _write_hdf5(self, intg, stats):
+        # Size the string fields to fit the longest name
+        cols = list(zip(*stats))
+        slens = [max(len(c) for c in col) or 1 for col in cols[:3]]
+
+        dtype = [(f, f'S{n}') for f, n in zip(self.fields, slens)]
+        dtype += [('ncalls', np.int64)]
+        dtype += [(f, np.float64) for f in self.fields[4:-1]]
+        dtype += [('nbytes', np.int64)]
+
+        with h5py.File(self.fname, 'a') as f:
+            name = f'profile-{intg.nacptsteps}'
+
+            # Replace any statistics from a previous run
+            if name in f:
+                del f[name]
+
+            dset = f.create_dataset(name, data=np.array(stats, dtype=dtype))
+            dset.attrs['t'] = intg.tcurr
@@ -40,7 +40,8 @@ class ResidualPlugin(BasePlugin):
             curr = intg.soln
 
             # Square of the residual vector for each variable
-            resid = sum(np.linalg.norm(p - c, axis=(0, 2))**2
+            resid = sum(np.sum((p - c).astype(intg.backend.accdtype)**2,
+                               axis=(0, 2))
                         for p, c in zip(prev, curr))
 
             # Reduce and, if we are the root rank, output
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 
 from collections import defaultdict
+import glob
+import os
 import random
 import re
 
+import numpy as np
+
 from pyfr.mpiutil import get_comm_rank_root
 from pyfr.util import subclass_where
 
@@ -91,3 +95,174 @@ class RandomRankAllocator(BaseRankAllocator):
 
     def _get_mprankmap(self, prankconn, rinfo):
         return random.sample(range(len(rinfo)), len(rinfo))
+
+
+class TopologyRankAllocator(BaseRankAllocator):
+    name = 'topology'
+
+    def _get_mesh_connectivity(self, mesh):
+        prankconn = super()._get_mesh_connectivity(mesh)
+
+        # Weight each partition pair by the data they exchange each time
+        # the right hand side is evaluated
+        self._pbytes = {(lhs, rhs): self._get_xchg_bytes(mesh, lhs, rhs)
+                        for lhs, rhss in enumerate(prankconn)
+                        for rhs in rhss}
+
+        return prankconn
+
+    def _get_xchg_bytes(self, mesh, lhs, rhs):
+        from pyfr.shapes import BaseShape
+        from pyfr.solvers import BaseSystem
+        from pyfr.solvers.baseadvecdiff import BaseAdvectionDiffusionSystem
+
+        cfg = self.cfg
+        order = cfg.getint('solver', 'order')
+        prec = cfg.get('backend', 'precision', 'double')
+
+        # Count the flux points on each kind of face in the interface
+        faces, counts = np.unique(mesh[f'con_p{lhs}p{rhs}'][['f0', 'f2']],
+                                  return_counts=True)
+
+        nfpts = 0
+        for (etype, fidx), n in zip(faces.tolist(), counts):
+            shapecls = subclass_where(BaseShape, name=etype.decode())
+            kind = shapecls.faces[fidx][0]
+
+            nfpts += n*shapecls.npts_for_face[kind](order)
+
+        # Dimensionality of the mesh
+        etype = faces[0][0].decode()
+        ndims = mesh[f'spt_{etype}_p{lhs}'].shape[-1]
+
+        systemcls = subclass_where(BaseSystem,
+                                   name=cfg.get('solver', 'system'))
+        nvars = len(systemcls.elementscls.convarmap[ndims])
+
+        # Fields, and their number of values per flux point, which are sent
+        fields = [('scal', nvars)]
+
+        # Advection-diffusion systems also exchange gradients, although
+        # with β = ±1/2 only in one direction; this is decided in the same
+        # way as for the MPI interfaces themselves
+        if issubclass(systemcls, BaseAdvectionDiffusionSystem):
+            beta = cfg.getfloat('solver-interfaces', 'ldg-beta')
+            if (lhs + rhs) % 2:
+                beta *= 1.0 if lhs > rhs else -1.0
+            else:
+                beta *= 1.0 if rhs > lhs else -1.0
+
+            if beta != -0.5:
+                fields.append(('vect', ndims*nvars))
+
+                sc = cfg.get('solver', 'shock-capturing', 'none')
+                if sc == 'artificial-viscosity':
+                    fields.append(('artvisc', 1))
+
+        # Bytes sent per value in each wire precision
+        wsizes = {'native': 8 if prec == 'double' else 4, 'single': 4,
+                  'bfloat16': 2}
+
+        nbytes = 0
+        for f, n in fields:
+            wprec = cfg.get('backend', f'mpi-wire-{f}', 'native')
+            nbytes += nfpts*n*wsizes[wprec]
+
+        return nbytes
+
+    def _get_rank_info(self):
+        from mpi4py import MPI
+
+        # Identify the NUMA node or socket we are bound to, if any
+        try:
+            cpus = os.sched_getaffinity(0)
+        except AttributeError:
+            cpus = []
+
+        domains = {self._get_cpu_domain(c) for c in cpus}
+        domain = domains.pop() if len(domains) == 1 else None
+
+        return MPI.Get_processor_name(), domain
+
+    @staticmethod
+    def _get_cpu_domain(cpu):
+        path = f'/sys/devices/system/cpu/cpu{cpu}'
+
+        # Prefer the NUMA node of the CPU
+        for node in glob.glob(f'{path}/node[0-9]*'):
+            return int(node.rsplit('node', 1)[1])
+
+        # Otherwise fall back to its socket
+        try:
+            with open(f'{path}/topology/physical_package_id') as f:
+                return int(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _get_mprankmap(self, prankconn, rinfo):
+        nparts = len(prankconn)
+
+        # Partition graph weighted by the bytes exchanged
+        wts = [defaultdict(int) for i in range(nparts)]
+        for (lhs, rhs), n in self._pbytes.items():
+            wts[lhs][rhs] = n
+
+        # Group the MPI ranks by node and then by domain
+        nodes = defaultdict(lambda: defaultdict(list))
+        for mrank, (host, domain) in enumerate(rinfo):
+            nodes[host][domain].append(mrank)
+
+        # Map partitions first onto nodes and then onto their domains
+        mprankmap = [None]*nparts
+        unplaced = set(range(nparts))
+        for domains in nodes.values():
+            nranks = sum(len(mranks) for mranks in domains.values())
+            nodeparts = self._grow_group(wts, unplaced, nranks)
+
+            for mranks in domains.values():
+                dparts = self._grow_group(wts, nodeparts, len(mranks))
+
+                for mrank, prank in zip(mranks, sorted(dparts)):
+                    mprankmap[mrank] = prank
+
+        # Report the quality of the placement
+        self._report(wts, rinfo, mprankmap)
+
+        return mprankmap
+
+    def _grow_group(self, wts, parts, n):
+        group, conn = set(), defaultdict(int)
+
+        while len(group) < n:
+            # Seed the group with the most heavily communicating partition
+            # or, once seeded, grow it by that which is most connected to it
+            p = max(parts, key=lambda p: (conn[p], sum(wts[p].values()), -p))
+
+            group.add(p)
+            parts.remove(p)
+
+            for q, w in wts[p].items():
+                conn[q] += w
+
+        return group
+
+    def _report(self, wts, rinfo, mprankmap):
+        def xchg_bytes(mprankmap):
+            pinfo = {p: rinfo[m] for m, p in enumerate(mprankmap)}
+            nnode = ndomain = 0
+
+            for p, pwts in enumerate(wts):
+                for q, w in pwts.items():
+                    if pinfo[p][0] != pinfo[q][0]:
+                        nnode += w
+                    elif pinfo[p] != pinfo[q]:
+                        ndomain += w
+
+            return nnode, ndomain
+
+        tnode, tdomain = xchg_bytes(mprankmap)
+        lnode, ldomain = xchg_bytes(range(len(rinfo)))
+
+        print(f'Rank allocation: {tnode} bytes per right hand side sent '
+              f'between nodes and {tdomain} between NUMA domains (linear: '
+              f'{lnode} and {ldomain})')
@@ -9,10 +9,25 @@ from pyfr.nputil import npeval, fuzzysort
 from pyfr.util import lazyprop, memoize
 
 
+class _ScratchBuf(object):
+    # Stands in for a scratch buffer until its lifetime is known
+    def __init__(self, name):
+        self.name = name
+
+    def slice(self, *args, **kwargs):
+        return self
+
+
 class BaseElements(object):
     privarmap = None
     convarmap = None
 
+    # Scratch buffers which are accessed by interfaces
+    _inter_bufs = {'scal_fpts', 'scal_fqpts', 'vect_fpts'}
+
+    # Chains of element-local kernels which can be run tile by tile
+    _tiled_chains = {}
+
     def __init__(self, basiscls, eles, cfg):
         self._be = None
 
@@ -49,6 +64,10 @@ class BaseElements(object):
         self.nfacefpts = basis.nfacefpts
         self.nmpts = basis.nmpts
 
+        # Offset of the first element not adjacent to an MPI interface;
+        # when set some kernels are split at this point
+        self.int_off = None
+
     def pri_to_con(pris, cfg):
         pass
 
@@ -135,58 +154,149 @@ class BaseElements(object):
 
     def set_backend(self, backend, nscalupts, nonce):
         self._be = backend
+        self._nonce = nonce
 
-        # Sizes
-        ndims, nvars, neles = self.ndims, self.nvars, self.neles
-        nfpts, nupts, nqpts = self.nfpts, self.nupts, self.nqpts
-        sbufs, abufs = self._scratch_bufs, []
-
-        # Convenience functions for scalar/vector allocation
-        alloc = lambda ex, n: abufs.append(
-            backend.matrix(n, extent=nonce + ex, tags={'align'})
-        ) or abufs[-1]
-        salloc = lambda ex, n: alloc(ex, (n, nvars, neles))
-        valloc = lambda ex, n: alloc(ex, (ndims, n, nvars, neles))
-
-        # Allocate required scalar scratch space
-        if 'scal_fpts' in sbufs and 'scal_qpts' in sbufs:
-            self._scal_fqpts = salloc('_scal_fqpts', nfpts + nqpts)
-            self._scal_fpts = self._scal_fqpts.slice(0, nfpts)
-            self._scal_qpts = self._scal_fqpts.slice(nfpts, nfpts + nqpts)
-        elif 'scal_fpts' in sbufs:
-            self._scal_fpts = salloc('scal_fpts', nfpts)
-        elif 'scal_qpts' in sbufs:
-            self._scal_qpts = salloc('scal_qpts', nqpts)
-
-        # Allocate additional scalar scratch space
-        if 'scal_upts_cpy' in sbufs:
-            self._scal_upts_cpy = salloc('scal_upts_cpy', nupts)
-
-        # Allocate required vector scratch space
-        if 'vect_upts' in sbufs:
-            self._vect_upts = valloc('vect_upts', nupts)
-        if 'vect_qpts' in sbufs:
-            self._vect_qpts = valloc('vect_qpts', nqpts)
-        if 'vect_fpts' in sbufs:
-            self._vect_fpts = valloc('vect_fpts', nfpts)
+        # Scratch space is allocated once its lifetime is known
+        for b in self._scratch_bufs:
+            setattr(self, f'_{b}', _ScratchBuf(b))
+
+        if 'scal_fqpts' in self._scratch_bufs:
+            self._scal_fpts = self._scal_qpts = self._scal_fqpts
 
         # Allocate and bank the storage required by the time integrator
         self._scal_upts = [backend.matrix(self._scal_upts.shape,
                                           self._scal_upts, tags={'align'})
                            for i in range(nscalupts)]
-        self.scal_upts_inb = inb = backend.matrix_bank(self._scal_upts)
+        self.scal_upts_inb = backend.matrix_bank(self._scal_upts)
         self.scal_upts_outb = backend.matrix_bank(self._scal_upts)
 
+        # Kernels which run chains of element-local kernels tile by tile
+        if backend.element_tiling:
+            for kn, chain in self._tiled_chains.items():
+                self.kernels[kn] = self._tiled_kernel(chain)
+
+    def _split_kernels(self, kname, kfunc):
+        kernels = self.kernels
+
+        # Kernel over all of the elements
+        kernels[kname] = lambda: kfunc(lambda m: m)
+
+        # See if the elements are being split
+        if self.int_off is None:
+            return
+
+        # Kernels which are run tile by tile are not split
+        if self._be.element_tiling:
+            if any(kname in c for c in self._tiled_chains.values()):
+                return
+
+        # Round the split up to a whole number of SoA blocks
+        k = self._be.soasz
+        nbnd = self.int_off - self.int_off % -k
+
+        # Kernels over the boundary and interior elements
+        if nbnd == 0:
+            kernels[f'{kname}_int'] = kernels[kname]
+        elif nbnd >= self.neles:
+            kernels[f'{kname}_bnd'] = kernels[kname]
+        else:
+            c = self.nvars*nbnd
+
+            kernels[f'{kname}_bnd'] = lambda: kfunc(lambda m: m.slice(cb=c))
+            kernels[f'{kname}_int'] = lambda: kfunc(lambda m: m.slice(ca=c))
+
+    def _tiled_kernel(self, chain):
+        def tiled():
+            # Skip over any kernels which are not in use
+            kerns = [self.kernels[kn]() for kn in chain if kn in self.kernels]
+
+            return self._be.kernel('tiled', kerns)
+
+        return tiled
+
+    def alloc_scratch(self, knames):
+        backend, nonce = self._be, self._nonce
+
+        # Sizes
+        ndims, nvars, neles = self.ndims, self.nvars, self.neles
+        nfpts, nupts, nqpts = self.nfpts, self.nupts, self.nqpts
+
+        # Number of points in each kind of scratch buffer
+        npts = dict(fpts=nfpts, qpts=nqpts, fqpts=nfpts + (nqpts or 0),
+                    upts=nupts, upts_cpy=nupts)
+
+        # Shapes of the scalar and vector scratch buffers
+        shapes = {b: ((npts[b[5:]], nvars, neles) if b.startswith('scal')
+                      else (ndims, npts[b[5:]], nvars, neles))
+                  for b in self._scratch_bufs}
+
+        # Determine when each buffer is live during the RHS evaluation
+        live = self._scratch_lifetimes(knames)
+
+        # Greedily assign buffers with disjoint lifetimes to extents
+        extents = []
+        for b in sorted(live, key=lambda b: (live[b], b)):
+            for ex in extents:
+                if all(live[b][0] > live[c][1] for c in ex):
+                    ex.append(b)
+                    break
+            else:
+                extents.append([b])
+
+        abufs = []
+        for ex in extents:
+            ex.sort(key=lambda b: (-np.prod(shapes[b]), b))
+
+            # Allocate the largest buffer
+            m = backend.matrix(shapes[ex[0]], extent=nonce + ex[0],
+                               tags={'align'})
+            setattr(self, f'_{ex[0]}', m)
+            abufs.append(m)
+
+            # Have the remaining buffers alias it
+            for b in ex[1:]:
+                am = backend.matrix(shapes[b], aliases=m, tags={'align'})
+                setattr(self, f'_{b}', am)
+
+        # Flux and quadrature point slices of the combined buffer
+        if 'scal_fqpts' in live:
+            self._scal_fpts = self._scal_fqpts.slice(0, nfpts)
+            self._scal_qpts = self._scal_fqpts.slice(nfpts, nfpts + nqpts)
+
         # Find/allocate space for a solution-sized scalar that is
         # allowed to alias other scratch space in the simulation
+        inb = self.scal_upts_inb
         aliases = next((m for m in abufs if m.nbytes >= inb.nbytes), None)
         self._scal_upts_temp = backend.matrix(inb.ioshape, aliases=aliases,
                                               tags=inb.tags)
 
+    def _scratch_lifetimes(self, knames):
+        sbufs, nk = self._scratch_bufs, len(knames)
+
+        # Buffers accessed by interfaces are live throughout
+        live = {b: (0, nk) for b in sbufs & self._inter_bufs}
+
+        # Trace the scratch buffers accessed by each of our kernels
+        for i, kn in enumerate(knames):
+            if kn in self.kernels:
+                with self._be.trace() as kargs:
+                    self.kernels[kn]()
+
+                for arg in kargs:
+                    if isinstance(arg, _ScratchBuf):
+                        lo, hi = live.get(arg.name, (i, i))
+                        live[arg.name] = (min(lo, i), max(hi, i))
+
+        # Buffers which are not used by the RHS are live throughout
+        for b in sbufs - live.keys():
+            live[b] = (0, nk)
+
+        return live
+
     @memoize
     def opmat(self, expr):
         return self._be.const_matrix(self.basis.opmat(expr),
-                                     tags={expr, 'align'})
+                                     tags={expr, 'align', self.basis.name})
 
     @memoize
     def smat_at_np(self, name):
@@ -79,13 +79,23 @@ class BaseInters(object):
     def _vect_view(self, inter, meth):
         return self._view(inter, meth, (self.ndims, self.nvars))
 
-    def _xchg_view(self, inter, meth, vshape=tuple()):
+    def _xchg_view(self, inter, meth, vshape=tuple(), tags=set()):
         vm = _get_inter_objs(inter, meth, self.elemap)
         vm = [np.concatenate(m)[self._perm] for m in zip(*vm)]
-        return self._be.xchg_view(*vm, vshape=vshape)
+        return self._be.xchg_view(*vm, vshape=vshape, tags=tags)
 
-    def _scal_xchg_view(self, inter, meth):
-        return self._xchg_view(inter, meth, (self.nvars,))
+    def _scal_xchg_view(self, inter, meth, tags=set()):
+        return self._xchg_view(inter, meth, (self.nvars,), tags)
 
-    def _vect_xchg_view(self, inter, meth):
-        return self._xchg_view(inter, meth, (self.ndims, self.nvars))
+    def _vect_xchg_view(self, inter, meth, tags=set()):
+        return self._xchg_view(inter, meth, (self.ndims, self.nvars), tags)
+
+    def _xchg_tags(self, field):
+        wprec = self.cfg.get('backend', f'mpi-wire-{field}', 'native')
+
+        if wprec == 'native':
+            return set()
+        elif wprec not in self._be.wire_precs:
+            raise ValueError(f'Invalid wire precision for {field}: {wprec}')
+        else:
+            return {f'wire-{wprec}'}
@@ -4,11 +4,35 @@ from collections import defaultdict
 import itertools as it
 import re
 
+from pyfr.backends.base import NullMPIKernel
 from pyfr.inifile import Inifile
+from pyfr.mpiutil import get_comm_rank_root
 from pyfr.shapes import BaseShape
 from pyfr.util import proxylist, subclasses
 
 
+class _TraceQueue(object):
+    def __init__(self, log):
+        self._log = log
+
+    def enqueue(self, items, *args, **kwargs):
+        self._log.extend(items)
+
+
+class _TraceKernels(dict):
+    def __init__(self, eknames):
+        self._eknames = eknames
+
+        # MPI exchanges which take place together
+        self.xchg_phases = []
+
+    def __contains__(self, key):
+        return key[0] != 'eles' or key[1] in self._eknames
+
+    def __missing__(self, key):
+        return [key]
+
+
 class BaseSystem(object):
     elementscls = None
     intinterscls = None
@@ -29,6 +53,24 @@ class BaseSystem(object):
         # Obtain a nonce to uniquely identify this system
         nonce = str(next(self._nonce_seq))
 
+        # How to exchange data at MPI interfaces
+        self._mpi_xchg = cfg.get('backend', 'mpi-exchange', 'point-to-point')
+        if self._mpi_xchg not in {'point-to-point', 'neighbourhood'}:
+            raise ValueError('MPI exchange must be either point-to-point or '
+                             'neighbourhood')
+
+        # If to aggregate exchanges with the same neighbour into one message
+        self._mpi_agg = cfg.getbool('backend', 'mpi-aggregate', False)
+
+        # Shared memory through which to exchange with ranks on our node
+        self._mpi_shm = backend.mpi_shm
+        if self._mpi_shm and self._mpi_xchg == 'neighbourhood':
+            raise ValueError('Shared memory MPI exchanges require '
+                             'point-to-point exchanges')
+
+        # If to split elements adjacent to MPI interfaces from the interior
+        self._split_eles = cfg.getbool('backend', 'split-elements', False)
+
         # Load the elements
         eles, elemap = self._load_eles(rallocs, mesh, initsoln, nregs, nonce)
         backend.commit()
@@ -59,9 +101,20 @@ class BaseSystem(object):
         bc_inters = self._load_bc_inters(rallocs, mesh, elemap)
         backend.commit()
 
+        # Execution plans
+        self._plans = {}
+
+        # Determine which MPI exchanges are to be combined
+        self._mpi_cxchgs = self._combined_xchgs(mpi_inters)
+        self._mpi_xkeys = {xn: '+'.join(cx)
+                           for cx in self._mpi_cxchgs for xn in cx}
+
         # Prepare the queues and kernels
         self._gen_queues()
+        self._gen_shm_xchgs(rallocs, mpi_inters)
         self._gen_kernels(eles, int_inters, mpi_inters, bc_inters)
+        self._gen_cxchg_kernels(rallocs, mpi_inters)
+
         backend.commit()
 
         # Save the BC interfaces, but delete the memory-intensive elemap
@@ -81,6 +134,11 @@ class BaseSystem(object):
 
                 elemap[t] = self.elementscls(basismap[t], mesh[f], self.cfg)
 
+        # Elements adjacent to MPI interfaces should be numbered first
+        if self._split_eles:
+            for t, off in self._mpi_int_offs(rallocs, mesh, elemap).items():
+                elemap[t].int_off = off
+
         # Construct a proxylist to simplify collective operations
         eles = proxylist(elemap.values())
 
@@ -109,8 +167,31 @@ class BaseSystem(object):
         for etype, ele in elemap.items():
             ele.set_backend(self.backend, nregs, nonce)
 
+        # Allocate their scratch space based on the order of our kernels
+        knames = self._rhs_ele_kernels(eles)
+        for ele in eles:
+            ele.alloc_scratch(knames)
+
         return eles, elemap
 
+    def _rhs_ele_kernels(self, eles):
+        eknames = set(it.chain.from_iterable(e.kernels for e in eles))
+
+        # Record the sequence of kernels enqueued by the RHS
+        log = []
+        self._queues = [_TraceQueue(log) for i in range(self._nqueues)]
+        self._kernels = _TraceKernels(eknames)
+
+        with self.backend.trace():
+            self._rhs(0.0)
+
+        # Also note the exchanges which the RHS performs together
+        self._mpi_xchg_phases = self._kernels.xchg_phases
+
+        del self._queues, self._kernels
+
+        return [kn for pn, kn in log if pn == 'eles']
+
     def _load_int_inters(self, rallocs, mesh, elemap):
         key = f'con_p{rallocs.prank}'
 
@@ -122,6 +203,21 @@ class BaseSystem(object):
         # we wrap it in a proxylist for consistency
         return proxylist([int_inters])
 
+    def _mpi_int_offs(self, rallocs, mesh, elemap):
+        lhsprank = rallocs.prank
+
+        # Rather than trusting the offset stored in the mesh, derive it
+        # from the elements which are actually on an MPI interface
+        int_offs = dict.fromkeys(elemap, 0)
+        for rhsprank in rallocs.prankconn[lhsprank]:
+            interarr = mesh[f'con_p{lhsprank}p{rhsprank}']
+            interarr = interarr[['f0', 'f1']].astype('U4,i4').tolist()
+
+            for etype, eidx in interarr:
+                int_offs[etype] = max(int_offs[etype], eidx + 1)
+
+        return int_offs
+
     def _load_mpi_inters(self, rallocs, mesh, elemap):
         lhsprank = rallocs.prank
 
@@ -171,12 +267,173 @@ class BaseSystem(object):
         provnames = ['eles', 'iint', 'mpiint', 'bcint']
         provobjs = [eles, iint, mpiint, bcint]
 
+        # Sends and receives which are superseded by combined exchanges
+        xsup = {f'{xn}_{sr}' for xn in self._mpi_xkeys
+                for sr in ['send', 'recv']}
+
         for pn, pobj in zip(provnames, provobjs):
-            for kn, kgetter in it.chain(*pobj.kernels.items()):
-                if not kn.startswith('_'):
-                    kernels[pn, kn].append(kgetter())
+            for p in pobj:
+                # Element type (if any) of the kernels
+                etype = p.basis.name if pn == 'eles' else ''
+
+                for kn, kgetter in p.kernels.items():
+                    if pn == 'mpiint' and kn in xsup:
+                        continue
+
+                    if not kn.startswith('_'):
+                        kern = kgetter()
+                        kernels[pn, kn].append(kern)
+
+                        # Name the kernel for the purposes of profiling
+                        self.backend.kernel_names[kern] = (pn, kn, etype)
+
+    def _combined_xchgs(self, mpiint):
+        comm, rank, root = get_comm_rank_root()
+
+        # Exchanges at our interfaces; for collectives all ranks must agree
+        xnames = {xn for m in mpiint for xn in m.mpi_xchgs}
+        if self._mpi_xchg == 'neighbourhood':
+            xnames = set().union(*comm.allgather(xnames))
+
+        cxchgs = []
+        for xphase in self._mpi_xchg_phases:
+            xphase = [xn for xn in xphase if xn in xnames]
+
+            # Aggregate the exchanges of a phase into single messages
+            if self._mpi_agg and len(xphase) > 1:
+                cxchgs.append(xphase)
+            # Otherwise replace each exchange by its own collective or,
+            # so some may go through shared memory, its own exchange
+            elif self._mpi_xchg == 'neighbourhood' or self._mpi_shm:
+                cxchgs.extend([xn] for xn in xphase)
+
+        return cxchgs
+
+    def _cxchg_mvs(self, cx, mpiint):
+        # Matrices sent to and received from each neighbour
+        smvs = [[m.mpi_xchgs[xn][0] for xn in cx
+                 if m.mpi_xchgs[xn][0] is not None] for m in mpiint]
+        rmvs = [[m.mpi_xchgs[xn][1] for xn in cx
+                 if m.mpi_xchgs[xn][1] is not None] for m in mpiint]
+
+        return smvs, rmvs
+
+    def _gen_shm_xchgs(self, rallocs, mpiint):
+        shm = self._mpi_shm
+        if not shm:
+            return
+
+        # MPI ranks of our neighbours in the order of our interfaces
+        prank = rallocs.prank
+        nbrs = [rallocs.pmrankmap[p] for p in rallocs.prankconn[prank]]
+
+        # Matrices we send to each neighbour on our node
+        smvs = {}
+        for cx in self._mpi_cxchgs:
+            xk = self._mpi_xkeys[cx[0]]
+
+            for mvs, nbr in zip(self._cxchg_mvs(cx, mpiint)[0], nbrs):
+                if mvs and shm.is_local(nbr):
+                    smvs[nbr, xk] = mvs
+
+        # Allocate these in a window shared with the ranks on our node;
+        # this must be done before any kernels which pack into them
+        self._shm_win = shm.window(smvs)
+
+    def _gen_cxchg_kernels(self, rallocs, mpiint):
+        comm, rank, root = get_comm_rank_root()
+        kernels, kernel_names = self._kernels, self.backend.kernel_names
+
+        # MPI ranks of our neighbours in the order of our interfaces
+        prank = rallocs.prank
+        nbrs = [rallocs.pmrankmap[p] for p in rallocs.prankconn[prank]]
+
+        # Create a graph communicator connecting us to our neighbours
+        if self._mpi_xchg == 'neighbourhood':
+            gcomm = comm.Create_dist_graph_adjacent(nbrs, nbrs, reorder=False)
+
+        for cx in self._mpi_cxchgs:
+            xk = self._mpi_xkeys[cx[0]]
+
+            # Matrices sent to and received from each neighbour
+            smvs, rmvs = self._cxchg_mvs(cx, mpiint)
+
+            # Exchange with all of our neighbours in a single collective
+            if self._mpi_xchg == 'neighbourhood':
+                kern = self.backend.kernel('sendrecv_packs', gcomm, smvs,
+                                           rmvs)
+                kernels['mpiint', f'{xk}_send'] = [kern]
+
+                # Name the kernel for the purposes of profiling
+                kernel_names[kern] = ('mpiint', f'{xk}_sendrecv', '')
+            # Or send and receive a single message to/from each neighbour
+            else:
+                tag = self.mpiinterscls.MPI_TAG
+
+                for sr, nmvs in [('send', smvs), ('recv', rmvs)]:
+                    for mvs, nbr in zip(nmvs, nbrs):
+                        if not mvs:
+                            kern = NullMPIKernel()
+                        # Neighbours on our node read our buffers directly
+                        elif self._mpi_shm and self._mpi_shm.is_local(nbr):
+                            if sr == 'send':
+                                chan = self._shm_win.sender(nbr, xk)
+                            else:
+                                chan = self._shm_win.receiver(nbr, xk, mvs)
+
+                            kern = self.backend.kernel(f'shm_{sr}_packs',
+                                                       chan)
+                        else:
+                            kern = self.backend.kernel(f'{sr}_packs', mvs,
+                                                       nbr, tag)
+
+                        kernels['mpiint', f'{xk}_{sr}'].append(kern)
+
+                        # Name the kernel for the purposes of profiling
+                        kernel_names[kern] = ('mpiint', f'{xk}_{sr}', '')
+
+    def _enqueue_mpi_xchgs(self, queue, xnames):
+        kernels = self._kernels
+
+        # When tracing record the exchanges which take place together
+        if isinstance(kernels, _TraceKernels):
+            kernels.xchg_phases.append(xnames)
+            xkeys = xnames
+        # Otherwise, send and receive combined exchanges as one
+        else:
+            xkeys = list(dict.fromkeys(self._mpi_xkeys.get(xn, xn)
+                                       for xn in xnames))
+
+        # Start all of the sends and receives before unpacking
+        for xk in xkeys:
+            queue.enqueue(kernels['mpiint', f'{xk}_send'])
+        for xk in xkeys:
+            queue.enqueue(kernels['mpiint', f'{xk}_recv'])
+        for xn in xnames:
+            queue.enqueue(kernels['mpiint', f'{xn}_unpack'])
+
+    def _run_plan(self, name, fn, **kwargs):
+        # Plans bypass the queues and so can not be profiled
+        if self.backend.profiler is not None:
+            fn(**kwargs)
+        # See if we have already recorded a plan for this function
+        elif name in self._plans:
+            self._plans[name](**kwargs)
+        # Otherwise, run it whilst (potentially) recording a plan
+        else:
+            plan = self.backend.plan(self._queues, fn, **kwargs)
+            if plan:
+                self._plans[name] = plan
 
     def rhs(self, t, uinbank, foutbank):
+        self._bc_inters.prepare(t)
+
+        self.eles_scal_upts_inb.active = uinbank
+        self.eles_scal_upts_outb.active = foutbank
+
+        self._run_plan('rhs', self._rhs, t=t)
+
+    def _rhs(self, t):
         pass
 
     def filt(self, uinoutbank):
@@ -5,10 +5,12 @@ from pyfr.solvers.base import BaseElements
 
 
 class BaseAdvectionElements(BaseElements):
+    _tiled_chains = {'tiled_tdivtpcorf': ['tdisf', 'tdivtpcorf']}
+
     @property
     def _scratch_bufs(self):
         if 'flux' in self.antialias:
-            bufs = {'scal_fpts', 'scal_qpts', 'vect_qpts'}
+            bufs = {'scal_fqpts', 'vect_qpts'}
         else:
             bufs = {'scal_fpts', 'vect_upts'}
 
@@ -43,15 +45,15 @@ class BaseAdvectionElements(BaseElements):
 
         # Interpolation from elemental points
         if fluxaa:
-            kernels['disu'] = lambda: self._be.kernel(
-                'mul', self.opmat('M8'), self.scal_upts_inb,
-                out=self._scal_fqpts
-            )
+            self._split_kernels('disu', lambda cs: self._be.kernel(
+                'mul', self.opmat('M8'), cs(self.scal_upts_inb),
+                out=cs(self._scal_fqpts)
+            ))
         else:
-            kernels['disu'] = lambda: self._be.kernel(
-                'mul', self.opmat('M0'), self.scal_upts_inb,
-                out=self._scal_fpts
-            )
+            self._split_kernels('disu', lambda cs: self._be.kernel(
+                'mul', self.opmat('M0'), cs(self.scal_upts_inb),
+                out=cs(self._scal_fpts)
+            ))
 
         # First flux correction kernel
         if fluxaa:
@@ -73,7 +75,6 @@ class BaseAdvectionElements(BaseElements):
 
         # Transformed to physical divergence kernel + source term
         plocupts = self.ploc_at('upts') if plocsrc else None
-        solnupts = self._scal_upts_cpy if solnsrc else None
 
         if solnsrc:
             kernels['copy_soln'] = lambda: self._be.kernel(
@@ -83,7 +84,8 @@ class BaseAdvectionElements(BaseElements):
         kernels['negdivconf'] = lambda: self._be.kernel(
             'negdivconf', tplargs=srctplargs,
             dims=[self.nupts, self.neles], tdivtconf=self.scal_upts_outb,
-            rcpdjac=self.rcpdjac_at('upts'), ploc=plocupts, u=solnupts
+            rcpdjac=self.rcpdjac_at('upts'), ploc=plocupts,
+            u=self._scal_upts_cpy if solnsrc else None
         )
 
         # In-place solution filter
@@ -42,12 +42,17 @@ class BaseAdvectionMPIInters(BaseInters):
         const_mat = self._const_mat
 
         # Generate the left hand view matrix and its dual
-        self._scal_lhs = self._scal_xchg_view(lhs, 'get_scal_fpts_for_inter')
-        self._scal_rhs = be.xchg_matrix_for_view(self._scal_lhs)
+        stags = self._xchg_tags('scal')
+        self._scal_lhs = self._scal_xchg_view(lhs, 'get_scal_fpts_for_inter',
+                                              stags)
+        self._scal_rhs = be.xchg_matrix_for_view(self._scal_lhs, stags)
 
         self._mag_pnorm_lhs = const_mat(lhs, 'get_mag_pnorms_for_inter')
         self._norm_pnorm_lhs = const_mat(lhs, 'get_norm_pnorms_for_inter')
 
+        # Matrices sent to and received from the RHS in each exchange
+        self.mpi_xchgs = {'scal_fpts': (self._scal_lhs, self._scal_rhs)}
+
         # Kernels
         self.kernels['scal_fpts_pack'] = lambda: be.kernel(
             'pack', self._scal_lhs
@@ -83,7 +88,7 @@ class BaseAdvectionBCInters(BaseInters):
         self._norm_pnorm_lhs = const_mat(lhs, 'get_norm_pnorms_for_inter')
 
         # Make the simulation time available inside kernels
-        self._set_external('t', 'scalar fpdtype_t')
+        self._set_external('t', 'scalar accdtype_t')
 
     def _eval_opts(self, opts, default=None):
         # Boundary conditions, much like initial conditions, can be
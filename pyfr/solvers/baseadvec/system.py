@@ -6,30 +6,35 @@ from pyfr.solvers.base import BaseSystem
 class BaseAdvectionSystem(BaseSystem):
     _nqueues = 2
 
-    def rhs(self, t, uinbank, foutbank):
+    def _rhs(self, t):
         runall = self.backend.runall
         q1, q2 = self._queues
         kernels = self._kernels
 
-        self._bc_inters.prepare(t)
-
-        self.eles_scal_upts_inb.active = uinbank
-        self.eles_scal_upts_outb.active = foutbank
-
-        q1.enqueue(kernels['eles', 'disu'])
+        # Interpolate the boundary elements and pack before the interior
+        if self._split_eles:
+            q1.enqueue(kernels['eles', 'disu_bnd'])
+        else:
+            q1.enqueue(kernels['eles', 'disu'])
         q1.enqueue(kernels['mpiint', 'scal_fpts_pack'])
         runall([q1])
 
         if ('eles', 'copy_soln') in kernels:
             q1.enqueue(kernels['eles', 'copy_soln'])
-        q1.enqueue(kernels['eles', 'tdisf'])
-        q1.enqueue(kernels['eles', 'tdivtpcorf'])
+        if self._split_eles:
+            q1.enqueue(kernels['eles', 'disu_int'])
+
+        # Run the element-local kernels tile by tile if possible
+        if ('eles', 'tiled_tdivtpcorf') in kernels:
+            q1.enqueue(kernels['eles', 'tiled_tdivtpcorf'])
+        else:
+            q1.enqueue(kernels['eles', 'tdisf'])
+            q1.enqueue(kernels['eles', 'tdivtpcorf'])
+
         q1.enqueue(kernels['iint', 'comm_flux'])
         q1.enqueue(kernels['bcint', 'comm_flux'], t=t)
 
-        q2.enqueue(kernels['mpiint', 'scal_fpts_send'])
-        q2.enqueue(kernels['mpiint', 'scal_fpts_recv'])
-        q2.enqueue(kernels['mpiint', 'scal_fpts_unpack'])
+        self._enqueue_mpi_xchgs(q2, ['scal_fpts'])
 
         runall([q1, q2])
 
@@ -5,6 +5,12 @@ from pyfr.solvers.baseadvec import BaseAdvectionElements
 
 
 class BaseAdvectionDiffusionElements(BaseAdvectionElements):
+    _tiled_chains = {
+        'tiled_gradcoru': ['tgradcoru_upts', 'gradcoru_upts', 'gradcoru_fpts'],
+        'tiled_tdivtpcorf': ['gradcoru_qpts', 'disu_qpts', 'tdisf',
+                             'tdivtpcorf']
+    }
+
     @property
     def _scratch_bufs(self):
         bufs = {'scal_fpts', 'vect_fpts', 'vect_upts'}
@@ -28,6 +34,18 @@ class BaseAdvectionDiffusionElements(BaseAdvectionElements):
             'pyfr.solvers.baseadvecdiff.kernels.gradcoru'
         )
 
+        # With flux anti-aliasing interpolate to the quadrature points
+        # separately so that they can share storage with the gradients
+        if 'flux' in self.antialias:
+            self._split_kernels('disu', lambda cs: kernel(
+                'mul', self.opmat('M0'), cs(self.scal_upts_inb),
+                out=cs(self._scal_fpts)
+            ))
+            kernels['disu_qpts'] = lambda: kernel(
+                'mul', self.opmat('M7'), self.scal_upts_inb,
+                out=self._scal_qpts
+            )
+
         kernels['_copy_fpts'] = lambda: kernel(
             'copy', self._vect_fpts.slice(0, self.nfpts), self._scal_fpts
         )
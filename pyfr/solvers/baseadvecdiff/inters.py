@@ -44,8 +44,10 @@ class BaseAdvectionDiffusionMPIInters(BaseAdvectionMPIInters):
         rhsprank = rallocs.mprankmap[rhsrank]
 
         # Generate second set of view matrices
-        self._vect_lhs = self._vect_xchg_view(lhs, 'get_vect_fpts_for_inter')
-        self._vect_rhs = be.xchg_matrix_for_view(self._vect_lhs)
+        vtags = self._xchg_tags('vect')
+        self._vect_lhs = self._vect_xchg_view(lhs, 'get_vect_fpts_for_inter',
+                                              vtags)
+        self._vect_rhs = be.xchg_matrix_for_view(self._vect_lhs, vtags)
 
         # Additional kernel constants
         self.c.update(cfg.items_as('solver-interfaces', float))
@@ -90,11 +92,19 @@ class BaseAdvectionDiffusionMPIInters(BaseAdvectionMPIInters):
             self.kernels['vect_fpts_recv'] = null_mpi_kern
             self.kernels['vect_fpts_unpack'] = null_comp_kern
 
+        self.mpi_xchgs['vect_fpts'] = (
+            self._vect_lhs if self.c['ldg-beta'] != -0.5 else None,
+            self._vect_rhs if self.c['ldg-beta'] != 0.5 else None
+        )
+
         # Generate the additional kernels/views for artificial viscosity
         if cfg.get('solver', 'shock-capturing') == 'artificial-viscosity':
+            atags = self._xchg_tags('artvisc')
             self._artvisc_lhs = self._xchg_view(lhs,
-                                                'get_artvisc_fpts_for_inter')
-            self._artvisc_rhs = be.xchg_matrix_for_view(self._artvisc_lhs)
+                                                'get_artvisc_fpts_for_inter',
+                                                tags=atags)
+            self._artvisc_rhs = be.xchg_matrix_for_view(self._artvisc_lhs,
+                                                        atags)
 
             # If we need to send our artificial viscosity to the RHS
             if self.c['ldg-beta'] != -0.5:
@@ -121,6 +131,11 @@ class BaseAdvectionDiffusionMPIInters(BaseAdvectionMPIInters):
             else:
                 self.kernels['artvisc_fpts_recv'] = null_mpi_kern
                 self.kernels['artvisc_fpts_unpack'] = null_comp_kern
+
+            self.mpi_xchgs['artvisc_fpts'] = (
+                self._artvisc_lhs if self.c['ldg-beta'] != -0.5 else None,
+                self._artvisc_rhs if self.c['ldg-beta'] != 0.5 else None
+            )
         else:
             self._artvisc_lhs = self._artvisc_rhs = None
 
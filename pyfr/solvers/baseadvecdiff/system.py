@@ -4,20 +4,21 @@ from pyfr.solvers.baseadvec import BaseAdvectionSystem
 
 
 class BaseAdvectionDiffusionSystem(BaseAdvectionSystem):
-    def rhs(self, t, uinbank, foutbank):
+    def _rhs(self, t):
         runall = self.backend.runall
         q1, q2 = self._queues
         kernels = self._kernels
 
-        self._bc_inters.prepare(t)
-
-        self.eles_scal_upts_inb.active = uinbank
-        self.eles_scal_upts_outb.active = foutbank
-
-        q1.enqueue(kernels['eles', 'disu'])
+        # Interpolate the boundary elements and pack before the interior
+        if self._split_eles:
+            q1.enqueue(kernels['eles', 'disu_bnd'])
+        else:
+            q1.enqueue(kernels['eles', 'disu'])
         q1.enqueue(kernels['mpiint', 'scal_fpts_pack'])
         runall([q1])
 
+        if self._split_eles:
+            q1.enqueue(kernels['eles', 'disu_int'])
         if ('eles', 'copy_soln') in kernels:
             q1.enqueue(kernels['eles', 'copy_soln'])
         if ('iint', 'copy_fpts') in kernels:
@@ -28,34 +29,38 @@ class BaseAdvectionDiffusionSystem(BaseAdvectionSystem):
             q1.enqueue(kernels['eles', 'shocksensor'])
             q1.enqueue(kernels['mpiint', 'artvisc_fpts_pack'])
         q1.enqueue(kernels['eles', 'tgradpcoru_upts'])
-        q2.enqueue(kernels['mpiint', 'scal_fpts_send'])
-        q2.enqueue(kernels['mpiint', 'scal_fpts_recv'])
-        q2.enqueue(kernels['mpiint', 'scal_fpts_unpack'])
+        self._enqueue_mpi_xchgs(q2, ['scal_fpts'])
 
         runall([q1, q2])
 
         q1.enqueue(kernels['mpiint', 'con_u'])
-        q1.enqueue(kernels['eles', 'tgradcoru_upts'])
-        q1.enqueue(kernels['eles', 'gradcoru_upts'])
-        q1.enqueue(kernels['eles', 'gradcoru_fpts'])
+        if ('eles', 'tiled_gradcoru') in kernels:
+            q1.enqueue(kernels['eles', 'tiled_gradcoru'])
+        else:
+            q1.enqueue(kernels['eles', 'tgradcoru_upts'])
+            q1.enqueue(kernels['eles', 'gradcoru_upts'])
+            q1.enqueue(kernels['eles', 'gradcoru_fpts'])
         q1.enqueue(kernels['mpiint', 'vect_fpts_pack'])
-        if ('eles', 'shockvar') in kernels:
-            q2.enqueue(kernels['mpiint', 'artvisc_fpts_send'])
-            q2.enqueue(kernels['mpiint', 'artvisc_fpts_recv'])
-            q2.enqueue(kernels['mpiint', 'artvisc_fpts_unpack'])
 
-        runall([q1, q2])
+        runall([q1])
 
-        if ('eles', 'gradcoru_qpts') in kernels:
-            q1.enqueue(kernels['eles', 'gradcoru_qpts'])
-        q1.enqueue(kernels['eles', 'tdisf'])
-        q1.enqueue(kernels['eles', 'tdivtpcorf'])
+        if ('eles', 'tiled_tdivtpcorf') in kernels:
+            q1.enqueue(kernels['eles', 'tiled_tdivtpcorf'])
+        else:
+            if ('eles', 'gradcoru_qpts') in kernels:
+                q1.enqueue(kernels['eles', 'gradcoru_qpts'])
+            if ('eles', 'disu_qpts') in kernels:
+                q1.enqueue(kernels['eles', 'disu_qpts'])
+            q1.enqueue(kernels['eles', 'tdisf'])
+            q1.enqueue(kernels['eles', 'tdivtpcorf'])
         q1.enqueue(kernels['iint', 'comm_flux'])
         q1.enqueue(kernels['bcint', 'comm_flux'], t=t)
 
-        q2.enqueue(kernels['mpiint', 'vect_fpts_send'])
-        q2.enqueue(kernels['mpiint', 'vect_fpts_recv'])
-        q2.enqueue(kernels['mpiint', 'vect_fpts_unpack'])
+        # Exchange the gradients along with any artificial viscosity
+        if ('eles', 'shocksensor') in kernels:
+            self._enqueue_mpi_xchgs(q2, ['vect_fpts', 'artvisc_fpts'])
+        else:
+            self._enqueue_mpi_xchgs(q2, ['vect_fpts'])
 
         runall([q1, q2])
 
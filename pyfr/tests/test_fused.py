@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+
+from pyfr.backends import get_backend
+from pyfr.inifile import Inifile
+
+
+def test_fused_localerrest_localdtau():
+    cfg = Inifile()
+    cfg.set('backend', 'precision', 'double')
+
+    be = get_backend('openmp', cfg)
+    rng = np.random.default_rng(0)
+
+    be.pointwise.register('pyfr.integrators.dual.pseudo.kernels.localerrest')
+    be.pointwise.register('pyfr.integrators.dual.pseudo.kernels.localdtau')
+
+    etplargs = dict(nvars=4, atol=1e-4, expa=0.2, expb=0.1, maxf=1.01,
+                    minf=0.98, saff=0.8, dtau_min=1e-3, dtau_max=3e-3)
+    dtplargs = dict(ndims=2, nvars=4)
+
+    # Points, variables, and elements
+    nupts, neles = 9, 37
+    shape = (nupts, 4, neles)
+
+    init = {
+        'err': rng.uniform(-1e-4, 1e-4, size=shape),
+        'errprev': rng.uniform(0.5, 1.5, size=shape),
+        'dtau': rng.uniform(1e-3, 3e-3, size=shape),
+        'u': rng.uniform(-1, 1, size=shape)
+    }
+
+    # Two sets of matrices; one for each of the fused and unfused chains
+    mats = [{k: be.matrix(shape, v, tags={'align'}) for k, v in init.items()}
+            for i in range(2)]
+
+    dims = [nupts, neles]
+    eargs = [dict(err=m['err'], errprev=m['errprev'], dtau_upts=m['dtau'])
+             for m in mats]
+    dargs = [dict(negdivconf=m['u'], dtau_upts=m['dtau']) for m in mats]
+
+    ukerns = [be.kernel('localerrest', tplargs=etplargs, dims=dims,
+                        **eargs[0]),
+              be.kernel('localdtau', tplargs=dtplargs, dims=dims,
+                        **dargs[0])]
+    fkern = be.pointwise.fused(dims, ('localerrest', etplargs, eargs[1]),
+                               ('localdtau', dtplargs, dargs[1]))
+    be.commit()
+
+    queue = be.queue()
+    for k in ukerns:
+        k.run(queue, inv=1)
+
+    fkern.run(queue, inv=1)
+
+    # The dtau values must have been updated before being divided by
+    assert not np.array_equal(mats[0]['dtau'].get(), init['dtau'])
+
+    for k in init:
+        assert np.array_equal(mats[0][k].get(), mats[1][k].get())
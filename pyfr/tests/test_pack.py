@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from pyfr.backends import get_backend
+from pyfr.inifile import Inifile
+
+
+def _pack(be, mat, rmap, cmap, rstridemap, vshape, runs):
+    matmap = np.full(len(rmap), mat.mid)
+    xv = be.xchg_view(matmap, rmap, cmap, rstridemap, vshape)
+
+    # Optionally force the view to be packed point by point
+    if not runs:
+        xv.view.runs = None
+
+    return xv
+
+
+@pytest.mark.parametrize('vshape', [(3,), (2, 3)])
+@pytest.mark.parametrize('order', ['runs', 'blocks', 'shuffled'])
+def test_pack_runs(vshape, order):
+    cfg = Inifile()
+    cfg.set('backend', 'precision', 'double')
+
+    be = get_backend('openmp', cfg)
+    rng = np.random.default_rng(len(vshape))
+
+    # Matrix of points, variables, and elements; as for the gradients
+    # there are two rows of points for each dimension
+    nupts, neles = 4, 37
+    nvrow, nvcol = vshape if len(vshape) == 2 else (1, vshape[0])
+    initval = rng.uniform(-1, 1, size=(nvrow*nupts, nvcol, neles))
+    mat = be.matrix(initval.shape, initval, tags={'align'})
+
+    # Points of the view
+    rmap = np.repeat(np.arange(nupts), neles)
+    cmap = np.tile(np.arange(neles), nupts)
+
+    # Reorder the points to break up the runs
+    if order == 'blocks':
+        perm = np.arange(len(rmap)).reshape(-1, be.soasz // 2)[::-1]
+        perm = perm.ravel()
+    elif order == 'shuffled':
+        perm = rng.permutation(len(rmap))
+    else:
+        perm = np.arange(len(rmap))
+
+    rmap, cmap = rmap[perm], cmap[perm]
+    rstridemap = np.full(len(rmap), nupts) if nvrow > 1 else None
+
+    xvr = _pack(be, mat, rmap, cmap, rstridemap, vshape, runs=True)
+    xvi = _pack(be, mat, rmap, cmap, rstridemap, vshape, runs=False)
+    be.commit()
+
+    # Only the views with long runs should be packed as such
+    assert (xvr.view.runs is None) == (order == 'shuffled')
+
+    # Expected packing of the view
+    ref = initval[rmap[None] + nupts*np.arange(nvrow)[:, None], :, cmap]
+    ref = ref.swapaxes(1, 2).reshape(nvrow, -1)
+
+    queue = be.queue()
+    for xv in [xvr, xvi]:
+        be.kernel('pack', xv).run(queue)
+
+        assert np.array_equal(xv.xchgmat.get(), ref)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pytest
+
+from pyfr.backends import get_backend
+from pyfr.backends.openmp.sumfact import OpenMPSumFactKernels
+from pyfr.inifile import Inifile
+from pyfr.shapes import HexShape, QuadShape
+
+
+@pytest.mark.parametrize('expr', ['M0', 'M4', 'M6', 'M4 - M6*M0'])
+@pytest.mark.parametrize('shapecls', [HexShape, QuadShape])
+@pytest.mark.parametrize('order', range(5))
+def test_sumfact_mul(expr, shapecls, order):
+    cfg = Inifile()
+    cfg.set('backend', 'precision', 'double')
+    cfg.set('backend-openmp', 'sumfact-min-order', '0')
+    cfg.set('solver', 'order', str(order))
+    cfg.set('solver-interfaces-line', 'flux-pts', 'gauss-legendre')
+    cfg.set('solver-interfaces-quad', 'flux-pts', 'gauss-legendre')
+    cfg.set(f'solver-elements-{shapecls.name}', 'soln-pts',
+            'gauss-legendre')
+
+    be = get_backend('openmp', cfg)
+    rng = np.random.default_rng(order)
+
+    # Operator, tagged as by the elements
+    mat = shapecls(None, cfg).opmat(expr)
+    a = be.const_matrix(mat, tags={expr, 'align', shapecls.name})
+
+    # Apply it to a number of elements which is not a multiple of the tile
+    bval = rng.uniform(-1, 1, size=(mat.shape[1], 37))
+    b = be.matrix(bval.shape, bval, tags={'align'})
+    out = be.matrix((mat.shape[0], 37), tags={'align'})
+    be.commit()
+
+    kern = OpenMPSumFactKernels(be).mul(a, b, out)
+    kern.run(be.queue())
+
+    assert np.allclose(out.get(), mat @ bval, rtol=0, atol=1e-12)